@@ -0,0 +1,238 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+CompactPlayer Module provides a memory-efficient, `__slots__` based alternative to the Player
+object for applications that keep very large rosters in memory.
+"""
+
+# Built-in/Generic Imports
+from operator import attrgetter
+from uuid import UUID, uuid4
+
+# Import Player functionality
+from .LevelingSystem import LevelingSystem
+from .Inventory import Inventory
+from .Player import Player, _STRING_FIELDS, _INTEGER_FIELDS
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+class CompactPlayer(object):
+    """
+    Memory-efficient Player object for large rosters.
+
+    Accepts the same arguments as `Player` and behaves the same way: every field is validated
+    with the same rules and error messages, unspecified ability scores are rolled with 4d6
+    drop the lowest, and experience, leveling, inventory and serialization methods are shared
+    with `Player`. Fields are stored in `__slots__` instead of an instance dictionary, and
+    their validating properties are generated once, when the module is imported, from
+    `_STRING_FIELDS` and `_INTEGER_FIELDS`. The Inventory is only created the first time
+    it is used, since most characters in a large roster never carry anything.
+
+    Unlike `Player`, new attributes cannot be added to a CompactPlayer.
+
+    Example:
+        roster = [CompactPlayer(name=f"Goblin {i}", level=2) for i in range(100000)]
+        hero = CompactPlayer.from_player(Player(name="Bob", alignment="CG")).to_player()
+    """
+
+    __slots__ = (
+        ("uid", "_experience", "_alignment", "leveling_system", "_inventory", "_inventory_size")
+        + tuple("_" + field for field, _ in _STRING_FIELDS)
+        + tuple("_" + field for field, *_ in _INTEGER_FIELDS)
+    )
+
+    # Class Attributes
+    VALID_ALIGNMENTS = Player.VALID_ALIGNMENTS
+
+    def __init__(
+        self,
+        name:               str = None,
+        age:                str = None,
+        gender:             str = None,
+        alignment:          str = None,
+        description:        str = None,
+        biography:          str = None,
+        level:              int = 1,
+        wealth:             int = 0,
+        strength:           int = None,
+        dexterity:          int = None,
+        constitution:       int = None,
+        wisdom:             int = None,
+        intelligence:       int = None,
+        charisma:           int = None,
+        hp:                 int = 1,
+        mp:                 int = 0,
+        inventory_size:     int = 10,
+        uid:                UUID = None):
+        self.uid = uid if uid is not None else uuid4()
+        self.name = name
+        self.age = age
+        self.gender = gender
+        self.description = description
+        self.biography = biography
+        self.alignment = alignment
+        self.level = level
+        self._experience = 0
+        self.leveling_system = LevelingSystem(self)
+        self.leveling_system.getCurrentExperience()
+
+        # Handles setting experience for non-level 1 characters
+        if level != 1:
+            self._experience = self.leveling_system.getThresholdForCurrentLevel()
+
+        self.wealth = wealth
+        self.strength = strength
+        self.dexterity = dexterity
+        self.constitution = constitution
+        self.wisdom = wisdom
+        self.intelligence = intelligence
+        self.charisma = charisma
+        self.hp = hp
+        self.mp = mp
+        self.skillpoints = 0
+        self.featpoints = 0
+        self._inventory = None
+        self._inventory_size = inventory_size
+
+    # Inventory Property
+    @property
+    def inventory(self):
+        if self._inventory is None:
+            self._inventory = Inventory(max_size=self._inventory_size)
+        return self._inventory
+
+    @inventory.setter
+    def inventory(self, value):
+        self._inventory = value
+
+    # Alignment Property
+    @property
+    def alignment(self):
+        return self._alignment
+
+    @alignment.setter
+    def alignment(self, value):
+        if value is not None:
+            value = value.upper() # Normalize value
+            value = Player._validate_string(value, "Alignment")
+            if len(value) != 2 or value not in Player.VALID_ALIGNMENTS:
+                raise ValueError("Alignment must be a valid two-letter code(e.g., LE, NG, CG)")
+        self._alignment = value
+
+    # Shared with Player
+    experience = Player.experience
+    nextLvlExperience = Player.nextLvlExperience
+    add_item_to_inventory = Player.add_item_to_inventory
+    remove_item_from_inventory = Player.remove_item_from_inventory
+    get_inventory = Player.get_inventory
+    get_inventory_max_size = Player.get_inventory_max_size
+    giveExp = Player.giveExp
+    removeExp = Player.removeExp
+    LeveledUp = Player.LeveledUp
+    LeveledDown = Player.LeveledDown
+    levelUp = Player.levelUp
+    levelDown = Player.levelDown
+    serialize_to_json = Player.serialize_to_json
+    to_dict = Player.to_dict
+    from_dict = classmethod(Player.from_dict.__func__)
+    get_modifier = Player.get_modifier
+
+    # Conversion
+    @classmethod
+    def from_player(cls, player: Player) -> 'CompactPlayer':
+        """
+        Copies a Player, including its uid, experience and inventory, into a CompactPlayer.
+
+        Args:
+            player (Player): The player to copy.
+
+        Returns:
+            CompactPlayer: The compact copy.
+        """
+        compact = cls.__new__(cls)
+        _copy_player(player, compact)
+        if not player.inventory.items:
+            compact._inventory = None
+        compact._inventory_size = player.inventory.max_size
+        return compact
+
+    def to_player(self) -> Player:
+        """
+        Copies this CompactPlayer, including its uid, experience and inventory, into a Player.
+
+        Returns:
+            Player: The full Player object.
+        """
+        player = Player.__new__(Player)
+        _copy_player(self, player)
+        return player
+
+    def __repr__(self):
+        return f"<CompactPlayer: {self.name} (level {self.level})>"
+
+def _copy_player(source, target) -> None:
+    """Copies every Player field from `source` into the uninitialized `target`."""
+    target.uid = source.uid
+    for field, _ in _STRING_FIELDS:
+        setattr(target, field, getattr(source, field))
+    target.alignment = source.alignment
+    for field, *_ in _INTEGER_FIELDS:
+        setattr(target, field, getattr(source, field))
+    target._experience = source._experience
+    target.leveling_system = LevelingSystem(target)
+    target.inventory = Inventory(max_size=source.inventory.max_size)
+    target.inventory.items = list(source.inventory.items)
+
+def _string_setter(slot: str, label: str):
+    """Builds a setter that validates a string field and stores it in `slot`."""
+    def setter(self, value):
+        if value is not None and not isinstance(value, str):
+            raise ValueError(f"{label} must be a string")
+        setattr(self, slot, value)
+    return setter
+
+def _integer_setter(slot: str, label: str, minimum: int, message: str, default):
+    """Builds a setter that validates an integer field and stores it in `slot`."""
+    if callable(default):
+        def setter(self, value):
+            if value is not None:
+                if not isinstance(value, int):
+                    raise ValueError(f"{label} must be an integer")
+                if value < minimum:
+                    raise ValueError(message)
+                setattr(self, slot, value)
+            else:
+                setattr(self, slot, default())
+    else:
+        def setter(self, value):
+            if value is not None:
+                if not isinstance(value, int):
+                    raise ValueError(f"{label} must be an integer")
+                if value < minimum:
+                    raise ValueError(message)
+                setattr(self, slot, value)
+            else:
+                setattr(self, slot, default)
+    return setter
+
+def _build_fields(cls) -> None:
+    """Generates the validating property for every field, reading straight from its slot."""
+    for field, label in _STRING_FIELDS:
+        slot = "_" + field
+        setattr(cls, field, property(attrgetter(slot), _string_setter(slot, label)))
+    for field, label, minimum, message, default in _INTEGER_FIELDS:
+        slot = "_" + field
+        setattr(cls, field, property(attrgetter(slot), _integer_setter(slot, label, minimum, message, default)))
+
+_build_fields(CompactPlayer)
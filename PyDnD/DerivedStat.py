@@ -0,0 +1,127 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+DerivedStat Module provides cached statistics derived from other attributes, such as
+ability modifiers, that are recalculated only after an attribute they depend on changes.
+"""
+
+# Built-in/Generic Imports
+from typing import Callable, Dict, Set
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+class DerivedStat(object):
+    """
+    A statistic calculated from other attributes, cached on the instance until one of them changes.
+
+    The first read calculates the value and stores it in the instance dictionary under the
+    stat's name, so every later read is a plain attribute lookup. `install_derived_stats`
+    wraps the setters of the attributes listed in `depends_on` so that setting one of them
+    removes the cached values that depend on it, directly or through other derived stats.
+
+    Use the `derived_stat` decorator rather than creating these directly.
+
+    Args:
+        function (Callable): Calculates the value from the instance.
+        depends_on (tuple): Names of the attributes or other derived stats the value is calculated from.
+    """
+
+    def __init__(self, function: Callable, depends_on: tuple):
+        self.function = function
+        self.depends_on = depends_on
+        self.name = function.__name__
+        self.__doc__ = function.__doc__
+
+    def __set_name__(self, owner, name):
+        self.name = name
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        value = instance.__dict__[self.name] = self.function(instance)
+        return value
+
+    def __repr__(self):
+        return f"<DerivedStat: {self.name} (depends on {', '.join(self.depends_on)})>"
+
+def derived_stat(*depends_on: str):
+    """
+    Declares a method as a cached, derived statistic.
+
+    Args:
+        *depends_on (str): The attributes (with validating setters) or other derived stats
+            the statistic is calculated from.
+
+    Example:
+        class Fighter(Player):
+            @derived_stat("strength_modifier", "proficiency_bonus")
+            def attack_bonus(self):
+                return self.strength_modifier + self.proficiency_bonus
+    """
+    if not depends_on:
+        raise ValueError("A derived stat must depend on at least one attribute.")
+    def decorator(function):
+        return DerivedStat(function, depends_on)
+    return decorator
+
+def install_derived_stats(cls) -> None:
+    """
+    Wraps the setters of `cls` so that they invalidate the derived stats that depend on them.
+
+    Called once for every class that defines derived stats. Dependencies on other derived
+    stats are followed, so changing `strength` also clears a stat built on `strength_modifier`.
+    Only attributes with a setter can be depended on, since a change that bypasses a setter
+    could not invalidate anything. Classes list attributes whose setter is sometimes bypassed
+    in `_VOLATILE_ATTRIBUTES`.
+
+    Raises:
+        ValueError: If a derived stat depends on something that is neither a derived stat nor
+            an attribute with a setter.
+    """
+    stats = {name: getattr(cls, name) for name in dir(cls) if isinstance(getattr(cls, name, None), DerivedStat)}
+
+    # Derived stats to invalidate when each settable attribute changes
+    dependents: Dict[str, Set[str]] = {}
+    def invalidate(attribute: str, stat: str, path: tuple = ()) -> None:
+        if attribute in stats:
+            if attribute in path:
+                raise ValueError(f"Derived stat '{stat}' depends on itself through '{attribute}'")
+            for dependency in stats[attribute].depends_on:
+                invalidate(dependency, stat, path + (attribute,))
+            return
+        prop = getattr(cls, attribute, None)
+        if not isinstance(prop, property) or prop.fset is None or attribute in getattr(cls, "_VOLATILE_ATTRIBUTES", ()):
+            raise ValueError(f"Derived stat '{stat}' depends on '{attribute}', which is not a derived stat "
+                             f"or an attribute with a setter")
+        dependents.setdefault(attribute, set()).add(stat)
+    for name, stat in stats.items():
+        for dependency in stat.depends_on:
+            invalidate(dependency, name, (name,))
+
+    for attribute, names in dependents.items():
+        prop = getattr(cls, attribute)
+        # Wrap the original setter, not one wrapped for a base class
+        fset = getattr(prop.fset, "__wrapped__", prop.fset)
+        setattr(cls, attribute, property(prop.fget, _invalidating_setter(fset, tuple(sorted(names))), None, prop.__doc__))
+
+def _invalidating_setter(fset: Callable, names: tuple) -> Callable:
+    """Builds a setter that runs `fset`, then drops the cached values of `names`."""
+    def setter(self, value):
+        fset(self, value)
+        state = self.__dict__
+        for name in names:
+            if name in state:
+                del state[name]
+    setter.__wrapped__ = fset
+    return setter
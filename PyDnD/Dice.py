@@ -8,9 +8,21 @@ Dice Module is for creating dice objects used by any other modules
 """
 
 # Built-in Imports
+import os
 import random
+import threading
+from collections import Counter
 from typing import List
 
+# Optional Imports
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Import Distribution functionality
+from .Distribution import Distribution, _resolve_drops, _validate_face_rules
+
 # META Data
 __author__ = 'CFDeadlines'
 __copyright__ = 'Copyright 2024, CFDeadlines'
@@ -21,6 +33,354 @@ __maintainer__ = 'CFDeadlines'
 __email__ = 'cookm0803@gmail.com'
 __status__ = 'Open'
 
+def _require_numpy():
+    """Raises ImportError if NumPy is not available for the batch rolling APIs."""
+    if np is None:
+        raise ImportError("NumPy is required for batch rolling. Install it with 'pip install numpy'.")
+
+def _secure_randint_array(sides: int, shape):
+    """
+    Draws an array of die faces in [1, sides] from OS entropy.
+
+    Reads all the randomness needed for the batch with a single `os.urandom` call and maps it
+    onto the die faces with rejection sampling, so the results are unbiased and of the same
+    quality as `SystemRandom.randint`. Dice with more than 2**32 sides are drawn from 64 bit
+    values instead of 32 bit ones.
+
+    Args:
+        sides (int): Number of sides on each die.
+        shape (tuple): Shape of the returned array.
+
+    Returns:
+        numpy.ndarray: An int64 array of die faces.
+
+    Raises:
+        ValueError: If the faces would not fit in an int64 array.
+    """
+    _require_numpy()
+    if sides > np.iinfo(np.int64).max:
+        raise ValueError("Dice with more than 2**63 - 1 sides cannot be rolled into an array.")
+    size, dtype = (4, np.uint32) if sides <= 2 ** 32 else (8, np.uint64)
+    span = 256 ** size
+    count = int(np.prod(shape))
+    # Values at or above `limit` would make the low faces more likely, so they are rejected
+    limit = (span // sides) * sides
+    faces = np.empty(0, dtype=np.int64)
+    while faces.size < count:
+        # Over-draw slightly so a single pass almost always suffices
+        needed = count - faces.size
+        draws = needed + needed * (span - limit) // limit + 16
+        raw = np.frombuffer(os.urandom(size * draws), dtype=dtype)
+        if limit < span:
+            raw = raw[raw < dtype(limit)]
+        faces = np.concatenate((faces, (raw % np.uint64(sides)).astype(np.int64) + 1))
+    return faces[:count].reshape(shape)
+
+class RandomBackend(object):
+    """
+    Base class for the random number sources used by `Dice`.
+
+    Subclasses must implement `randint`, and should override `roll_faces` and `roll_array`
+    when the underlying generator can produce many values faster than one at a time.
+    """
+
+    def randint(self, low: int, high: int) -> int:
+        """Returns a random integer N such that low <= N <= high."""
+        raise NotImplementedError
+
+    def roll_faces(self, sides: int, count: int) -> List[int]:
+        """
+        Rolls `count` dice with the given number of sides.
+
+        Args:
+            sides (int): Number of sides on each die.
+            count (int): Number of dice to roll.
+
+        Returns:
+            List[int]: The individual die faces, in the order they were rolled.
+        """
+        return [self.randint(1, sides) for _ in range(count)]
+
+    def roll_array(self, sides: int, shape):
+        """
+        Rolls a NumPy array of dice faces in [1, sides].
+
+        Args:
+            sides (int): Number of sides on each die.
+            shape (tuple): Shape of the returned array.
+
+        Returns:
+            numpy.ndarray: An int64 array of die faces.
+        """
+        _require_numpy()
+        count = int(np.prod(shape))
+        return np.fromiter(self.roll_faces(sides, count), dtype=np.int64, count=count).reshape(shape)
+
+class SystemRandomBackend(RandomBackend):
+    """
+    Cryptographically secure backend using the operating system's randomness.
+
+    This is the default backend. It cannot be seeded, so results are not reproducible.
+    """
+
+    def __init__(self):
+        self.random_generator = random.SystemRandom()
+
+    def randint(self, low: int, high: int) -> int:
+        return self.random_generator.randint(low, high)
+
+    def roll_array(self, sides: int, shape):
+        return _secure_randint_array(sides, shape)
+
+class SeededRandomBackend(RandomBackend):
+    """
+    Fast, seedable backend built on the standard library's Mersenne Twister.
+
+    A single instance can be shared by any number of `Dice` so a whole simulation is
+    reproducible from one seed. Not suitable where rolls must be unpredictable.
+
+    Args:
+        seed (int, optional): Seed for the generator. Default is None (seeded from the OS).
+    """
+
+    def __init__(self, seed: int = None):
+        self.random_generator = random.Random(seed)
+
+    def seed(self, seed: int = None) -> None:
+        """Re-seeds the generator."""
+        self.random_generator.seed(seed)
+
+    def randint(self, low: int, high: int) -> int:
+        return self.random_generator.randint(low, high)
+
+    def roll_faces(self, sides: int, count: int) -> List[int]:
+        return self.random_generator.choices(range(1, sides + 1), k=count)
+
+    def roll_array(self, sides: int, shape):
+        # Derive a NumPy stream from this generator so batches stay reproducible from the seed
+        _require_numpy()
+        generator = np.random.default_rng(self.random_generator.getrandbits(128))
+        return generator.integers(1, sides, size=shape, endpoint=True)
+
+class NumpyBackend(RandomBackend):
+    """
+    Backend built on a NumPy `Generator`, the fastest choice for batch rolling.
+
+    Args:
+        seed (int or numpy.random.Generator, optional): Seed for a new generator, or an
+            existing generator to draw from. Default is None (seeded from the OS).
+    """
+
+    def __init__(self, seed=None):
+        _require_numpy()
+        if isinstance(seed, np.random.Generator):
+            self.random_generator = seed
+        else:
+            self.random_generator = np.random.default_rng(seed)
+
+    def randint(self, low: int, high: int) -> int:
+        return int(self.random_generator.integers(low, high, endpoint=True))
+
+    def roll_faces(self, sides: int, count: int) -> List[int]:
+        return self.random_generator.integers(1, sides, size=count, endpoint=True).tolist()
+
+    def roll_array(self, sides: int, shape):
+        return self.random_generator.integers(1, sides, size=shape, endpoint=True)
+
+class EntropyPool(RandomBackend):
+    """
+    Cryptographically secure backend that reads OS randomness in large blocks.
+
+    `SystemRandom` makes a small `os.urandom` read for every die. This backend reads
+    `block_size` bytes at a time, refilling lazily when the buffer runs out, and turns the
+    bytes into die faces with rejection sampling so every face stays equally likely. It is
+    thread safe, and discards its buffer after a fork so child processes never reuse bytes.
+
+    Args:
+        block_size (int, optional): Number of bytes to read from the OS at a time. Default is 4096.
+
+    Example:
+        set_default_backend(EntropyPool())
+    """
+
+    # Smallest unsigned memoryview format that can hold a value below `n`
+    _FORMATS = ((1, "B"), (2, "H"), (4, "I"), (8, "Q"))
+
+    def __init__(self, block_size: int = 4096):
+        if block_size < 8:
+            raise ValueError("Block size must be at least 8 bytes.")
+        self.block_size = block_size
+        self._buffer = b""
+        self._position = 0
+        self._pid = os.getpid()
+        self._lock = threading.Lock()
+
+    def randint(self, low: int, high: int) -> int:
+        return low + self._below(high - low + 1, 1)[0]
+
+    def roll_faces(self, sides: int, count: int) -> List[int]:
+        return [face + 1 for face in self._below(sides, count)]
+
+    def roll_array(self, sides: int, shape):
+        # A batch is read in a single call anyway, so skip the buffer
+        return _secure_randint_array(sides, shape)
+
+    def _below(self, n: int, count: int) -> List[int]:
+        """Returns `count` unbiased random integers in [0, n)."""
+        if n < 1:
+            raise ValueError("Range must contain at least one value.")
+        if n > 2 ** 64:
+            # Too wide for the fixed-size formats, fall back to the OS directly
+            return [random.SystemRandom().randrange(n) for _ in range(count)]
+        size, code = next((size, code) for size, code in self._FORMATS if n <= 256 ** size)
+        # Values at or above `limit` would make the low faces more likely, so they are rejected
+        limit = (256 ** size // n) * n
+        values = []
+        while len(values) < count:
+            needed = count - len(values)
+            data = self._read(size * (needed + needed // 8 + 1))
+            values.extend(value % n for value in memoryview(data).cast(code) if value < limit)
+        del values[count:]
+        return values
+
+    def _read(self, size: int) -> bytes:
+        """Returns `size` bytes from the buffer, refilling it from the OS when it runs out."""
+        with self._lock:
+            if self._pid != os.getpid():
+                self._buffer, self._position, self._pid = b"", 0, os.getpid()
+            available = len(self._buffer) - self._position
+            if available < size:
+                self._buffer = self._buffer[self._position:] + os.urandom(max(self.block_size, size))
+                self._position = 0
+            data = self._buffer[self._position:self._position + size]
+            self._position += size
+            return data
+
+_default_backend = SystemRandomBackend()
+_default_recorder = None
+
+def get_default_backend() -> RandomBackend:
+    """Returns the backend used by `Dice` objects that were not given one explicitly."""
+    return _default_backend
+
+def set_default_backend(backend: RandomBackend) -> None:
+    """
+    Sets the backend used by `Dice` objects that are not given one explicitly.
+
+    Args:
+        backend (RandomBackend): The backend to use, e.g. `SeededRandomBackend(42)`.
+
+    Raises:
+        TypeError: If `backend` is not a RandomBackend.
+    """
+    global _default_backend
+    if not isinstance(backend, RandomBackend):
+        raise TypeError("Backend must be a RandomBackend instance.")
+    _default_backend = backend
+
+def get_default_recorder():
+    """Returns the recorder that `Dice` objects write to when not given one, or None."""
+    return _default_recorder
+
+def set_default_recorder(recorder) -> None:
+    """
+    Sets the recorder that every `Dice` object writes its rolls to when not given one.
+
+    Args:
+        recorder (RollRecorder): The recorder to use, or None to stop recording.
+    """
+    global _default_recorder
+    _default_recorder = recorder
+
+# Pools up to this size are cheaper to sort than to count by face value
+SMALL_POOL_SIZE = 16
+
+def _kept_total(faces: List[int], drop_lowest: int = 0, drop_highest: int = 0) -> int:
+    """
+    Returns the sum of the faces left after dropping the lowest and highest dice.
+
+    Large pools are counted by face value instead of being sorted, which is linear in the
+    number of dice plus the number of distinct faces rolled.
+
+    Args:
+        faces (List[int]): The individual die faces, in any order.
+        drop_lowest (int, optional): Number of lowest faces to drop. Default is 0.
+        drop_highest (int, optional): Number of highest faces to drop. Default is 0.
+
+    Returns:
+        int: The sum of the kept faces.
+    """
+    if not drop_lowest and not drop_highest:
+        return sum(faces)
+    if len(faces) <= SMALL_POOL_SIZE:
+        return sum(sorted(faces)[drop_lowest:len(faces) - drop_highest])
+
+    counts = Counter(faces)
+    values = sorted(counts)
+    return sum(faces) - _sum_extreme(counts, values, drop_lowest) - _sum_extreme(counts, reversed(values), drop_highest)
+
+def _roll_faces(rng: RandomBackend, sides: int, count: int, explode: bool = False, reroll_below: int = 0,
+                minimum_face: int = 0) -> List[int]:
+    """
+    Rolls `count` dice and applies the reroll, minimum and explode rules to each face.
+
+    A die showing `reroll_below` or less is rerolled once and keeps the new face. Faces below
+    `minimum_face` then count as `minimum_face`. A die whose face is the highest one explodes:
+    another die is rolled and added, and this repeats for as long as the added dice also show
+    the highest face. All chains still exploding are rolled together in one call per round.
+    """
+    faces = rng.roll_faces(sides, count)
+    if reroll_below:
+        low = [index for index, face in enumerate(faces) if face <= reroll_below]
+        if low:
+            for index, face in zip(low, rng.roll_faces(sides, len(low))):
+                faces[index] = face
+    # Explosions are decided by the face rolled, before any minimum is applied
+    chains = [index for index, face in enumerate(faces) if face == sides] if explode else []
+    if minimum_face > 1:
+        faces = [face if face >= minimum_face else minimum_face for face in faces]
+    while chains:
+        extra = rng.roll_faces(sides, len(chains))
+        for index, face in zip(chains, extra):
+            faces[index] += face
+        chains = [index for index, face in zip(chains, extra) if face == sides]
+    return faces
+
+def _roll_faces_array(rng: RandomBackend, sides: int, shape, explode: bool = False, reroll_below: int = 0,
+                      minimum_face: int = 0):
+    """
+    NumPy counterpart of `_roll_faces`, returning an array of the given shape.
+
+    Rerolls are drawn in a single call, and explosion chains are extended a round at a time
+    for every die still exploding, so the number of backend calls grows with the longest
+    chain (about log(count) / log(sides)) rather than with the number of dice.
+    """
+    faces = rng.roll_array(sides, shape).astype(np.int64, copy=False)
+    flat = faces.reshape(-1)
+    if reroll_below:
+        low = np.flatnonzero(flat <= reroll_below)
+        if low.size:
+            flat[low] = rng.roll_array(sides, low.size)
+    chains = np.flatnonzero(flat == sides) if explode else None
+    if minimum_face > 1:
+        np.maximum(flat, minimum_face, out=flat)
+    while chains is not None and chains.size:
+        extra = rng.roll_array(sides, chains.size)
+        flat[chains] += extra
+        chains = chains[extra == sides]
+    return faces
+
+def _sum_extreme(counts: Counter, values, amount: int) -> int:
+    """Sums the first `amount` dice taken from the face histogram in the order of `values`."""
+    total = 0
+    for value in values:
+        if amount <= 0:
+            break
+        taken = min(counts[value], amount)
+        total += taken * value
+        amount -= taken
+    return total
+
 class Dice(object):
     """
     Dice object that handles rolling of dice using SystemRandom for better randomness.
@@ -30,38 +390,149 @@ class Dice(object):
         sides (int): Number of sides on each die.
         modifier (int, optional): Modifier to add to the total roll. Default is 0.
         drop_lowest (int, optional): Number of lowest dice rolls to drop. Default is 0.
+        drop_highest (int, optional): Number of highest dice rolls to drop. Default is 0.
+        keep_highest (int, optional): Number of highest dice rolls to keep. Cannot be combined
+            with the other keep/drop options. Default is None (keep all).
+        keep_lowest (int, optional): Number of lowest dice rolls to keep. Cannot be combined
+            with the other keep/drop options. Default is None (keep all).
+        rng (RandomBackend, optional): Random backend to roll with. Default is the
+            module default backend (SystemRandom unless changed with `set_default_backend`).
+        recorder (RollRecorder, optional): Recorder to write every roll to. Default is the
+            module default recorder (none unless set with `set_default_recorder`).
+        explode (bool, optional): Whether a die showing its highest face is rolled again and
+            added, repeatedly. Default is False.
+        reroll_below (int, optional): Dice showing this value or less are rerolled once and
+            the new face kept, e.g. 1 to reroll ones. Default is 0 (no rerolls).
+        minimum_face (int, optional): Dice showing less than this count as this value.
+            Default is 0 (no minimum).
 
     Example:
         dice = Dice(num_dice=4, sides=6, drop_lowest=1)
         dice.roll()
         print(dice.value)  # The sum of the highest 3 rolls out of 4d6
 
+        Dice(num_dice=2, sides=6, explode=True, reroll_below=1).roll()
+
+    Rerolls happen first, then minimums, and a die explodes when the face it rolled (before
+    any minimum) is its highest face. Exploded dice count as one die, worth the whole chain,
+    when dropping the lowest or highest.
+
     Attributes:
         value (int): The total result of the roll, including any modifiers.
-        rolls (List[int]): The list of individual dice rolls.
+        rolls (List[int]): The list of individual dice rolls, highest first. Only sorted
+            when first accessed after a roll.
+        drop_lowest (int): Number of lowest dice rolls dropped, including any implied by `keep_highest`.
+        drop_highest (int): Number of highest dice rolls dropped, including any implied by `keep_lowest`.
     """
 
-    def __init__(self, num_dice: int = 1, sides: int = 6, modifier: int = 0, drop_lowest: int = 0):
+    def __init__(self, num_dice: int = 1, sides: int = 6, modifier: int = 0, drop_lowest: int = 0, drop_highest: int = 0,
+                 keep_highest: int = None, keep_lowest: int = None, rng: RandomBackend = None, recorder=None,
+                 explode: bool = False, reroll_below: int = 0, minimum_face: int = 0):
         if num_dice < 1 or sides < 1:
             raise ValueError("Number of dice and sides must be greater than 0.")
-        if drop_lowest >= num_dice:
-            raise ValueError("Cannot drop more dice than are rolled.")
+        _validate_face_rules(sides, reroll_below, minimum_face, explode)
 
         self.num_dice = num_dice
         self.sides = sides
         self.modifier = modifier
-        self.drop_lowest = drop_lowest
+        self.drop_lowest, self.drop_highest = _resolve_drops(num_dice, drop_lowest, drop_highest, keep_highest, keep_lowest)
+        self.explode = explode
+        self.reroll_below = reroll_below
+        self.minimum_face = minimum_face
         self.value = 0
         self.rolls = []
-        self.random_generator = random.SystemRandom()
+        self.random_generator = rng if rng is not None else _default_backend
+        self.recorder = recorder if recorder is not None else _default_recorder
+
+    # Rolls Property
+    @property
+    def rolls(self) -> List[int]:
+        if self._rolls is None:
+            self._rolls = sorted(self._faces, reverse=True)
+        return self._rolls
+
+    @rolls.setter
+    def rolls(self, value):
+        self._faces = value
+        self._rolls = value
 
     def roll(self) -> None:
         """Rolls the dice and calculates the total value, applying any modifiers."""
-        self.rolls = sorted([self.random_generator.randint(1, self.sides) for _ in range(self.num_dice)], reverse=True)
-        if self.drop_lowest > 0:
-            self.value = sum(self.rolls[:-self.drop_lowest]) + self.modifier
+        if self.explode or self.reroll_below or self.minimum_face > 1:
+            self._faces = _roll_faces(self.random_generator, self.sides, self.num_dice,
+                                      self.explode, self.reroll_below, self.minimum_face)
+        else:
+            self._faces = self.random_generator.roll_faces(self.sides, self.num_dice)
+        self._rolls = None
+        self.value = _kept_total(self._faces, self.drop_lowest, self.drop_highest) + self.modifier
+        if self.recorder is not None:
+            self.recorder.record(self)
+
+    def roll_many(self, n: int, return_rolls: bool = False):
+        """
+        Rolls the dice `n` times at once and returns the results as NumPy arrays.
+
+        Unlike `roll`, this does not update `value` or `rolls`; it is meant for simulations
+        that need a large number of results in one call.
+
+        Args:
+            n (int): Number of times to roll the dice.
+            return_rolls (bool, optional): Whether to also return the (n, num_dice) matrix of
+                individual rolls, each row sorted from highest to lowest. Exploded dice hold
+                the total of their chain. Default is False.
+
+        Returns:
+            numpy.ndarray or tuple: The array of `n` totals, including any modifiers. If
+            `return_rolls` is True, returns a tuple of (totals, matrix of rolls).
+
+        Raises:
+            ValueError: If `n` is negative.
+            ImportError: If NumPy is not installed.
+        """
+        if n < 0:
+            raise ValueError("Number of rolls cannot be negative.")
+        if self.explode or self.reroll_below or self.minimum_face > 1:
+            rolls = _roll_faces_array(self.random_generator, self.sides, (n, self.num_dice),
+                                      self.explode, self.reroll_below, self.minimum_face)
         else:
-            self.value = sum(self.rolls) + self.modifier
+            rolls = self.random_generator.roll_array(self.sides, (n, self.num_dice))
+        totals = rolls.sum(axis=1)
+        if self.drop_lowest > 0:
+            dropped = np.partition(rolls, self.drop_lowest - 1, axis=1)[:, :self.drop_lowest]
+            totals -= dropped.sum(axis=1)
+        if self.drop_highest > 0:
+            first_dropped = self.num_dice - self.drop_highest
+            dropped = np.partition(rolls, first_dropped, axis=1)[:, first_dropped:]
+            totals -= dropped.sum(axis=1)
+        totals += self.modifier
+        if return_rolls:
+            return totals, -np.sort(-rolls, axis=1)
+        return totals
+
+    def distribution(self) -> Distribution:
+        """
+        Returns the exact probability distribution of this roll's value.
+
+        Returns:
+            Distribution: The distribution of the total, including any modifiers.
+
+        Raises:
+            ValueError: If the dice explode, since exploding totals have no upper bound.
+        """
+        return Distribution.for_dice(self.num_dice, self.sides, modifier=self.modifier,
+                                     drop_lowest=self.drop_lowest, drop_highest=self.drop_highest,
+                                     reroll_below=self.reroll_below, minimum_face=self.minimum_face,
+                                     explode=self.explode)
 
     def __repr__(self):
-        return f"<Dice: {self.num_dice}d{self.sides}+{self.modifier} (drop lowest {self.drop_lowest}) = {self.value}>"
+        drops = f"drop lowest {self.drop_lowest}"
+        if self.drop_highest:
+            drops += f", drop highest {self.drop_highest}"
+        if self.reroll_below:
+            drops += f", reroll {self.reroll_below} or less"
+        if self.minimum_face > 1:
+            drops += f", minimum {self.minimum_face}"
+        if self.explode:
+            drops += ", exploding"
+        return f"<Dice: {self.num_dice}d{self.sides}+{self.modifier} ({drops}) = {self.value}>"
+
@@ -0,0 +1,270 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+DiceExpression Module parses dice notation such as "2d8+1d6+3" or "4d6kh3" into reusable,
+compiled evaluators.
+"""
+
+# Built-in Imports
+import re
+from functools import lru_cache
+from typing import List, Tuple
+
+# Import Dice functionality
+from .Dice import RandomBackend, get_default_backend, get_default_recorder, np, _require_numpy, _kept_total
+from .Distribution import Distribution, _kept_counts
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+################
+#  Exceptions  #
+################
+class InvalidDiceExpression(ValueError):
+    pass
+
+# Number of compiled expressions kept by DiceExpression.parse
+EXPRESSION_CACHE_SIZE = 1024
+
+_TERM_PATTERN = re.compile(r"([+-])(?:(\d*)d(\d+)(?:(kh|kl|dh|dl|k|d)(\d+))?|(\d+))")
+
+class DicePool(object):
+    """
+    A compiled group of identical dice within an expression, e.g. the "4d6kh3" in "4d6kh3+2".
+
+    The `drop_highest` highest and `drop_lowest` lowest dice are left out of the total, the
+    same way `Dice` drops them.
+
+    Attributes:
+        num_dice (int): Number of dice to roll.
+        sides (int): Number of sides on each die.
+        drop_lowest (int): Number of lowest dice rolls to drop.
+        drop_highest (int): Number of highest dice rolls to drop.
+        sign (int): 1 if the pool is added to the total, -1 if it is subtracted.
+    """
+
+    def __init__(self, num_dice: int, sides: int, drop_lowest: int = 0, drop_highest: int = 0, sign: int = 1):
+        self.num_dice = num_dice
+        self.sides = sides
+        self.drop_lowest = drop_lowest
+        self.drop_highest = drop_highest
+        self.sign = sign
+
+    def roll(self, rng: RandomBackend) -> Tuple[int, List[int]]:
+        """
+        Rolls the pool once.
+
+        Returns:
+            tuple: The signed total of the kept dice and the list of rolls, in the order rolled.
+        """
+        faces = rng.roll_faces(self.sides, self.num_dice)
+        return self.sign * _kept_total(faces, self.drop_lowest, self.drop_highest), faces
+
+    def roll_many(self, n: int, rng: RandomBackend):
+        """Rolls the pool `n` times and returns a NumPy array of signed totals."""
+        rolls = rng.roll_array(self.sides, (n, self.num_dice))
+        totals = rolls.sum(axis=1)
+        if self.drop_lowest:
+            totals -= np.partition(rolls, self.drop_lowest - 1, axis=1)[:, :self.drop_lowest].sum(axis=1)
+        if self.drop_highest:
+            first_dropped = self.num_dice - self.drop_highest
+            totals -= np.partition(rolls, first_dropped, axis=1)[:, first_dropped:].sum(axis=1)
+        return self.sign * totals
+
+    def distribution(self) -> Distribution:
+        """Returns the exact distribution of the pool's signed total."""
+        offset, counts = _kept_counts(self.num_dice, self.sides, self.drop_lowest, self.drop_highest)
+        if self.sign < 0:
+            return Distribution(counts[::-1], -(offset + len(counts) - 1))
+        return Distribution(counts, offset)
+
+    def __str__(self):
+        notation = f"{self.num_dice}d{self.sides}"
+        if self.drop_lowest:
+            notation += f"dl{self.drop_lowest}"
+        if self.drop_highest:
+            notation += f"dh{self.drop_highest}"
+        return notation
+
+class DiceExpression(object):
+    """
+    A compiled dice expression that can be evaluated any number of times without re-parsing.
+
+    Expressions are sums and differences of dice pools and constant modifiers. A pool is
+    written NdS (N defaults to 1) and may end with one selector:
+
+        kh<k> or k<k>   keep the highest k dice
+        kl<k>           keep the lowest k dice
+        dl<k> or d<k>   drop the lowest k dice
+        dh<k>           drop the highest k dice
+
+    Use `DiceExpression.parse` rather than the constructor, so compiled expressions are
+    shared through the cache.
+
+    Example:
+        attack = DiceExpression.parse("2d8+1d6+3")
+        damage = attack.roll()
+        stat, rolls = DiceExpression.parse("4d6kh3").roll(return_rolls=True)
+
+    Attributes:
+        expression (str): The notation the expression was compiled from.
+        pools (Tuple[DicePool]): The dice pools in the expression.
+        modifier (int): The sum of all constant terms.
+    """
+
+    def __init__(self, expression: str, pools: Tuple[DicePool, ...], modifier: int = 0):
+        self.expression = expression
+        self.pools = pools
+        self.modifier = modifier
+
+    @staticmethod
+    def parse(expression: str) -> 'DiceExpression':
+        """
+        Compiles dice notation, reusing the cached result for expressions seen before.
+
+        Args:
+            expression (str): Dice notation, e.g. "2d8+1d6+3" or "4d6kh3".
+
+        Returns:
+            DiceExpression: The compiled expression.
+
+        Raises:
+            InvalidDiceExpression: If the notation cannot be parsed or describes invalid dice.
+        """
+        if not isinstance(expression, str):
+            raise InvalidDiceExpression("Dice expression must be a string")
+        return _compile(expression)
+
+    def roll(self, rng: RandomBackend = None, return_rolls: bool = False, recorder=None):
+        """
+        Evaluates the expression once.
+
+        Args:
+            rng (RandomBackend, optional): Random backend to roll with. Default is the module default backend.
+            return_rolls (bool, optional): Whether to return the rolls of each pool along with the total. Default is False.
+            recorder (RollRecorder, optional): Recorder to write each pool's roll to. Default is the module default recorder.
+
+        Returns:
+            int or tuple: The total. If `return_rolls` is True, returns a tuple of (total, list of roll lists
+            sorted highest first, one per pool).
+        """
+        if rng is None:
+            rng = get_default_backend()
+        if recorder is None:
+            recorder = get_default_recorder()
+        total = self.modifier
+        all_rolls = []
+        for pool in self.pools:
+            value, faces = pool.roll(rng)
+            total += value
+            if recorder is not None:
+                recorder.record_pool(pool, pool.sign * value, faces)
+            if return_rolls:
+                all_rolls.append(sorted(faces, reverse=True))
+        if return_rolls:
+            return total, all_rolls
+        return total
+
+    def roll_many(self, n: int, rng: RandomBackend = None):
+        """
+        Evaluates the expression `n` times at once.
+
+        Args:
+            n (int): Number of times to evaluate the expression.
+            rng (RandomBackend, optional): Random backend to roll with. Default is the module default backend.
+
+        Returns:
+            numpy.ndarray: The array of `n` totals.
+
+        Raises:
+            ValueError: If `n` is negative.
+            ImportError: If NumPy is not installed.
+        """
+        _require_numpy()
+        if n < 0:
+            raise ValueError("Number of rolls cannot be negative.")
+        if rng is None:
+            rng = get_default_backend()
+        totals = np.full(n, self.modifier, dtype=np.int64)
+        for pool in self.pools:
+            totals += pool.roll_many(n, rng)
+        return totals
+
+    def distribution(self) -> Distribution:
+        """Returns the exact probability distribution of the expression's total."""
+        result = Distribution([1], self.modifier)
+        for pool in self.pools:
+            result = result + pool.distribution()
+        return result
+
+    def __str__(self):
+        terms = [("-" if pool.sign < 0 else "+") + str(pool) for pool in self.pools]
+        if self.modifier or not terms:
+            terms.append(f"{self.modifier:+d}")
+        return "".join(terms).lstrip("+")
+
+    def __repr__(self):
+        return f"<DiceExpression: {self}>"
+
+@lru_cache(maxsize=EXPRESSION_CACHE_SIZE)
+def _compile(expression: str) -> DiceExpression:
+    """Parses dice notation into a DiceExpression. Results are cached by expression string."""
+    # Drop whitespace and lowercase, remembering which column of `expression` each character came from
+    text, columns = "", []
+    for column, character in enumerate(expression):
+        if not character.isspace():
+            lowered = character.lower()
+            text += lowered
+            columns.extend([column] * len(lowered))
+    if not text:
+        raise InvalidDiceExpression("Dice expression cannot be empty")
+    if text[0] not in "+-":
+        text = "+" + text
+        columns.insert(0, columns[0])
+
+    pools = []
+    modifier = 0
+    position = 0
+    while position < len(text):
+        match = _TERM_PATTERN.match(text, position)
+        if match is None:
+            raise InvalidDiceExpression(f"Invalid dice expression '{expression}' at position {columns[position]}")
+        position = match.end()
+        sign_text, count, sides, mode, amount, constant = match.groups()
+        sign = -1 if sign_text == "-" else 1
+        if constant is not None:
+            modifier += sign * int(constant)
+            continue
+        pools.append(_compile_pool(expression, int(count) if count else 1, int(sides), mode, int(amount or 0), sign))
+    return DiceExpression(expression, tuple(pools), modifier)
+
+def _compile_pool(expression: str, num_dice: int, sides: int, mode: str, amount: int, sign: int) -> DicePool:
+    """Validates a single NdS term and converts its selector into dice to drop."""
+    if num_dice < 1 or sides < 1:
+        raise InvalidDiceExpression(f"Number of dice and sides must be greater than 0 in '{expression}'")
+    drop_lowest = drop_highest = 0
+    if mode in ("k", "kh", "kl"):
+        if amount < 1 or amount > num_dice:
+            raise InvalidDiceExpression(f"Must keep between 1 and {num_dice} dice in '{expression}'")
+        if mode == "kl":
+            drop_highest = num_dice - amount
+        else:
+            drop_lowest = num_dice - amount
+    elif mode in ("d", "dl", "dh"):
+        if amount >= num_dice:
+            raise InvalidDiceExpression(f"Cannot drop more dice than are rolled in '{expression}'")
+        if mode == "dh":
+            drop_highest = amount
+        else:
+            drop_lowest = amount
+    return DicePool(num_dice, sides, drop_lowest, drop_highest, sign)
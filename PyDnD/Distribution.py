@@ -0,0 +1,348 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+Distribution Module computes exact probability distributions for dice rolls, so odds can be
+looked up instead of estimated by rolling thousands of times.
+"""
+
+# Built-in Imports
+from bisect import bisect_left
+from collections import defaultdict
+from functools import lru_cache
+from itertools import accumulate
+from math import comb, sqrt
+from typing import Dict, Iterator, Sequence, Tuple
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+class Distribution(object):
+    """
+    Exact probability distribution over integer outcomes.
+
+    Outcomes are stored as integer counts of equally likely results, so no precision is lost
+    until a probability is requested. Distributions are immutable and can be added together
+    (the distribution of the sum of both) or shifted by adding an integer.
+
+    Args:
+        counts (Sequence[int]): Number of ways to reach each outcome, starting at `offset`.
+        offset (int, optional): The smallest outcome. Default is 0.
+
+    Example:
+        stats = Distribution.for_dice(num_dice=4, sides=6, drop_lowest=1)
+        print(stats.at_least(15))  # Chance that 4d6 drop lowest is 15 or better
+        print(stats.mean, stats.percentile(50))
+
+    Attributes:
+        counts (Tuple[int]): Number of ways to reach each outcome, starting at `offset`.
+        offset (int): The smallest outcome.
+        total (int): Total number of equally likely results.
+    """
+
+    def __init__(self, counts: Sequence[int], offset: int = 0):
+        counts = list(counts)
+        # Trim impossible outcomes from both ends so minimum/maximum are meaningful
+        start = 0
+        while start < len(counts) and counts[start] == 0:
+            start += 1
+        end = len(counts)
+        while end > start and counts[end - 1] == 0:
+            end -= 1
+        if start == end:
+            raise ValueError("A distribution needs at least one possible outcome.")
+        if any(count < 0 for count in counts):
+            raise ValueError("Outcome counts cannot be negative.")
+
+        self.counts = tuple(counts[start:end])
+        self.offset = offset + start
+        self.total = sum(self.counts)
+        self._cumulative = tuple(accumulate(self.counts))
+        self._moments = None
+
+    @classmethod
+    def for_dice(cls, num_dice: int = 1, sides: int = 6, modifier: int = 0, drop_lowest: int = 0, drop_highest: int = 0,
+                 keep_highest: int = None, keep_lowest: int = None, reroll_below: int = 0, minimum_face: int = 0,
+                 explode: bool = False) -> 'Distribution':
+        """
+        Returns the exact distribution of a dice roll such as 4d6 drop lowest.
+
+        Intermediate results are memoized, so repeated queries for the same dice are cheap.
+
+        Args:
+            num_dice (int): Number of dice to roll.
+            sides (int): Number of sides on each die.
+            modifier (int, optional): Modifier to add to the total roll. Default is 0.
+            drop_lowest (int, optional): Number of lowest dice rolls to drop. Default is 0.
+            drop_highest (int, optional): Number of highest dice rolls to drop. Default is 0.
+            keep_highest (int, optional): Number of highest dice rolls to keep. Cannot be
+                combined with the other keep/drop options. Default is None (keep all).
+            keep_lowest (int, optional): Number of lowest dice rolls to keep. Cannot be
+                combined with the other keep/drop options. Default is None (keep all).
+            reroll_below (int, optional): Faces at or below this are rerolled once. Default is 0.
+            minimum_face (int, optional): Faces below this count as this value. Default is 0.
+            explode (bool, optional): Exploding dice have no upper bound, so this must be False.
+
+        Returns:
+            Distribution: The distribution of the total, including any modifiers.
+
+        Raises:
+            ValueError: If the dice arguments are invalid or the dice explode.
+        """
+        if num_dice < 1 or sides < 1:
+            raise ValueError("Number of dice and sides must be greater than 0.")
+        if explode:
+            raise ValueError("Exploding dice have no finite distribution.")
+        _validate_face_rules(sides, reroll_below, minimum_face)
+        drop_lowest, drop_highest = _resolve_drops(num_dice, drop_lowest, drop_highest, keep_highest, keep_lowest)
+        weights = _face_weights(sides, reroll_below, minimum_face) if reroll_below or minimum_face > 1 else None
+        offset, counts = _kept_counts(num_dice, sides, drop_lowest, drop_highest, weights)
+        return cls(counts, offset + modifier)
+
+    @property
+    def minimum(self) -> int:
+        """The smallest possible outcome."""
+        return self.offset
+
+    @property
+    def maximum(self) -> int:
+        """The largest possible outcome."""
+        return self.offset + len(self.counts) - 1
+
+    @property
+    def mean(self) -> float:
+        """The expected value."""
+        first, _ = self._get_moments()
+        return first / self.total
+
+    @property
+    def variance(self) -> float:
+        """The variance of the outcome."""
+        first, second = self._get_moments()
+        return (second * self.total - first * first) / (self.total * self.total)
+
+    @property
+    def stddev(self) -> float:
+        """The standard deviation of the outcome."""
+        return sqrt(self.variance)
+
+    def probability(self, value: int) -> float:
+        """Returns the probability of rolling exactly `value`."""
+        index = value - self.offset
+        if 0 <= index < len(self.counts):
+            return self.counts[index] / self.total
+        return 0.0
+
+    def cdf(self, value: int) -> float:
+        """Returns the probability of rolling `value` or lower."""
+        index = value - self.offset
+        if index < 0:
+            return 0.0
+        if index >= len(self.counts):
+            return 1.0
+        return self._cumulative[index] / self.total
+
+    def at_most(self, value: int) -> float:
+        """Returns the probability of rolling `value` or lower. Alias of `cdf`."""
+        return self.cdf(value)
+
+    def at_least(self, value: int) -> float:
+        """Returns the probability of rolling `value` or higher."""
+        index = value - self.offset
+        if index <= 0:
+            return 1.0
+        if index >= len(self.counts):
+            return 0.0
+        return (self.total - self._cumulative[index - 1]) / self.total
+
+    def percentile(self, percent: float) -> int:
+        """
+        Returns the smallest outcome whose cumulative probability reaches `percent`.
+
+        Args:
+            percent (float): Percentile between 0 and 100, e.g. 50 for the median.
+
+        Raises:
+            ValueError: If `percent` is outside 0-100.
+        """
+        if not 0 <= percent <= 100:
+            raise ValueError("Percentile must be between 0 and 100.")
+        index = bisect_left(self._cumulative, percent * self.total / 100)
+        return self.offset + min(index, len(self.counts) - 1)
+
+    def items(self) -> Iterator[Tuple[int, float]]:
+        """Yields (outcome, probability) pairs for every possible outcome."""
+        for index, count in enumerate(self.counts):
+            if count:
+                yield self.offset + index, count / self.total
+
+    def to_dict(self) -> Dict[int, float]:
+        """Returns a dictionary mapping each possible outcome to its probability."""
+        return dict(self.items())
+
+    def _get_moments(self):
+        """Returns the exact integer sums of value and value squared, weighted by count."""
+        if self._moments is None:
+            first = second = 0
+            for index, count in enumerate(self.counts):
+                value = self.offset + index
+                first += value * count
+                second += value * value * count
+            self._moments = (first, second)
+        return self._moments
+
+    def __add__(self, other):
+        if isinstance(other, int):
+            return Distribution(self.counts, self.offset + other)
+        if isinstance(other, Distribution):
+            return Distribution(_convolve(self.counts, other.counts), self.offset + other.offset)
+        return NotImplemented
+
+    __radd__ = __add__
+
+    def __eq__(self, other):
+        if not isinstance(other, Distribution):
+            return NotImplemented
+        # Compare probabilities, so 1d2 built from counts (1, 1) equals one built from (2, 2)
+        return (self.offset == other.offset and len(self.counts) == len(other.counts)
+                and all(a * other.total == b * self.total for a, b in zip(self.counts, other.counts)))
+
+    def __hash__(self):
+        return hash((self.offset, len(self.counts)))
+
+    def __repr__(self):
+        return f"<Distribution: {self.minimum}..{self.maximum} (mean {self.mean:.3f})>"
+
+def _resolve_drops(num_dice: int, drop_lowest: int = 0, drop_highest: int = 0, keep_highest: int = None, keep_lowest: int = None) -> Tuple[int, int]:
+    """
+    Converts any combination of keep/drop options into the number of lowest and highest dice to drop.
+
+    Args:
+        num_dice (int): Number of dice rolled.
+        drop_lowest (int, optional): Number of lowest dice rolls to drop. Default is 0.
+        drop_highest (int, optional): Number of highest dice rolls to drop. Default is 0.
+        keep_highest (int, optional): Number of highest dice rolls to keep. Default is None.
+        keep_lowest (int, optional): Number of lowest dice rolls to keep. Default is None.
+
+    Returns:
+        tuple: (drop_lowest, drop_highest)
+
+    Raises:
+        ValueError: If the options conflict or would drop every die.
+    """
+    if keep_highest is not None or keep_lowest is not None:
+        if drop_lowest or drop_highest or (keep_highest is not None and keep_lowest is not None):
+            raise ValueError("keep_highest and keep_lowest cannot be combined with any other keep/drop option.")
+        keep = keep_highest if keep_highest is not None else keep_lowest
+        if keep < 1 or keep > num_dice:
+            raise ValueError("Must keep between 1 and the number of dice rolled.")
+        if keep_highest is not None:
+            return num_dice - keep, 0
+        return 0, num_dice - keep
+    if drop_lowest < 0 or drop_highest < 0:
+        raise ValueError("Number of dice to drop cannot be negative.")
+    if drop_lowest + drop_highest >= num_dice:
+        raise ValueError("Cannot drop more dice than are rolled.")
+    return drop_lowest, drop_highest
+
+def _validate_face_rules(sides: int, reroll_below: int = 0, minimum_face: int = 0, explode: bool = False) -> None:
+    """
+    Checks the per-die reroll, minimum and explode rules against the number of sides.
+
+    Raises:
+        ValueError: If a rule is out of range, or the dice would explode forever.
+    """
+    if not 0 <= reroll_below < sides:
+        raise ValueError("reroll_below must be between 0 and one less than the number of sides.")
+    if not 0 <= minimum_face <= sides:
+        raise ValueError("minimum_face must be between 0 and the number of sides.")
+    if explode and sides < 2:
+        raise ValueError("Dice with fewer than 2 sides cannot explode.")
+
+def _convolve(first: Sequence[int], second: Sequence[int]) -> Tuple[int, ...]:
+    """Returns the counts of the sum of two independent outcomes."""
+    result = [0] * (len(first) + len(second) - 1)
+    for i, a in enumerate(first):
+        if a:
+            for j, b in enumerate(second):
+                result[i + j] += a * b
+    return tuple(result)
+
+def _face_weights(sides: int, reroll_below: int = 0, minimum_face: int = 0) -> Tuple[int, ...]:
+    """
+    Returns the relative likelihood of each face 1..sides of a single die.
+
+    Rerolling faces up to `reroll_below` once gives every face `sides` ways from the first
+    roll (if it was kept) plus `reroll_below` ways from the reroll. Faces below
+    `minimum_face` count as `minimum_face`.
+    """
+    weights = [sides * (face > reroll_below) + reroll_below if reroll_below else 1 for face in range(1, sides + 1)]
+    if minimum_face > 1:
+        weights[minimum_face - 1] = sum(weights[:minimum_face])
+        weights[:minimum_face - 1] = [0] * (minimum_face - 1)
+    return tuple(weights)
+
+@lru_cache(maxsize=256)
+def _sum_counts(num_dice: int, weights: Tuple[int, ...]) -> Tuple[int, ...]:
+    """
+    Returns the counts for the plain sum of `num_dice` dice, starting at `num_dice`.
+
+    Splits the pool in half so only O(log num_dice) convolutions are needed, and every
+    intermediate pool size is memoized for reuse.
+    """
+    if num_dice == 1:
+        return weights
+    half = num_dice // 2
+    return _convolve(_sum_counts(half, weights), _sum_counts(num_dice - half, weights))
+
+@lru_cache(maxsize=256)
+def _kept_counts(num_dice: int, sides: int, drop_lowest: int, drop_highest: int, weights: Tuple[int, ...] = None) -> Tuple[int, Tuple[int, ...]]:
+    """
+    Returns (offset, counts) for the sum of the dice left after dropping the lowest and highest.
+
+    Plain sums use convolution. Otherwise the dice are counted by order statistics: faces are
+    assigned from highest to lowest, and choosing `c` of the remaining dice to show a face
+    fixes which sorted positions those dice fill, and so how many of them are kept.
+    `weights` gives the likelihood of each face (see `_face_weights`); None means a fair die.
+    """
+    if weights is None:
+        weights = (1,) * sides
+    if drop_lowest == 0 and drop_highest == 0:
+        return num_dice, _sum_counts(num_dice, weights)
+
+    keep_start = drop_highest
+    keep_end = num_dice - drop_lowest
+    # states[used] maps the sum of kept dice so far to the number of ways to reach it
+    states = {0: {0: 1}}
+    for face in range(sides, 0, -1):
+        weight = weights[face - 1]
+        next_states = defaultdict(lambda: defaultdict(int))
+        for used, sums in states.items():
+            remaining = num_dice - used
+            # Every die left over must show the lowest face
+            choices = range(remaining + 1) if face > 1 else (remaining,)
+            for chosen in choices:
+                ways = comb(remaining, chosen) * weight ** chosen
+                if not ways:
+                    continue
+                kept = max(0, min(used + chosen, keep_end) - max(used, keep_start))
+                target = next_states[used + chosen]
+                for subtotal, count in sums.items():
+                    target[subtotal + kept * face] += count * ways
+        states = next_states
+
+    sums = states[num_dice]
+    offset = min(sums)
+    counts = [0] * (max(sums) - offset + 1)
+    for subtotal, count in sums.items():
+        counts[subtotal - offset] = count
+    return offset, tuple(counts)
@@ -0,0 +1,132 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+Events Module lets applications subscribe to changes of players, inventories and leveling
+systems, and merge the changes made inside a `batch()` into one event per object.
+"""
+
+# Built-in/Generic Imports
+import threading
+from contextlib import contextmanager
+from typing import Callable, Dict, Iterator, Tuple
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+class ChangeEvent(object):
+    """
+    The changes made to one object, delivered to its subscribers.
+
+    Attributes:
+        source (object): The Player, Inventory or LevelingSystem that changed.
+        changes (dict): The old and new value of every changed field, as {field: (old, new)}.
+    """
+
+    __slots__ = ("source", "changes")
+
+    def __init__(self, source, changes: Dict[str, Tuple[object, object]]):
+        self.source = source
+        self.changes = changes
+
+    def __repr__(self):
+        return f"<ChangeEvent: {type(self.source).__name__} {', '.join(self.changes)}>"
+
+class Observable(object):
+    """
+    Base class for objects that notify subscribers of their changes.
+
+    Objects nobody subscribed to keep the class-level `_observers = None`, so the only cost
+    of a change is checking that attribute.
+    """
+
+    _observers = None
+
+    def subscribe(self, callback: Callable[[ChangeEvent], None]) -> Callable[[ChangeEvent], None]:
+        """
+        Calls `callback` with a ChangeEvent whenever this object changes.
+
+        Returns:
+            Callable: The callback, so that this can be used as a decorator.
+        """
+        if self._observers is None:
+            self._observers = []
+        self._observers.append(callback)
+        return callback
+
+    def unsubscribe(self, callback: Callable[[ChangeEvent], None]) -> None:
+        """Stops calling `callback`. Raises ValueError if it is not subscribed."""
+        if self._observers is None:
+            raise ValueError("Callback is not subscribed")
+        self._observers.remove(callback)
+        if not self._observers:
+            self._observers = None
+
+# Changes collected by the batch() calls running in each thread
+_local = threading.local()
+
+@contextmanager
+def batch() -> Iterator[None]:
+    """
+    Collects every change made inside the block and delivers them when it ends.
+
+    Changes to the same object are merged into one ChangeEvent holding each field's first
+    old value and last new value; fields that ended up unchanged are left out. Batches can be
+    nested, in which case events are delivered when the outermost one ends.
+
+    Example:
+        with batch():
+            player.giveExp(20000)
+            player.add_item_to_inventory("Potion", 5)
+        # one event for the player, one for its inventory, one for its leveling system
+    """
+    pending = getattr(_local, "pending", None)
+    if pending is not None:
+        yield
+        return
+    pending = _local.pending = {}
+    try:
+        yield
+    finally:
+        _local.pending = None
+        for source, changes in pending.values():
+            changes = {field: change for field, change in changes.items() if change[0] != change[1]}
+            if changes:
+                _dispatch(source, changes)
+
+def emit(source: Observable, field: str, old, new) -> None:
+    """
+    Reports that `field` of `source` changed from `old` to `new`.
+
+    Outside a batch the subscribers are called at once, unless the value did not change.
+    Callers should check `source._observers` first, so that nothing happens for objects
+    nobody subscribed to.
+    """
+    pending = getattr(_local, "pending", None)
+    if pending is None:
+        if old != new:
+            _dispatch(source, {field: (old, new)})
+        return
+    entry = pending.get(id(source))
+    if entry is None:
+        pending[id(source)] = (source, {field: (old, new)})
+    else:
+        changes = entry[1]
+        changes[field] = (changes[field][0], new) if field in changes else (old, new)
+
+def _dispatch(source: Observable, changes: Dict[str, Tuple[object, object]]) -> None:
+    """Calls every subscriber of `source` that is still subscribed."""
+    observers = source._observers
+    if observers:
+        event = ChangeEvent(source, changes)
+        for callback in list(observers):
+            callback(event)
@@ -7,6 +7,9 @@ applications.
 Inventory Module is creating and managing player inventories
 """
 
+# Import Events functionality
+from .Events import Observable, emit
+
 # META Data
 __author__ = 'CFDeadlines'
 __copyright__ = 'Copyright 2024, CFDeadlines'
@@ -24,15 +27,21 @@ class ItemNotInInventory(Exception):
 class InventoryIsFull(Exception):
     pass
 
-class Inventory(object):
+class Inventory(Observable):
     """
     Inventory class to manage the player's items and track inventory size.
 
+    Subscribers (see `Observable.subscribe`) get an "items" change for every add or remove.
+
     Attributes:
         items (list): A list to hold items in the inventory.
         max_size (int): The maximum number of items the inventory can hold.
+        dirty (bool): Whether items were added or removed since the flag was last cleared.
     """
 
+    # Whether the items list may be shared with a copy, see copy()
+    _shared = False
+
     def __init__(self, max_size=10):
         """
         Initializes an empty inventory with a maximum size.
@@ -42,6 +51,7 @@ class Inventory(object):
         """
         self.items = []
         self.max_size = max_size
+        self.dirty = False
 
     def add_item(self, item, quantity=1):
         """
@@ -62,8 +72,16 @@ class Inventory(object):
         if available_space < quantity:
             raise InventoryIsFull(f"Not enough space in inventory to add {quantity} '{item}'. Space remaining: {available_space}.")
 
+        observed = self._observers is not None
+        if observed:
+            old_items = tuple(self.items)
+        if self._shared:
+            self._unshare()
         for _ in range(quantity):
             self.items.append(item)
+        self.dirty = True
+        if observed:
+            emit(self, "items", old_items, tuple(self.items))
 
     def remove_item(self, item, quantity=1):
         """
@@ -85,8 +103,38 @@ class Inventory(object):
         if item_count < quantity:
             raise ItemNotInInventory(f"There are only {item_count} '{item}' in the inventory, but {quantity} were requested to be removed.")
 
+        observed = self._observers is not None
+        if observed:
+            old_items = tuple(self.items)
+        if self._shared:
+            self._unshare()
         for _ in range(quantity):
             self.items.remove(item)
+        self.dirty = True
+        if observed:
+            emit(self, "items", old_items, tuple(self.items))
+
+    def copy(self):
+        """
+        Returns a copy of the inventory that shares the item list until either one changes.
+
+        The list is copied by the first add_item or remove_item call on either inventory, so
+        copies that are never changed cost almost nothing.
+
+        Returns:
+            Inventory: The copy.
+        """
+        clone = Inventory.__new__(Inventory)
+        clone.items = self.items
+        clone.max_size = self.max_size
+        clone.dirty = self.dirty
+        clone._shared = self._shared = True
+        return clone
+
+    def _unshare(self):
+        """Gives this inventory its own item list before it is changed."""
+        self.items = list(self.items)
+        self._shared = False
 
     def get_inventory_max_size(self):
         """
@@ -10,7 +10,14 @@ experience is needed to next levels.
 
 # Built-in/Generic Imports
 import operator as op
-from functools import reduce
+import threading
+from bisect import bisect_right
+from functools import reduce, wraps
+from typing import Iterable, Tuple
+
+# Import Events functionality
+from .Events import Observable, batch, emit
+from .Dice import np, _require_numpy
 
 # META Data
 __author__ = 'CFDeadlines'
@@ -34,7 +41,107 @@ class DoNotRunDirectly(Exception):
 if __name__ == "__main__":
     raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
 
-class LevelingSystem(object):
+# Total experience required for each level, indexed by level. Grown on demand, up to _TABLE_LEVELS.
+# Only ever extended, under _thresholds_lock, so readers never need the lock
+_thresholds = []
+_thresholds_lock = threading.Lock()
+_TABLE_LEVELS = 1 << 16
+
+def _calculate_threshold(level):
+    """The threshold formula the leveling system has always used, including its float rounding."""
+    return int(1000 * (level + LevelingSystem.nCr(level, 2))) - (level * 1000)
+
+def _grow_thresholds(level):
+    """Extends the threshold table to include `level`, or as far as it goes."""
+    with _thresholds_lock:
+        missing = [_calculate_threshold(missing_level) for missing_level in range(len(_thresholds), min(level, _TABLE_LEVELS) + 1)]
+        _thresholds.extend(missing)
+
+def experience_for_level(level):
+    """
+    Returns the total experience points required to reach a level.
+
+    Thresholds are calculated once and kept in a table, so later calls are a list lookup.
+
+    Args:
+        level (int): The level.
+
+    Returns:
+        int: The experience points required to reach `level`.
+    """
+    if level < len(_thresholds):
+        return _thresholds[level]
+    if level > _TABLE_LEVELS:
+        return _calculate_threshold(level)
+    _grow_thresholds(level)
+    return _thresholds[level]
+
+def level_for_experience(xp):
+    """
+    Returns the level a player with `xp` total experience points has.
+
+    This is the level `giveExp` and `removeExp` step to one level at a time, found with a
+    binary search of the threshold table instead, so it takes the same time for any amount.
+
+    Args:
+        xp (int): The total experience points.
+
+    Returns:
+        int: The highest level whose threshold is at most `xp`, and at least 1.
+    """
+    # Grow the table until it holds a threshold above xp, doubling its size each time
+    while _thresholds[-1:] <= [xp] and len(_thresholds) <= _TABLE_LEVELS:
+        _grow_thresholds(max(2 * len(_thresholds), 64))
+    if _thresholds[-1] > xp:
+        return max(bisect_right(_thresholds, xp, 1) - 1, 1)
+
+    # Beyond the table, search the formula itself
+    low, high = _TABLE_LEVELS, 2 * _TABLE_LEVELS
+    while _calculate_threshold(high) <= xp:
+        low, high = high, 2 * high
+    while high - low > 1:
+        middle = (low + high) // 2
+        if _calculate_threshold(middle) <= xp:
+            low = middle
+        else:
+            high = middle
+    return low
+
+# NumPy copy of _thresholds, rebuilt whenever the table has grown
+_threshold_array = None
+
+def _thresholds_as_array():
+    """Returns the threshold table as an int64 NumPy array."""
+    global _threshold_array
+    if _threshold_array is None or len(_threshold_array) != len(_thresholds):
+        _threshold_array = np.array(_thresholds, dtype=np.int64)
+    return _threshold_array
+
+def _notifies_experience(method):
+    """
+    Wraps giveExp/removeExp so that subscribers get a single event for the whole change.
+
+    However many levels are crossed, the player's subscribers get one event with its
+    experience and level, and the leveling system's subscribers one event with experience,
+    level and nextLvlExperience. Nothing extra happens when nobody is subscribed.
+    """
+    @wraps(method)
+    def wrapper(self, xp):
+        player = self.player
+        if self._observers is None and getattr(player, "_observers", None) is None:
+            return method(self, xp)
+        with batch():
+            old = (player._experience, player.level, self.nextLvlExperience)
+            method(self, xp)
+            if getattr(player, "_observers", None) is not None:
+                emit(player, "experience", old[0], player._experience)
+            if self._observers is not None:
+                new = (player._experience, player.level, self.nextLvlExperience)
+                for field, before, after in zip(("experience", "level", "nextLvlExperience"), old, new):
+                    emit(self, field, before, after)
+    return wrapper
+
+class LevelingSystem(Observable):
     """
     A class to handle the leveling system for a player character in a DnD game.
 
@@ -60,6 +167,7 @@ class LevelingSystem(object):
         self.getCurrentExperience()  # Initialize current experience
         self.getExpForNextLevel()
 
+    @_notifies_experience
     def giveExp(self, xp):
         """
         Increments the experience points of the player.
@@ -72,11 +180,12 @@ class LevelingSystem(object):
             xp (int): The amount of experience points to add.
         """
         self.player._experience += xp
-        while self.LeveledUp():
-            self.levelUp()
-        else:
-            self.getExpForNextLevel()
+        level = level_for_experience(self.player._experience)
+        if level > self.player.level:
+            self.player.level = level
+        self.getExpForNextLevel()
 
+    @_notifies_experience
     def removeExp(self, xp):
         """
         Decrements the experience points of the player.
@@ -89,15 +198,17 @@ class LevelingSystem(object):
             xp (int): The amount of experience points to subtract.
         """
         self.player._experience -= xp
-        while self.LeveledDown():
-            if self.player.level == 1:
+        if self.LeveledDown():
+            level = level_for_experience(self.player._experience)
+            if level != self.player.level:
+                self.player.level = level
+                self.getExpForNextLevel()
+            if self.player._experience < experience_for_level(level):
+                # Still below the level 1 threshold: clamp to 0, leaving nextLvlExperience as it was
                 if xp > self.player._experience:
                     self.player._experience = 0
-                break
-            else:
-                self.levelDown()
-        else:
-            self.getExpForNextLevel()
+                return
+        self.getExpForNextLevel()
 
     def LeveledUp(self):
         """
@@ -137,14 +248,8 @@ class LevelingSystem(object):
 
         This method determines how much more experience the player needs to gain in order to level up.
         """
-        if self.player.level == 1:
-            # Experience needed to reach level 2
-            self.nextLvlExperience = 1000 - self.player._experience
-        else:
-            # Calculate total experience required to reach the next level
-            next_level_total_exp = int(1000 * ((self.player.level + 1) + LevelingSystem.nCr((self.player.level + 1), 2))) - ((self.player.level + 1) * 1000)
-            # Calculate remaining experience required to reach the next level
-            self.nextLvlExperience = next_level_total_exp - self.player._experience
+        # Level 2 needs 1000 experience, as does every level up to it
+        self.nextLvlExperience = experience_for_level(self.player.level + 1) - self.player._experience
 
     def getThresholdForNextLevel(self):
         """
@@ -153,7 +258,7 @@ class LevelingSystem(object):
         Returns:
             int: The experience points required to reach the next level.
         """
-        return int(1000 * ((self.player.level + 1) + LevelingSystem.nCr((self.player.level + 1), 2))) - ((self.player.level + 1) * 1000)
+        return experience_for_level(self.player.level + 1)
 
     def getThresholdForCurrentLevel(self):
         """
@@ -162,7 +267,7 @@ class LevelingSystem(object):
         Returns:
             int: The experience points required to reach the current level.
         """
-        return int(1000 * (self.player.level + LevelingSystem.nCr(self.player.level, 2))) - (self.player.level * 1000)
+        return experience_for_level(self.player.level)
 
     def levelUp(self):
         """
@@ -204,3 +309,77 @@ class LevelingSystem(object):
         numer = reduce(op.mul, range(n, n - r, -1), 1)
         denom = reduce(op.mul, range(1, r + 1), 1)
         return numer / denom
+
+    @staticmethod
+    def award_experience(experience, levels, awards) -> Tuple[object, object, object]:
+        """
+        Gives experience to many characters at once, as `giveExp` would give it to each.
+
+        New levels are found with `numpy.searchsorted` over the threshold table, so the cost
+        does not depend on how many levels anyone gains. As with `giveExp`, nobody loses a
+        level, even when given negative experience. Requires NumPy.
+
+        Args:
+            experience (array_like): The current experience of every character.
+            levels (array_like): The current level of every character.
+            awards (array_like or int): The experience to give each character, or one amount for all.
+
+        Returns:
+            tuple: Int64 arrays of the new experience, new levels and nextLvlExperience.
+        """
+        _require_numpy()
+        experience, levels = np.broadcast_arrays(np.asarray(experience, dtype=np.int64) + np.asarray(awards, dtype=np.int64),
+                                                 np.asarray(levels, dtype=np.int64))
+        if experience.size == 0:
+            return experience.copy(), levels.copy(), experience.copy()
+
+        # Grow the table past every total and next level, as far as it goes
+        level_for_experience(int(experience.max()))
+        experience_for_level(int(levels.max()) + 1)
+        thresholds = _thresholds_as_array()
+
+        reached = np.maximum(np.searchsorted(thresholds, experience, side="right") - 1, 1)
+        beyond = np.flatnonzero(experience >= thresholds[-1])
+        if beyond.size:
+            reached[beyond] = [level_for_experience(int(xp)) for xp in experience[beyond]]
+        new_levels = np.maximum(levels, reached)
+
+        following = new_levels + 1
+        next_thresholds = thresholds[np.minimum(following, len(thresholds) - 1)]
+        beyond = np.flatnonzero(following >= len(thresholds))
+        if beyond.size:
+            next_thresholds[beyond] = [experience_for_level(int(level)) for level in following[beyond]]
+        return experience.copy(), new_levels, next_thresholds - experience
+
+    @staticmethod
+    def award_players(players: Iterable, awards) -> None:
+        """
+        Gives experience to many players at once, with the same results as calling `giveExp` on each.
+
+        The new experience and levels are calculated together by `award_experience` and then
+        written back in one pass. Players with change subscribers go through `giveExp`, so
+        that their subscribers still get their events. Requires NumPy.
+
+        Args:
+            players (Iterable[Player]): The players, Player or CompactPlayer.
+            awards (array_like or int): The experience to give each player, or one amount for all.
+        """
+        _require_numpy()
+        players = list(players)
+        count = len(players)
+        awards = np.broadcast_to(np.asarray(awards, dtype=np.int64), (count,))
+        experience, levels, next_level = LevelingSystem.award_experience(
+            np.fromiter((player._experience for player in players), dtype=np.int64, count=count),
+            np.fromiter((player.level for player in players), dtype=np.int64, count=count),
+            awards)
+
+        for player, xp, level, remaining, award in zip(players, experience.tolist(), levels.tolist(),
+                                                       next_level.tolist(), awards.tolist()):
+            leveling_system = player.leveling_system
+            if leveling_system._observers is not None or getattr(player, "_observers", None) is not None:
+                leveling_system.giveExp(award)
+                continue
+            player._experience = xp
+            if level != player.level:
+                player.level = level
+            leveling_system.nextLvlExperience = remaining
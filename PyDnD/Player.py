@@ -10,14 +10,17 @@ that pertains strictly to the Player Character.
 
 # Built-in/Generic Imports
 import json
-from uuid import uuid4
+import os
+from uuid import UUID, uuid4
 import math
 import warnings
 
 # Import LevelingSystem
-from .LevelingSystem import LevelingSystem
+from .LevelingSystem import LevelingSystem, level_for_experience
 from .Roll import Roll
 from .Inventory import Inventory, ItemNotInInventory, InventoryIsFull
+from .DerivedStat import derived_stat, install_derived_stats
+from .Events import Observable, batch, emit
 
 # META Data
 __author__ = 'CFDeadlines'
@@ -42,7 +45,60 @@ if __name__ == "__main__":
     raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
 
 
-class Player(object):
+def _roll_ability():
+    """Rolls an unspecified ability score the same way Player does, 4d6 drop the lowest."""
+    return Roll.roll(4, 6, drop_lowest=1)
+
+# Validated string fields, as (attribute, name used in error messages)
+_STRING_FIELDS = (
+    ("name", "Name"),
+    ("age", "Age"),
+    ("gender", "Gender"),
+    ("description", "Description"),
+    ("biography", "Biography"),
+)
+
+# Validated integer fields, as (attribute, name used in error messages, lowest allowed value,
+# error message when lower, value stored for None). A None default keeps None; a callable is
+# called for a fresh value. The messages match the Player setters exactly.
+_INTEGER_FIELDS = (
+    ("level", "Level", 1, "Level cannot be lower than 1", None),
+    ("wealth", "Wealth", 0, "Wealth cannot be negative", None),
+    ("strength", "Strength", 0, "Strength can not be negative", _roll_ability),
+    ("dexterity", "Dexterity", 0, "Dexterity can not be negative", _roll_ability),
+    ("constitution", "Constitution", 0, "Constitution can not be negative", _roll_ability),
+    ("wisdom", "Wisdom", 0, "Wisdom can not be negative", _roll_ability),
+    ("intelligence", "Intelligence", 0, "Wisdom can not be negative", _roll_ability),
+    ("charisma", "Charisma", 0, "Charisma can not be negative", _roll_ability),
+    ("hp", "HP", 1, "HP can not be negative or 0", 1),
+    ("mp", "MP", 0, "MP can not be negative", 0),
+    ("skillpoints", "Skillpoints", 0, "Skillpoints can not be negative", 0),
+    ("featpoints", "Featpoints", 0, "Featpoints can not be negative", 0),
+)
+
+# Instance attributes that hold the Player fields, mapped to the field each one stores
+_TRACKED_ATTRIBUTES = {f"_Player__{field}": field for field in (
+    "uid", "name", "age", "gender", "description", "biography", "alignment", "level", "wealth", "strength",
+    "dexterity", "constitution", "wisdom", "intelligence", "charisma", "hp", "mp", "skillpoints", "featpoints")}
+_TRACKED_ATTRIBUTES.update(_experience="experience", inventory="inventory")
+
+class PlayerSnapshot(object):
+    """
+    A saved Player state, returned by `Player.snapshot` and restored by `Player.rollback`.
+
+    Holds references to the player's field values and item list rather than copies; the
+    inventory copies its list before its next change.
+    """
+
+    __slots__ = ("player", "state", "items", "next_level")
+
+    def __init__(self, player, state, items, next_level):
+        self.player = player
+        self.state = state
+        self.items = items
+        self.next_level = next_level
+
+class Player(Observable):
     """Player Object deals with all aspects of the player character
     
     Player Object deals with all aspects of the player character to include
@@ -72,12 +128,18 @@ class Player(object):
         charisma     (int): Player character's starting charisma Ability Score
         hp           (int): Player character's starting hitpoint value
         mp           (int): Player character's starting mp value (may convert to SPD)
+        uid         (UUID): Player character's unique id, generated if omitted
         
     Returns:
         This object returns nothing.  Instead all Args populate self.argname
     """
 
     # Class Attributes
+    # Field values recorded by mark_clean(); None until a player is first marked clean
+    _clean = None
+
+    ABILITIES = ("strength", "dexterity", "constitution", "wisdom", "intelligence", "charisma")
+
     VALID_ALIGNMENTS = {
             "LG":"Lawful Good",
             "NG":"Neutral Good",
@@ -108,7 +170,8 @@ class Player(object):
         charisma:           int = None,
         hp:                 int = 1,
         mp:                 int = 0,
-        inventory_size:     int = 10):
+        inventory_size:     int = 10,
+        uid:                UUID = None):
         """Object Initialization
     
         Object initialization, grabs all given Args and sets them to self.argname
@@ -118,7 +181,7 @@ class Player(object):
         Returns:
             Nothing
         """
-        self.uid = uuid4()
+        self.uid = uid if uid is not None else uuid4()
         self.name = name
         self.age = age
         self.gender = gender
@@ -253,17 +316,14 @@ class Player(object):
             value (int): The new experience value to set for the player.
         """
         self._experience = value
+
+        # Move straight to the level this much experience reaches, up or down
+        level = level_for_experience(value)
+        if level != self.level:
+            self.level = level
         # Recalculate experience needed for the next level
         self.leveling_system.getExpForNextLevel()
 
-        # Check for level up
-        while self.leveling_system.LeveledUp():
-            self.leveling_system.levelUp()
-
-        # Check for level down
-        while self.leveling_system.LeveledDown():
-            self.leveling_system.levelDown()  
-
     @property
     def nextLvlExperience(self):
         """
@@ -476,16 +536,250 @@ class Player(object):
         """This will be removed in version 1.1.0"""
         self.leveling_system.levelDown()
 
-    # Serialization/Deserialization
-    # Json
-    def serialize_to_json(self, filepath):
+    # Derived Statistics
+    # Cached until strength, level, ... is set again; see DerivedStat. Subclasses can add their own.
+    # The LevelingSystem changes experience without its setter, so nothing can depend on it.
+    _VOLATILE_ATTRIBUTES = ("experience",)
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        install_derived_stats(cls)
+
+    @derived_stat("strength")
+    def strength_modifier(self):
+        return self.get_modifier(self.strength)
+
+    @derived_stat("dexterity")
+    def dexterity_modifier(self):
+        return self.get_modifier(self.dexterity)
+
+    @derived_stat("constitution")
+    def constitution_modifier(self):
+        return self.get_modifier(self.constitution)
+
+    @derived_stat("wisdom")
+    def wisdom_modifier(self):
+        return self.get_modifier(self.wisdom)
+
+    @derived_stat("intelligence")
+    def intelligence_modifier(self):
+        return self.get_modifier(self.intelligence)
+
+    @derived_stat("charisma")
+    def charisma_modifier(self):
+        return self.get_modifier(self.charisma)
+
+    @derived_stat("level")
+    def proficiency_bonus(self):
+        """Proficiency bonus for the player's level: +2 at level 1, rising by 1 every 4 levels."""
+        return 2 + (self.level - 1) // 4
+
+    @derived_stat("dexterity_modifier")
+    def armor_class(self):
+        """Unarmored armor class, 10 + dexterity modifier."""
+        return 10 + self.dexterity_modifier
+
+    @derived_stat("dexterity_modifier")
+    def initiative(self):
+        """Initiative bonus, the dexterity modifier."""
+        return self.dexterity_modifier
+
+    # Change Events
+    def subscribe(self, callback):
         """
-        Serializes the Player object, including the inventory, into a JSON file.
+        Calls `callback` with a ChangeEvent whenever a field of this player changes.
+
+        Setters only start reporting changes once someone subscribes to a player of this
+        class, so players nobody observes never pay for it. Inside `batch()`, or during a
+        single giveExp/removeExp, changes are merged into one event. Inventory and leveling
+        changes are reported by `self.inventory` and `self.leveling_system`.
+
+        Returns:
+            Callable: The callback, so that this can be used as a decorator.
+        """
+        _install_notifications(type(self))
+        return super().subscribe(callback)
+
+    # Snapshots
+    def snapshot(self):
+        """
+        Records the current state of the player for a later `rollback`.
+
+        Field values are shared rather than copied, since they never change in place. The
+        item list is shared too, and copied by the inventory before its next change.
+
+        Returns:
+            PlayerSnapshot: The saved state.
+        """
+        self.inventory._shared = True
+        return PlayerSnapshot(self, dict(self.__dict__), self.inventory.items, self.leveling_system.nextLvlExperience)
+
+    def rollback(self, snapshot):
+        """
+        Restores the state recorded by `snapshot`.
+
+        Only attributes that were replaced since the snapshot are written back, and cached
+        derived stats are restored along with the fields they were calculated from. Dirty
+        tracking still compares against the last `mark_clean`, so rolled back changes are
+        saved correctly.
 
         Args:
-            filepath (str): The file path where the JSON will be saved.
+            snapshot (PlayerSnapshot): A snapshot taken from this player.
+
+        Raises:
+            ValueError: If the snapshot was taken from a different player.
+        """
+        if snapshot.player is not self:
+            raise ValueError("Snapshot was taken from a different player")
+        state, saved = self.__dict__, snapshot.state
+        clean, observers = state.get('_clean'), state.get('_observers')
+        restored = []
+        for attribute, value in saved.items():
+            if state.get(attribute) is not value:
+                restored.append((attribute, state.get(attribute)))
+                state[attribute] = value
+        if len(state) != len(saved):
+            for attribute in [attribute for attribute in state if attribute not in saved]:
+                del state[attribute]
+        for attribute, value in (('_clean', clean), ('_observers', observers)):
+            if value is not None:
+                state[attribute] = value
+            else:
+                state.pop(attribute, None)
+
+        if observers is not None:
+            with batch():
+                for attribute, old in restored:
+                    field = _TRACKED_ATTRIBUTES.get(attribute)
+                    if field is not None and field != 'inventory':
+                        emit(self, field, old, state[attribute])
+
+        inventory = self.inventory
+        if inventory.items is not snapshot.items:
+            inventory.items = snapshot.items
+            inventory._shared = True
+            inventory.dirty = True
+        self.leveling_system.nextLvlExperience = snapshot.next_level
+
+    def fork(self):
+        """
+        Returns an independent copy of the player, much cheaper than `copy.deepcopy`.
+
+        The copy shares every field value and the item list with this player; the item list is
+        copied by whichever inventory changes first. The copy gets its own LevelingSystem, and
+        keeps the uid.
+
+        Returns:
+            Player: The copy.
         """
-        player_data = {
+        clone = type(self).__new__(type(self))
+        state = clone.__dict__
+        state.update(self.__dict__)
+        inventory = state['inventory'] = self.inventory.copy()
+        leveling_system = state['leveling_system'] = LevelingSystem.__new__(LevelingSystem)
+        leveling_system.player = clone
+        leveling_system.nextLvlExperience = self.leveling_system.nextLvlExperience
+        if self._clean is not None and self._clean['inventory'] is self.inventory:
+            state['_clean'] = dict(self._clean, inventory=inventory)
+        # Subscribers follow this player, not its copies
+        state.pop('_observers', None)
+        return clone
+
+    # Dirty Tracking
+    def mark_clean(self):
+        """
+        Starts (or restarts) dirty tracking, e.g. once the player has been saved.
+
+        Records the current value of every field, so that `get_dirty_fields` can report what
+        changed since. Nothing is added to the setters, so tracking costs nothing until the
+        changes are asked for.
+        """
+        state = self.__dict__
+        self._clean = {attribute: state.get(attribute) for attribute in _TRACKED_ATTRIBUTES}
+        # Held by the leveling system and inventory rather than the player
+        self._clean['nextLvlExperience'] = self.leveling_system.nextLvlExperience
+        self._clean['inventory_size'] = self.inventory.max_size
+        self.inventory.dirty = False
+
+    def get_dirty_fields(self):
+        """
+        Returns the fields changed since the last `mark_clean`.
+
+        Changes made through the setters and by the leveling system are found by comparing
+        against the recorded values, as are `nextLvlExperience` and the inventory's
+        `max_size`. The inventory is dirty once it is replaced or items are added or removed
+        through its methods. `nextLvlExperience` is also included whenever the level or
+        experience changed. Before the player is first marked clean, every field is reported.
+
+        Returns:
+            set: The changed fields, named as in `to_dict`.
+        """
+        if self._clean is None:
+            return set(self.to_dict()) - {'uid'}
+        state, clean = self.__dict__, self._clean
+        dirty = {field for attribute, field in _TRACKED_ATTRIBUTES.items() if state.get(attribute) != clean[attribute]}
+        if 'inventory' in dirty:
+            dirty.add('inventory_size')
+        elif self.inventory.dirty:
+            dirty.add('inventory')
+        if self.inventory.max_size != clean['inventory_size']:
+            dirty.add('inventory_size')
+        if ('level' in dirty or 'experience' in dirty
+                or self.leveling_system.nextLvlExperience != clean['nextLvlExperience']):
+            dirty.add('nextLvlExperience')
+        return dirty
+
+    # Bulk Generation
+    @staticmethod
+    def generate_many(n, columnar=False, rng=None, **defaults):
+        """
+        Generates `n` characters at once, e.g. to populate a world with NPCs.
+
+        Ability scores that are not given in `defaults` are rolled with 4d6 drop the lowest,
+        all 6*n of them in one batched draw, and uids are generated from a single
+        os.urandom call instead of one uuid4() per character.
+
+        Args:
+            n (int): Number of characters to generate.
+            columnar (bool, optional): Return a PlayerTable instead of a list of Players. Default is False.
+            rng (RandomBackend, optional): Random backend to roll ability scores with. Default is the module default backend.
+            **defaults: Player arguments shared by every character, e.g. level=3 or alignment="CE".
+
+        Returns:
+            list or PlayerTable: The generated characters.
+
+        Example:
+            goblins = Player.generate_many(1000, alignment="NE", level=2)
+            orcs = Player.generate_many(1000000, columnar=True, alignment="CE")
+        """
+        if n < 0:
+            raise ValueError("Number of characters cannot be negative.")
+        if "uid" in defaults:
+            raise ValueError("generate_many creates a new uid for every character, so uid cannot be given.")
+        if columnar:
+            # Imported here since PlayerTable is built on top of Player
+            from .PlayerTable import PlayerTable
+            return PlayerTable.from_columns(n, rng=rng, **defaults)
+
+        abilities = [ability for ability in Player.ABILITIES if defaults.get(ability) is None]
+        # Abilities given as None are rolled like the ones left out
+        defaults = {key: value for key, value in defaults.items() if key not in abilities}
+        scores = Roll.roll_abilities(n * len(abilities), rng=rng)
+        rows = zip(*[iter(scores)] * len(abilities)) if abilities else [()] * n
+        raw = os.urandom(16 * n)
+        return [Player(uid=UUID(bytes=raw[index * 16:index * 16 + 16], version=4), **defaults, **dict(zip(abilities, row)))
+                for index, row in enumerate(rows)]
+
+    # Serialization/Deserialization
+    # Dictionaries
+    def to_dict(self):
+        """
+        Returns the Player object, including the inventory, as a JSON-compatible dictionary.
+
+        Returns:
+            dict: The player data, with the same keys that `serialize_to_json` writes.
+        """
+        return {
             'uid': str(self.uid),
             'name': self.name,
             'age': self.age,
@@ -508,8 +802,79 @@ class Player(object):
             'skillpoints': self.skillpoints,
             'featpoints': self.featpoints,
             'inventory': self.inventory.items,  # Assuming inventory is a list of items
+            'inventory_size': self.inventory.max_size,
         }
 
+    @classmethod
+    def from_dict(cls, player_data, trusted=False):
+        """
+        Rebuilds a Player object from a dictionary returned by `to_dict`.
+
+        Unlike `deserialize_from_json`, the uid and the experience needed for the next level
+        are restored as well.
+
+        With `trusted=True`, meant for data this library wrote itself, the constructor is
+        skipped: the whole record is checked in one pass against a schema compiled from the
+        field rules, and the values are then stored directly, with the inventory restored in
+        one step. The same ValueErrors as the setters are raised for invalid values.
+
+        Args:
+            player_data (dict): The player data. The uid may be a string or a UUID.
+            trusted (bool, optional): Use the fast load path. Default is False.
+
+        Returns:
+            Player: The reconstructed Player object.
+        """
+        if trusted and issubclass(cls, Player):
+            player = cls.__new__(cls)
+            _load_record(player, player_data)
+            return player
+
+        uid = player_data.get('uid')
+        player = cls(
+            name=player_data.get('name'),
+            age=player_data.get('age'),
+            gender=player_data.get('gender'),
+            alignment=player_data.get('alignment'),
+            description=player_data.get('description'),
+            biography=player_data.get('biography'),
+            level=player_data.get('level'),
+            wealth=player_data.get('wealth'),
+            strength=player_data.get('strength'),
+            dexterity=player_data.get('dexterity'),
+            constitution=player_data.get('constitution'),
+            wisdom=player_data.get('wisdom'),
+            intelligence=player_data.get('intelligence'),
+            charisma=player_data.get('charisma'),
+            hp=player_data.get('hp'),
+            mp=player_data.get('mp'),
+            inventory_size=player_data.get('inventory_size', 10),
+            uid=UUID(uid) if isinstance(uid, str) else uid
+        )
+
+        # Set experience and skill/feat points
+        if player_data.get('experience') is not None:
+            player._experience = player_data['experience']
+        if player_data.get('nextLvlExperience') is not None:
+            player.leveling_system.nextLvlExperience = player_data['nextLvlExperience']
+        player.skillpoints = player_data.get('skillpoints')
+        player.featpoints = player_data.get('featpoints')
+
+        # Reconstruct the inventory
+        for item in player_data.get('inventory', []):
+            player.add_item_to_inventory(item)
+        return player
+
+    # Json
+    def serialize_to_json(self, filepath):
+        """
+        Serializes the Player object, including the inventory, into a JSON file.
+
+        Args:
+            filepath (str): The file path where the JSON will be saved.
+        """
+        player_data = self.to_dict()
+
         with open(filepath, 'w') as json_file:
             json.dump(player_data, json_file, indent=4)
 
@@ -528,12 +893,14 @@ class Player(object):
         return math.floor(stat/2)-5
 
     @staticmethod
-    def deserialize_from_json(filepath):
+    def deserialize_from_json(filepath, trusted=False):
         """
         Deserializes the Player object from a JSON file.
 
         Args:
             filepath (str): The file path where the JSON is stored.
+            trusted (bool, optional): Load through the fast path of `from_dict`, which also
+                restores the saved uid. Default is False.
 
         Returns:
             Player: The reconstructed Player object.
@@ -541,6 +908,11 @@ class Player(object):
         with open(filepath, 'r') as json_file:
             player_data = json.load(json_file)
 
+        if trusted:
+            player = Player.from_dict(player_data, trusted=True)
+            print(f"Player data deserialized from {filepath}")
+            return player
+
         # Create a new Player object and populate its fields
         player = Player(
             name=player_data.get('name'),
@@ -559,7 +931,7 @@ class Player(object):
             charisma=player_data.get('charisma'),
             hp=player_data.get('hp'),
             mp=player_data.get('mp'),
-            inventory_size=10  # Set a default or modify based on the data if needed
+            inventory_size=player_data.get('inventory_size', 10)
         )
 
         # Set experience and skill/feat points
@@ -598,4 +970,117 @@ class Player(object):
         
     @staticmethod
     def __validate_alignment(alignment_key):
-        return alignment_key in Player.VALID_ALIGNMENTS
\ No newline at end of file
+        return alignment_key in Player.VALID_ALIGNMENTS
+
+def _compile_record_schema():
+    """
+    Compiles the Player field rules into a single function for `from_dict(trusted=True)`.
+
+    The returned function checks every field of a record in one pass, with the same rules
+    and messages as the setters, and stores the values straight into a Player's attributes.
+    """
+    strings = tuple((field, f"_Player__{field}", f"{label} must be a string") for field, label in _STRING_FIELDS)
+    integers = tuple((field, f"_Player__{field}", f"{label} must be an integer", minimum, message,
+                      default if callable(default) else None, None if callable(default) else default)
+                     for field, label, minimum, message, default in _INTEGER_FIELDS if field != "level")
+
+    def load_record(player, player_data):
+        state = player.__dict__
+        get = player_data.get
+        for field, attribute, error in strings:
+            value = get(field)
+            if value is not None and not isinstance(value, str):
+                raise ValueError(error)
+            state[attribute] = value
+
+        alignment = get('alignment')
+        if alignment is not None:
+            if not isinstance(alignment, str):
+                raise ValueError("Alignment must be a string")
+            alignment = alignment.upper()
+            if alignment not in Player.VALID_ALIGNMENTS:
+                raise ValueError("Alignment must be a valid two-letter code(e.g., LE, NG, CG)")
+        state['_Player__alignment'] = alignment
+
+        level = get('level')
+        if level is None:
+            level = 1
+        elif not isinstance(level, int):
+            raise ValueError("Level must be an integer")
+        elif level < 1:
+            raise ValueError("Level cannot be lower than 1")
+        state['_Player__level'] = level
+
+        for field, attribute, error, minimum, message, roll, default in integers:
+            value = get(field)
+            if value is None:
+                value = roll() if roll is not None else default
+            elif not isinstance(value, int):
+                raise ValueError(error)
+            elif value < minimum:
+                raise ValueError(message)
+            state[attribute] = value
+
+        experience = get('experience')
+        if experience is not None and not isinstance(experience, int):
+            raise ValueError("Experience must be an integer")
+        next_level = get('nextLvlExperience')
+        if next_level is not None and not isinstance(next_level, int):
+            raise ValueError("Next level experience must be an integer")
+        inventory_size = get('inventory_size', 10)
+        if not isinstance(inventory_size, int):
+            raise ValueError("Inventory size must be an integer")
+        items = get('inventory') or []
+        if len(items) > inventory_size:
+            raise InventoryIsFull(f"Not enough space in inventory for {len(items)} items. Space remaining: {inventory_size}.")
+
+        uid = get('uid')
+        state['_Player__uid'] = UUID(uid) if isinstance(uid, str) else uid if uid is not None else uuid4()
+        if experience is not None and next_level is not None:
+            # Everything the leveling system would calculate is stored in the record
+            state['_experience'] = experience
+            leveling_system = state['leveling_system'] = LevelingSystem.__new__(LevelingSystem)
+            leveling_system.player = player
+            leveling_system.nextLvlExperience = next_level
+        else:
+            state['_experience'] = experience if experience is not None else 0
+            leveling_system = state['leveling_system'] = LevelingSystem(player)
+            if experience is None and level != 1:
+                state['_experience'] = leveling_system.getThresholdForCurrentLevel()
+                leveling_system.getExpForNextLevel()
+            if next_level is not None:
+                leveling_system.nextLvlExperience = next_level
+        inventory = state['inventory'] = Inventory(max_size=inventory_size)
+        inventory.items = list(items)
+
+    return load_record
+
+_load_record = _compile_record_schema()
+
+# Fields whose setters report changes to subscribers
+_NOTIFIED_FIELDS = tuple(field for field in _TRACKED_ATTRIBUTES.values() if field != "inventory")
+
+def _notifying_setter(fget, fset, field: str):
+    """Builds a setter that runs `fset` and reports the change when the player has subscribers."""
+    def setter(self, value):
+        if self._observers is None:
+            fset(self, value)
+            return
+        with batch():
+            old = fget(self)
+            fset(self, value)
+            emit(self, field, old, fget(self))
+    setter._notifies = True
+    return setter
+
+def _install_notifications(cls) -> None:
+    """Wraps the field setters of `cls` to report changes, the first time one of its players is subscribed to."""
+    for field in _NOTIFIED_FIELDS:
+        prop = getattr(cls, field)
+        fset = prop.fset
+        while fset is not None and not getattr(fset, "_notifies", False):
+            fset = getattr(fset, "__wrapped__", None)
+        if fset is None:
+            setattr(cls, field, property(prop.fget, _notifying_setter(prop.fget, prop.fset, field), None, prop.__doc__))
+
+install_derived_stats(Player)
\ No newline at end of file
@@ -0,0 +1,165 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+PlayerArchive Module gives read-only, memory-mapped access to large player save files,
+decoding only the fields that are actually read.
+"""
+
+# Built-in/Generic Imports
+import mmap
+import os
+from typing import Iterator, Optional
+from uuid import UUID
+
+# Import Player functionality
+from .Player import Player
+from .PlayerBinary import InvalidPlayerData, PlayerReader, _STRING_FIELDS, _INTEGER_FIELDS
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+class PlayerProxy(object):
+    """
+    A read-only view of one player in a `PlayerArchive`.
+
+    Every `Player.to_dict` field can be read as an attribute (`proxy.name`, `proxy.level`,
+    `proxy.inventory`, ...). A field is decoded from the archive the first time it is read
+    and kept afterwards; nothing else about the player is parsed. `to_player` builds the
+    full Player when one is needed.
+
+    Proxies read from the archive's memory map, so they must not be used after the archive
+    is closed. Fields cannot be changed; `to_player` returns an editable copy.
+    """
+
+    __slots__ = ("_reader", "_index", "_fields")
+
+    def __init__(self, reader: PlayerReader, index: int):
+        self._reader = reader
+        self._index = index
+        self._fields = {}
+
+    def get_inventory(self):
+        return self.inventory
+
+    get_modifier = Player.get_modifier
+
+    def to_dict(self) -> dict:
+        """Decodes every field, in the format of `Player.to_dict` with the uid as a UUID."""
+        return self._reader.read_dict(self._index)
+
+    def to_player(self, player_class=Player) -> Player:
+        """
+        Builds the full player.
+
+        Args:
+            player_class (type, optional): The class to rebuild, Player or CompactPlayer. Default is Player.
+
+        Returns:
+            Player: An independent, editable copy of the archived player.
+        """
+        return self._reader.read(self._index, player_class)
+
+    def __repr__(self):
+        return f"<PlayerProxy: {self.name} (level {self.level})>"
+
+def _field_getter(field: str):
+    """Builds a getter that decodes `field` on first access and caches it in the proxy."""
+    def getter(self):
+        fields = self._fields
+        try:
+            return fields[field]
+        except KeyError:
+            value = fields[field] = self._reader.read_field(self._index, field)
+            return value
+    return getter
+
+def _build_fields(cls) -> None:
+    """Generates a read-only, lazily decoded property for every archived field."""
+    for field in ("uid",) + _STRING_FIELDS + _INTEGER_FIELDS + ("inventory", "inventory_size"):
+        setattr(cls, field, property(_field_getter(field)))
+
+_build_fields(PlayerProxy)
+
+class PlayerArchive(object):
+    """
+    Read-only access to a file written by `save_players_binary`, without loading it.
+
+    The file is memory-mapped, so opening an archive only reads its header, and the operating
+    system pages in records and strings as they are used. Players are looked up by uid with a
+    binary search of the file's uid index and returned as `PlayerProxy` objects that decode a
+    field only when it is accessed.
+
+    Args:
+        filepath (str): The file path where the players are stored.
+
+    Raises:
+        InvalidPlayerData: If the file is not in a supported format.
+
+    Example:
+        with PlayerArchive("world.players") as archive:
+            character = archive[uid]
+            print(character.name, character.level)
+    """
+
+    def __init__(self, filepath: str):
+        self.filepath = filepath
+        with open(filepath, "rb") as players_file:
+            if os.fstat(players_file.fileno()).st_size == 0:
+                raise InvalidPlayerData("Buffer is too short to hold player data.")
+            self._map = mmap.mmap(players_file.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            self._reader = PlayerReader(self._map)
+        except InvalidPlayerData:
+            self._map.close()
+            raise
+
+    @staticmethod
+    def _uid_bytes(uid) -> bytes:
+        return (uid if isinstance(uid, UUID) else UUID(str(uid))).bytes
+
+    def __len__(self):
+        return len(self._reader)
+
+    def __contains__(self, uid):
+        return self._reader.find_uid(self._uid_bytes(uid)) is not None
+
+    def __getitem__(self, uid) -> PlayerProxy:
+        index = self._reader.find_uid(self._uid_bytes(uid))
+        if index is None:
+            raise KeyError(uid)
+        return PlayerProxy(self._reader, index)
+
+    def get(self, uid, default=None) -> Optional[PlayerProxy]:
+        """Returns the proxy for a uid (UUID or string), or `default` if it is not archived."""
+        try:
+            return self[uid]
+        except (KeyError, ValueError):
+            return default
+
+    def __iter__(self) -> Iterator[PlayerProxy]:
+        for index in range(len(self._reader)):
+            yield PlayerProxy(self._reader, index)
+
+    def close(self) -> None:
+        """Unmaps the file. Proxies from this archive cannot be used afterwards."""
+        self._reader.release()
+        self._map.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __repr__(self):
+        return f"<PlayerArchive: {self.filepath} ({len(self)} players)>"
@@ -0,0 +1,202 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+PlayerAsync Module saves and loads players from asyncio applications without blocking the
+event loop.
+"""
+
+# Built-in/Generic Imports
+import asyncio
+import json
+import os
+import tempfile
+from concurrent.futures import Executor, ThreadPoolExecutor
+from typing import Dict, Iterable, List
+
+# Import Player functionality
+from .Player import Player
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+# The process umask, read once at import since reading it means briefly changing it
+_UMASK = os.umask(0)
+os.umask(_UMASK)
+
+def _write_json(player_data: dict, filepath: str) -> None:
+    """
+    Encodes and writes player data in the `serialize_to_json` format, replacing the file atomically.
+
+    The file keeps the mode of the file it replaces, or gets the mode `open` would give a new
+    file, rather than the owner-only mode of the temporary file.
+    """
+    encoded = json.dumps(player_data, indent=4)
+    try:
+        mode = os.stat(filepath).st_mode & 0o7777
+    except FileNotFoundError:
+        mode = 0o666 & ~_UMASK
+    descriptor, temporary = tempfile.mkstemp(dir=os.path.dirname(filepath) or ".", suffix=".tmp")
+    try:
+        try:
+            json_file = os.fdopen(descriptor, 'w')
+        except BaseException:
+            os.close(descriptor)
+            raise
+        with json_file:
+            json_file.write(encoded)
+        os.chmod(temporary, mode)
+        os.replace(temporary, filepath)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+def _read_json(filepath: str, player_class, trusted: bool) -> Player:
+    """Reads and rebuilds a player saved by `_write_json` or `serialize_to_json`."""
+    with open(filepath, 'r') as json_file:
+        player_data = json.load(json_file)
+    return player_class.from_dict(player_data, trusted=trusted)
+
+class _PendingSave(object):
+    """The latest requested save of one uid to one file, and everyone waiting for it."""
+
+    def __init__(self, player_data: dict):
+        self.player_data = player_data
+        self.waiters = []
+
+class AsyncPlayerIO(object):
+    """
+    Saves and loads players from asyncio code, in the same JSON format as `serialize_to_json`.
+
+    Encoding and file I/O run in a bounded thread pool, so the event loop is never blocked
+    and nothing is printed. The player is copied with `to_dict` when `save` is called, so it
+    can keep changing while the write happens.
+
+    Saves of the same uid to the same file are coalesced. While one write of a player to a
+    file is running, any further saves of that player to that file wait together, and then
+    only the most recent one is written, once. Saves to different files are all written.
+    `load_many` loads players concurrently, with at most `max_concurrent_loads` in progress.
+
+    Args:
+        max_workers (int, optional): Threads used for encoding and I/O. Default is 4.
+        max_concurrent_loads (int, optional): Default limit for `load_many`. Default is 16.
+        executor (Executor, optional): Executor to use instead of creating a thread pool. It is
+            not shut down by `close`.
+
+    Example:
+        async with AsyncPlayerIO() as player_io:
+            await player_io.save(hero, "saves/hero.json")
+            party = await player_io.load_many(["saves/a.json", "saves/b.json"])
+    """
+
+    def __init__(self, max_workers: int = 4, max_concurrent_loads: int = 16, executor: Executor = None):
+        if max_concurrent_loads < 1:
+            raise ValueError("max_concurrent_loads must be greater than 0.")
+        self.max_concurrent_loads = max_concurrent_loads
+        self._owns_executor = executor is None
+        self._executor = executor if executor is not None else ThreadPoolExecutor(max_workers=max_workers)
+        self._pending: Dict[tuple, _PendingSave] = {}
+        self._writers: Dict[tuple, asyncio.Task] = {}
+
+    async def save(self, player: Player, filepath: str) -> None:
+        """
+        Saves a player, returning once a write including this state has finished.
+
+        Args:
+            player (Player): The player to save. CompactPlayers work as well.
+            filepath (str): The file path where the JSON will be saved.
+        """
+        player_data = player.to_dict()
+        player_data['inventory'] = list(player_data['inventory'])
+        key = (player.uid, os.path.abspath(filepath))
+
+        pending = self._pending.get(key)
+        if pending is None:
+            pending = self._pending[key] = _PendingSave(player_data)
+        else:
+            pending.player_data = player_data
+        waiter = asyncio.get_running_loop().create_future()
+        pending.waiters.append(waiter)
+        if key not in self._writers:
+            self._writers[key] = asyncio.ensure_future(self._write_pending(key, filepath))
+        await waiter
+
+    async def _write_pending(self, key: tuple, filepath: str) -> None:
+        """Writes the latest pending save of a (uid, path) key until no more saves are waiting."""
+        loop = asyncio.get_running_loop()
+        try:
+            while key in self._pending:
+                pending = self._pending.pop(key)
+                try:
+                    await loop.run_in_executor(self._executor, _write_json, pending.player_data, filepath)
+                except Exception as e:
+                    for waiter in pending.waiters:
+                        if not waiter.done():
+                            waiter.set_exception(e)
+                else:
+                    for waiter in pending.waiters:
+                        if not waiter.done():
+                            waiter.set_result(None)
+        finally:
+            del self._writers[key]
+
+    async def load(self, filepath: str, player_class=Player, trusted: bool = False) -> Player:
+        """
+        Loads a player saved by `save` or `serialize_to_json`, restoring its uid.
+
+        Args:
+            filepath (str): The file path where the JSON is stored.
+            player_class (type, optional): The class to rebuild, Player or CompactPlayer. Default is Player.
+            trusted (bool, optional): Use the fast load path of `Player.from_dict`. Default is False.
+
+        Returns:
+            Player: The loaded player.
+        """
+        return await asyncio.get_running_loop().run_in_executor(self._executor, _read_json, filepath,
+                                                                 player_class, trusted)
+
+    async def load_many(self, filepaths: Iterable[str], limit: int = None, player_class=Player,
+                        trusted: bool = False) -> List[Player]:
+        """
+        Loads many players concurrently.
+
+        Args:
+            filepaths (Iterable[str]): The files to load.
+            limit (int, optional): Most loads in progress at once. Default is `max_concurrent_loads`.
+            player_class (type, optional): The class to rebuild, Player or CompactPlayer. Default is Player.
+            trusted (bool, optional): Use the fast load path of `Player.from_dict`. Default is False.
+
+        Returns:
+            List[Player]: The players, in the order of `filepaths`.
+        """
+        semaphore = asyncio.Semaphore(limit if limit is not None else self.max_concurrent_loads)
+        async def load(filepath):
+            async with semaphore:
+                return await self.load(filepath, player_class, trusted)
+        return list(await asyncio.gather(*(load(filepath) for filepath in filepaths)))
+
+    async def flush(self) -> None:
+        """Waits for every save in progress to finish."""
+        while self._writers:
+            await asyncio.gather(*self._writers.values(), return_exceptions=True)
+
+    def close(self) -> None:
+        """Shuts down the thread pool, if this object created it."""
+        if self._owns_executor:
+            self._executor.shutdown(wait=True)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.flush()
+        self.close()
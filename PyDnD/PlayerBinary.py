@@ -0,0 +1,379 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+PlayerBinary Module saves and loads players in a compact, versioned binary format.
+"""
+
+# Built-in/Generic Imports
+import struct
+from typing import Iterable, Iterator, List, Optional
+from uuid import UUID
+
+# Import Player functionality
+from .Player import Player
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+################
+#  Exceptions  #
+################
+class InvalidPlayerData(ValueError):
+    pass
+
+# Fields stored as references into the string table, in record order
+_STRING_FIELDS = ("name", "age", "gender", "alignment", "description", "biography")
+
+# Fields stored as int64, in record order. None is recorded in the record's null mask.
+_INTEGER_FIELDS = ("level", "experience", "nextLvlExperience", "wealth", "strength", "dexterity", "constitution",
+                   "wisdom", "intelligence", "charisma", "hp", "mp", "skillpoints", "featpoints")
+
+_FILE_MAGIC = b"PDPL"
+_FILE_VERSION = 1
+
+# magic, version, flags, number of players, number of strings
+_HEADER = struct.Struct("<4sHHII")
+# Header flag set when the file ends with a uid index
+_FLAG_UID_INDEX = 1
+# Start of a string in the string blob
+_STRING_OFFSET = struct.Struct("<I")
+# Start and end of a string in the string blob, read from two neighbouring offsets
+_STRING_SPAN = struct.Struct("<II")
+# Position of a record in the buffer
+_RECORD_OFFSET = struct.Struct("<Q")
+# uid, string references (-1 for None), integers, null mask, inventory size, number of items
+_RECORD = struct.Struct(f"<16s{len(_STRING_FIELDS)}i{len(_INTEGER_FIELDS)}qHII")
+# Reference to an item name in the string table
+_ITEM = struct.Struct("<I")
+# uid and record index, one per player, sorted by uid
+_UID_ENTRY = struct.Struct("<16sI")
+
+# Positions of the string references and integers in an unpacked record
+_STRINGS_AT = slice(1, 1 + len(_STRING_FIELDS))
+_INTEGERS_AT = slice(_STRINGS_AT.stop, _STRINGS_AT.stop + len(_INTEGER_FIELDS))
+
+# Byte offset of every single field within a record, for reading one field on its own
+_STRING_AT = {field: 16 + 4 * position for position, field in enumerate(_STRING_FIELDS)}
+_INTEGER_AT = {field: 16 + 4 * len(_STRING_FIELDS) + 8 * position for position, field in enumerate(_INTEGER_FIELDS)}
+_NULL_MASK_AT = 16 + 4 * len(_STRING_FIELDS) + 8 * len(_INTEGER_FIELDS)
+_INVENTORY_SIZE_AT = _NULL_MASK_AT + 2
+_ITEM_COUNT_AT = _INVENTORY_SIZE_AT + 4
+_INT32 = struct.Struct("<i")
+_INT64 = struct.Struct("<q")
+_UINT16 = struct.Struct("<H")
+_UINT32 = struct.Struct("<I")
+
+def encode_players(players: Iterable[Player]) -> bytes:
+    """
+    Encodes players, including their inventories, into the binary format.
+
+    The encoding holds everything `serialize_to_json` writes. Each distinct string (names,
+    alignments, item names, ...) is stored once in a shared string table that records refer
+    to by index. Records have a fixed layout followed by their item references, and an
+    offset table allows any record to be decoded without reading the ones before it. A uid
+    index at the end lets a player be found by uid with a binary search.
+
+    Layout (little-endian):
+        header          magic "PDPL", version, flags, player count, string count
+        string table    (string count + 1) uint32 offsets into the blob, then the UTF-8 blob
+        record offsets  one uint64 per player, from the start of the buffer
+        records         uid, string references, int64 fields, null mask, inventory size,
+                        item count, then one uint32 string reference per item
+        uid index       16 uid bytes and the uint32 record index of every player, sorted by uid.
+                        Present when the header flags include 1.
+
+    Args:
+        players (Iterable[Player]): The players to encode. CompactPlayers work as well.
+
+    Returns:
+        bytes: The encoded players.
+
+    Raises:
+        InvalidPlayerData: If an inventory item is not a string.
+    """
+    strings = {}
+    def intern(value):
+        return -1 if value is None else strings.setdefault(value, len(strings))
+
+    records, uids = [], []
+    for player in players:
+        uids.append(player.uid.bytes)
+        player_data = player.to_dict()
+        null_mask = 0
+        integers = []
+        for bit, field in enumerate(_INTEGER_FIELDS):
+            value = player_data[field]
+            if value is None:
+                null_mask |= 1 << bit
+                value = 0
+            integers.append(value)
+        items = player_data["inventory"]
+        if not all(isinstance(item, str) for item in items):
+            raise InvalidPlayerData("Only string inventory items can be encoded.")
+        records.append(_RECORD.pack(player.uid.bytes, *(intern(player_data[field]) for field in _STRING_FIELDS),
+                                    *integers, null_mask, player_data["inventory_size"], len(items))
+                       + b"".join(_ITEM.pack(intern(item)) for item in items))
+
+    encoded = [value.encode("utf-8") for value in strings]
+    parts = [_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, _FLAG_UID_INDEX, len(records), len(encoded))]
+    position = 0
+    for value in encoded:
+        parts.append(_STRING_OFFSET.pack(position))
+        position += len(value)
+    parts.append(_STRING_OFFSET.pack(position))
+    parts.extend(encoded)
+
+    position = _HEADER.size + _STRING_OFFSET.size * (len(encoded) + 1) + position + _RECORD_OFFSET.size * len(records)
+    for record in records:
+        parts.append(_RECORD_OFFSET.pack(position))
+        position += len(record)
+    parts.extend(records)
+    parts.extend(_UID_ENTRY.pack(uid, index) for uid, index in sorted(zip(uids, range(len(uids)))))
+    return b"".join(parts)
+
+class _StringTable(dict):
+    """
+    The strings of a buffer by reference, each decoded from the buffer the first time it is used.
+
+    Reference -1, used for None, maps to None.
+    """
+
+    def __init__(self, buffer: memoryview, offsets_start: int, blob_start: int, count: int):
+        super().__init__({-1: None})
+        self._buffer = buffer
+        self._offsets_start = offsets_start
+        self._blob_start = blob_start
+        self._count = count
+
+    def __missing__(self, reference: int) -> str:
+        if not 0 <= reference < self._count:
+            raise InvalidPlayerData(f"String reference {reference} is out of range.")
+        start, end = _STRING_SPAN.unpack_from(self._buffer, self._offsets_start + _STRING_OFFSET.size * reference)
+        value = self[reference] = str(self._buffer[self._blob_start + start:self._blob_start + end], "utf-8")
+        return value
+
+class PlayerReader(object):
+    """
+    Decodes players from a buffer in the binary format written by `encode_players`.
+
+    Works directly on any bytes-like object (bytes, bytearray, mmap or memoryview) through a
+    memoryview: strings are decoded straight from the buffer and records are unpacked in
+    place, so no intermediate copies are made. Opening a reader only reads the header.
+    Records are decoded when they are asked for, and each string the first time a record
+    refers to it.
+
+    Args:
+        buffer (bytes-like): The encoded players.
+
+    Raises:
+        InvalidPlayerData: If the buffer is not in a supported format.
+
+    Example:
+        reader = PlayerReader(encode_players(roster))
+        print(len(reader), reader[10].name)
+    """
+
+    def __init__(self, buffer):
+        self._buffer = memoryview(buffer).cast("B")
+        try:
+            if len(self._buffer) < _HEADER.size:
+                raise InvalidPlayerData("Buffer is too short to hold player data.")
+            magic, version, flags, self._count, self._string_count = _HEADER.unpack_from(self._buffer, 0)
+            if magic != _FILE_MAGIC:
+                raise InvalidPlayerData("Buffer does not hold player data.")
+            if version != _FILE_VERSION:
+                raise InvalidPlayerData(f"Unsupported player data version {version}.")
+
+            self._string_offsets_start = _HEADER.size
+            self._blob_start = self._string_offsets_start + _STRING_OFFSET.size * (self._string_count + 1)
+            if len(self._buffer) < self._blob_start:
+                raise InvalidPlayerData("Buffer is too short to hold its string table.")
+            blob_size, = _STRING_OFFSET.unpack_from(self._buffer, self._blob_start - _STRING_OFFSET.size)
+            self._records_start = self._blob_start + blob_size
+
+            # Found by counting back from the end, since the records before it vary in size
+            self._uid_index_start = None
+            if flags & _FLAG_UID_INDEX:
+                self._uid_index_start = len(self._buffer) - _UID_ENTRY.size * self._count
+                if self._uid_index_start < self._records_start + _RECORD_OFFSET.size * self._count:
+                    raise InvalidPlayerData("Buffer is too short to hold its uid index.")
+        except InvalidPlayerData:
+            # Let go of the buffer straight away, so an mmap it came from can be closed
+            self._buffer.release()
+            raise
+
+        self._strings = _StringTable(self._buffer, self._string_offsets_start, self._blob_start, self._string_count)
+        # uid lookup for buffers without a uid index, built when first needed
+        self._uids = None
+
+    def __len__(self):
+        return self._count
+
+    def __getitem__(self, index: int) -> Player:
+        return self.read(index)
+
+    def __iter__(self) -> Iterator[Player]:
+        for index in range(self._count):
+            yield self.read(index)
+
+    def read(self, index: int, player_class=Player) -> Player:
+        """
+        Decodes one player.
+
+        Args:
+            index (int): Position of the player in the buffer. Negative values count from the end.
+            player_class (type, optional): The class to rebuild, Player or CompactPlayer. Default is Player.
+
+        Returns:
+            Player: The decoded player.
+        """
+        return player_class.from_dict(self.read_dict(index))
+
+    def read_dict(self, index: int) -> dict:
+        """Decodes one player into the dictionary `Player.to_dict` returns, with the uid as a UUID."""
+        position = self._position(index)
+        values = _RECORD.unpack_from(self._buffer, position)
+        strings = self._strings
+
+        player_data = {"uid": UUID(bytes=values[0])}
+        for field, reference in zip(_STRING_FIELDS, values[_STRINGS_AT]):
+            player_data[field] = strings[reference]
+        null_mask, inventory_size, item_count = values[-3:]
+        player_data.update(zip(_INTEGER_FIELDS, values[_INTEGERS_AT]))
+        if null_mask:
+            for bit, field in enumerate(_INTEGER_FIELDS):
+                if null_mask >> bit & 1:
+                    player_data[field] = None
+        if item_count:
+            items_start = position + _RECORD.size
+            player_data["inventory"] = [strings[reference] for reference, in
+                                        _ITEM.iter_unpack(self._buffer[items_start:items_start + _ITEM.size * item_count])]
+        else:
+            player_data["inventory"] = []
+        player_data["inventory_size"] = inventory_size
+        return player_data
+
+    def read_uid(self, index: int) -> bytes:
+        """Returns the 16 uid bytes of one player without decoding anything else."""
+        position = self._position(index)
+        return bytes(self._buffer[position:position + 16])
+
+    def read_field(self, index: int, field: str):
+        """
+        Decodes a single field of one player, reading only the bytes that hold it.
+
+        Args:
+            index (int): Position of the player in the buffer.
+            field (str): Any key of `Player.to_dict`, with the uid returned as a UUID.
+
+        Returns:
+            The value of the field.
+        """
+        position = self._position(index)
+        buffer = self._buffer
+        if field in _INTEGER_AT:
+            null_mask, = _UINT16.unpack_from(buffer, position + _NULL_MASK_AT)
+            if null_mask >> _INTEGER_FIELDS.index(field) & 1:
+                return None
+            return _INT64.unpack_from(buffer, position + _INTEGER_AT[field])[0]
+        if field in _STRING_AT:
+            reference, = _INT32.unpack_from(buffer, position + _STRING_AT[field])
+            return self._strings[reference]
+        if field == "uid":
+            return UUID(bytes=bytes(buffer[position:position + 16]))
+        if field == "inventory_size":
+            return _UINT32.unpack_from(buffer, position + _INVENTORY_SIZE_AT)[0]
+        if field == "inventory":
+            item_count, = _UINT32.unpack_from(buffer, position + _ITEM_COUNT_AT)
+            items_start = position + _RECORD.size
+            return [self._strings[reference] for reference, in
+                    _ITEM.iter_unpack(buffer[items_start:items_start + _ITEM.size * item_count])]
+        raise KeyError(field)
+
+    def find_uid(self, uid: bytes) -> Optional[int]:
+        """
+        Returns the index of the player with the given 16 uid bytes, or None if there is none.
+
+        Uses a binary search of the uid index. Buffers written without one are scanned for
+        their uids once, the first time this is called.
+        """
+        if self._uid_index_start is None:
+            if self._uids is None:
+                read_uid = self.read_uid
+                self._uids = {read_uid(index): index for index in range(self._count)}
+            return self._uids.get(uid)
+
+        buffer, start, size = self._buffer, self._uid_index_start, _UID_ENTRY.size
+        low, high = 0, self._count
+        while low < high:
+            middle = (low + high) // 2
+            if _UID_ENTRY.unpack_from(buffer, start + size * middle)[0] < uid:
+                low = middle + 1
+            else:
+                high = middle
+        if low < self._count:
+            found, index = _UID_ENTRY.unpack_from(buffer, start + size * low)
+            if found == uid:
+                return index
+        return None
+
+    def release(self) -> None:
+        """Releases the underlying buffer, so that an mmap it came from can be closed."""
+        self._buffer.release()
+
+    def _position(self, index: int) -> int:
+        """Returns the byte position of a record, checking the index."""
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Player index out of range")
+        return _RECORD_OFFSET.unpack_from(self._buffer, self._records_start + _RECORD_OFFSET.size * index)[0]
+
+def decode_players(buffer, player_class=Player) -> List[Player]:
+    """
+    Decodes every player in a buffer written by `encode_players`.
+
+    Args:
+        buffer (bytes-like): The encoded players.
+        player_class (type, optional): The class to rebuild, Player or CompactPlayer. Default is Player.
+
+    Returns:
+        List[Player]: The decoded players, in the order they were encoded.
+    """
+    reader = PlayerReader(buffer)
+    return [reader.read(index, player_class) for index in range(len(reader))]
+
+def save_players_binary(players: Iterable[Player], filepath: str) -> None:
+    """
+    Writes players to a file in the binary format.
+
+    Args:
+        players (Iterable[Player]): The players to save.
+        filepath (str): The file path where the players will be saved.
+    """
+    with open(filepath, "wb") as players_file:
+        players_file.write(encode_players(players))
+
+def load_players_binary(filepath: str, player_class=Player) -> List[Player]:
+    """
+    Reads every player from a file written by `save_players_binary`.
+
+    Args:
+        filepath (str): The file path where the players are stored.
+        player_class (type, optional): The class to rebuild, Player or CompactPlayer. Default is Player.
+
+    Returns:
+        List[Player]: The players.
+    """
+    with open(filepath, "rb") as players_file:
+        return decode_players(players_file.read(), player_class)
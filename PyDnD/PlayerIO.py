@@ -0,0 +1,86 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+PlayerIO Module saves and loads many players at once as JSON Lines, one player per line.
+"""
+
+# Built-in/Generic Imports
+import json
+from typing import Iterable, Iterator
+
+# Import Player functionality
+from .Player import Player
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+# Size of the write buffer used by dump_players
+WRITE_BUFFER_SIZE = 1 << 20
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+def dump_players(players: Iterable[Player], filepath: str) -> int:
+    """
+    Writes players to a JSON Lines file, one `Player.to_dict` object per line.
+
+    Players are encoded one at a time through a single buffered file handle, so any
+    iterable (including a generator) can be saved without holding every record in memory.
+
+    Args:
+        players (Iterable[Player]): The players to save. CompactPlayers work as well.
+        filepath (str): The file path where the players will be saved.
+
+    Returns:
+        int: The number of players written.
+
+    Example:
+        dump_players(roster, "roster.jsonl")
+        for player in iter_players("roster.jsonl"):
+            print(player.name)
+    """
+    count = 0
+    with open(filepath, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as players_file:
+        write = players_file.write
+        for player in players:
+            write(_encode(player.to_dict()))
+            write("\n")
+            count += 1
+    return count
+
+def iter_players(filepath: str, player_class=Player) -> Iterator[Player]:
+    """
+    Reads players from a JSON Lines file written by `dump_players`, one at a time.
+
+    This is a generator: only the current line is held in memory, so files of any size can be
+    streamed. Blank lines are skipped.
+
+    Args:
+        filepath (str): The file path where the players are stored.
+        player_class (type, optional): The class to rebuild, Player or CompactPlayer. Default is Player.
+
+    Yields:
+        Player: Each player, with its uid restored.
+
+    Raises:
+        ValueError: If a line is not valid JSON.
+    """
+    from_dict = player_class.from_dict
+    with open(filepath, "r", encoding="utf-8") as players_file:
+        for line_number, line in enumerate(players_file, 1):
+            if not line.strip():
+                continue
+            try:
+                player_data = json.loads(line)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"{filepath} line {line_number} is not valid JSON: {e}") from None
+            yield from_dict(player_data)
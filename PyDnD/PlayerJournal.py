@@ -0,0 +1,183 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+PlayerJournal Module saves players to an append-only change log, writing only the fields
+that changed since the last save.
+"""
+
+# Built-in/Generic Imports
+import json
+import os
+from typing import Dict, Iterable, List
+
+# Import Player functionality
+from .Player import Player
+from .PlayerIO import _encode
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+class PlayerJournal(object):
+    """
+    An append-only change log of players, stored as JSON Lines.
+
+    The first time a player is saved, its full `Player.to_dict` is appended as a snapshot.
+    After that, saving appends only the fields reported by `Player.get_dirty_fields`, as
+    `{"uid": ..., "changes": {...}}`, and then marks the player clean, so the bytes written
+    per save are proportional to what changed. Players that do not track changes, such as
+    CompactPlayer, are always written as snapshots.
+
+    Once `compact_every` change records have been appended, the log is compacted: it is
+    replayed and rewritten as one snapshot per player, then appending continues.
+
+    Args:
+        filepath (str): The file path of the log. It is created if it does not exist.
+        compact_every (int, optional): Number of change records that triggers compaction.
+            Default is 1000. None disables automatic compaction.
+
+    Example:
+        with PlayerJournal("campaign.log") as journal:
+            journal.save_many(party)       # snapshots
+            party[0].hp -= 4
+            journal.save_many(party)       # one short change record
+    """
+
+    def __init__(self, filepath: str, compact_every: int = 1000):
+        if compact_every is not None and compact_every < 1:
+            raise ValueError("compact_every must be greater than 0.")
+        self.filepath = filepath
+        self.compact_every = compact_every
+        self._known = set()
+        self._changes = 0
+        if os.path.exists(filepath):
+            for record in self._records():
+                if "changes" in record:
+                    self._changes += 1
+                else:
+                    self._known.add(record["uid"])
+        self._file = open(filepath, "ab")
+
+    def save(self, player: Player) -> int:
+        """Saves one player. Returns the number of bytes written."""
+        return self.save_many([player])
+
+    def save_many(self, players: Iterable[Player]) -> int:
+        """
+        Appends a snapshot or a change record for every player that needs one.
+
+        Players without changes are skipped. The log is flushed once, after every player is
+        written, and compacted afterwards if enough change records have built up.
+
+        Args:
+            players (Iterable[Player]): The players to save.
+
+        Returns:
+            int: The number of bytes written.
+        """
+        lines = []
+        for player in players:
+            uid = str(player.uid)
+            get_dirty_fields = getattr(player, "get_dirty_fields", None)
+            if uid in self._known and get_dirty_fields is not None:
+                dirty = get_dirty_fields()
+                if not dirty:
+                    continue
+                player_data = player.to_dict()
+                record = {"uid": uid, "changes": {field: player_data[field] for field in sorted(dirty)}}
+                self._changes += 1
+            else:
+                record = player.to_dict()
+                self._known.add(uid)
+            lines.append(_encode(record).encode("utf-8") + b"\n")
+            if get_dirty_fields is not None:
+                player.mark_clean()
+
+        data = b"".join(lines)
+        self._file.write(data)
+        self._file.flush()
+        if self.compact_every is not None and self._changes >= self.compact_every:
+            self.compact()
+        return len(data)
+
+    def replay(self) -> Dict[str, dict]:
+        """
+        Applies every record in the log in order.
+
+        Returns:
+            dict: The latest `Player.to_dict` data of every player, by uid string.
+        """
+        self._file.flush()
+        players = {}
+        for record in self._records():
+            if "changes" in record:
+                players[record["uid"]].update(record["changes"])
+            else:
+                players[record["uid"]] = record
+        return players
+
+    def load(self, player_class=Player) -> List[Player]:
+        """
+        Rebuilds every player in the log, in the order they were first saved.
+
+        The players are marked clean, so saving them again only writes what changes next.
+
+        Args:
+            player_class (type, optional): The class to rebuild, Player or CompactPlayer. Default is Player.
+
+        Returns:
+            List[Player]: The players.
+        """
+        players = [player_class.from_dict(player_data) for player_data in self.replay().values()]
+        for player in players:
+            if hasattr(player, "mark_clean"):
+                player.mark_clean()
+        return players
+
+    def compact(self) -> None:
+        """Rewrites the log as a single snapshot of every player, replacing it atomically."""
+        players = self.replay()
+        temporary = self.filepath + ".compact"
+        with open(temporary, "wb") as compact_file:
+            compact_file.write(b"".join(_encode(player_data).encode("utf-8") + b"\n"
+                                        for player_data in players.values()))
+        self._file.close()
+        os.replace(temporary, self.filepath)
+        self._file = open(self.filepath, "ab")
+        self._changes = 0
+
+    def _records(self):
+        """Yields every record in the log, checking that change records follow a snapshot."""
+        known = set()
+        with open(self.filepath, "rb") as log_file:
+            for line_number, line in enumerate(log_file, 1):
+                if not line.strip():
+                    continue
+                try:
+                    record = json.loads(line)
+                except json.JSONDecodeError as e:
+                    raise ValueError(f"{self.filepath} line {line_number} is not valid JSON: {e}") from None
+                if "changes" not in record:
+                    known.add(record["uid"])
+                elif record["uid"] not in known:
+                    raise ValueError(f"{self.filepath} line {line_number} changes a player with no snapshot")
+                yield record
+
+    def close(self) -> None:
+        """Closes the log file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
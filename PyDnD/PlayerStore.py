@@ -0,0 +1,271 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+PlayerStore Module persists players in an SQLite database, with batched writes, indexed
+queries and a connection pool for threaded applications.
+"""
+
+# Built-in/Generic Imports
+import json
+import queue
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Iterable, Iterator, Optional
+
+# Import Player functionality
+from .Player import Player
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+# Number of rows fetched from SQLite at a time while iterating over query results
+FETCH_SIZE = 256
+
+_SCHEMA = (
+    """CREATE TABLE IF NOT EXISTS players (
+        uid TEXT PRIMARY KEY,
+        name TEXT,
+        level INTEGER,
+        experience INTEGER,
+        data TEXT NOT NULL
+    )""",
+    # Matches the order of query(), so each page is read straight from the index
+    "CREATE INDEX IF NOT EXISTS players_order ON players (level, name, uid)",
+    "CREATE INDEX IF NOT EXISTS players_name ON players (name)",
+)
+
+_UPSERT = """
+    INSERT INTO players (uid, name, level, experience, data) VALUES (?, ?, ?, ?, ?)
+    ON CONFLICT (uid) DO UPDATE SET
+        name = excluded.name, level = excluded.level, experience = excluded.experience, data = excluded.data
+"""
+
+_encode = json.JSONEncoder(ensure_ascii=False, separators=(",", ":")).encode
+
+def _following(level, name, uid):
+    """
+    Builds the condition selecting the rows ordered after (level, name, uid).
+
+    SQLite sorts NULL before every value, so a NULL level or name is handled separately.
+
+    Returns:
+        tuple: The SQL condition and its parameters.
+    """
+    def after(column, value):
+        return (f"{column} IS NOT NULL", []) if value is None else (f"{column} > ?", [value])
+    def equal(column, value):
+        return (f"{column} IS NULL", []) if value is None else (f"{column} = ?", [value])
+    (level_after, level_after_values), (level_equal, level_equal_values) = after("level", level), equal("level", level)
+    (name_after, name_after_values), (name_equal, name_equal_values) = after("name", name), equal("name", name)
+    condition = f"({level_after} OR ({level_equal} AND ({name_after} OR ({name_equal} AND uid > ?))))"
+    return condition, level_after_values + level_equal_values + name_after_values + name_equal_values + [uid]
+
+class PlayerStore(object):
+    """
+    SQLite-backed storage for any number of players.
+
+    Each player is stored as one row, keyed by uid, holding its `Player.to_dict` data along
+    with indexed name and level columns, so queries such as "every level 10+ character" are
+    answered from the index without loading anyone else. Writes are batched with
+    `executemany` in a single transaction, and query results are decoded lazily, one player
+    at a time.
+
+    Connections are kept in a pool and handed to one thread at a time, so a store can be
+    shared between threads. File databases use write-ahead logging, which lets readers
+    continue while a batch is being written.
+
+    Args:
+        filepath (str, optional): Path of the database file. Default is ":memory:", a private
+            in-memory database.
+        pool_size (int, optional): Largest number of open connections. Default is 4. An
+            in-memory database always uses a single connection.
+        timeout (float, optional): Seconds to wait for a locked database. Default is 30.
+
+    Example:
+        store = PlayerStore("campaign.db")
+        store.save_many(roster)
+        for veteran in store.query(min_level=10):
+            print(veteran.name)
+    """
+
+    def __init__(self, filepath: str = ":memory:", pool_size: int = 4, timeout: float = 30.0):
+        if pool_size < 1:
+            raise ValueError("Pool size must be greater than 0.")
+        self.filepath = filepath
+        self.pool_size = pool_size if filepath != ":memory:" else 1
+        self.timeout = timeout
+        self._pool = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._closed = False
+
+        connection = self._connect()
+        with connection:
+            for statement in _SCHEMA:
+                connection.execute(statement)
+        self._pool.put(connection)
+        self._opened = 1
+
+    def _connect(self) -> sqlite3.Connection:
+        connection = sqlite3.connect(self.filepath, timeout=self.timeout, check_same_thread=False)
+        if self.filepath != ":memory:":
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.execute("PRAGMA synchronous=NORMAL")
+        return connection
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        """
+        Borrows a connection from the pool for the duration of a `with` block.
+
+        A new connection is opened while fewer than `pool_size` exist; otherwise the caller
+        waits for another thread to return one.
+        """
+        if self._closed:
+            raise ValueError("Cannot use a closed PlayerStore.")
+        try:
+            connection = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._opened < self.pool_size
+                self._opened += create
+            connection = self._connect() if create else self._pool.get()
+        try:
+            yield connection
+        finally:
+            self._pool.put(connection)
+
+    def save(self, player: Player) -> None:
+        """Inserts or updates a single player."""
+        self.save_many([player])
+
+    def save_many(self, players: Iterable[Player]) -> int:
+        """
+        Inserts or updates players in one transaction.
+
+        Args:
+            players (Iterable[Player]): The players to save. CompactPlayers work as well.
+
+        Returns:
+            int: The number of players written.
+        """
+        rows = [(str(player.uid), player.name, player.level, player.experience, _encode(player.to_dict()))
+                for player in players]
+        with self.connection() as connection:
+            with connection:
+                connection.executemany(_UPSERT, rows)
+        return len(rows)
+
+    def get(self, uid, player_class=Player) -> Optional[Player]:
+        """
+        Loads the player with the given uid.
+
+        Args:
+            uid (UUID or str): The player's uid.
+            player_class (type, optional): The class to rebuild, Player or CompactPlayer. Default is Player.
+
+        Returns:
+            Player: The player, or None if no player has that uid.
+        """
+        with self.connection() as connection:
+            row = connection.execute("SELECT data FROM players WHERE uid = ?", (str(uid),)).fetchone()
+        return player_class.from_dict(json.loads(row[0])) if row is not None else None
+
+    def query(self, min_level: int = None, max_level: int = None, name: str = None, limit: int = None,
+              player_class=Player) -> Iterator[Player]:
+        """
+        Yields the players matching every given condition, ordered by level, name and uid.
+
+        The conditions are answered from the level and name indexes. Results are read in pages
+        of `FETCH_SIZE` players, each continuing after the last (level, name, uid) of the one
+        before, and the connection goes back to the pool between pages. Other calls, including
+        ones made while iterating, never wait on an open query. Players are decoded one at a
+        time as the generator is consumed.
+
+        Args:
+            min_level (int, optional): Lowest level to include.
+            max_level (int, optional): Highest level to include.
+            name (str, optional): Exact name to match.
+            limit (int, optional): Largest number of players to yield.
+            player_class (type, optional): The class to rebuild, Player or CompactPlayer. Default is Player.
+
+        Yields:
+            Player: Each matching player.
+        """
+        conditions, parameters = [], []
+        for condition, value in (("level >= ?", min_level), ("level <= ?", max_level), ("name = ?", name)):
+            if value is not None:
+                conditions.append(condition)
+                parameters.append(value)
+
+        from_dict = player_class.from_dict
+        last, remaining = None, limit
+        while remaining is None or remaining > 0:
+            page_conditions, page_parameters = list(conditions), list(parameters)
+            if last is not None:
+                condition, values = _following(*last)
+                page_conditions.append(condition)
+                page_parameters.extend(values)
+            sql = "SELECT level, name, uid, data FROM players"
+            if page_conditions:
+                sql += " WHERE " + " AND ".join(page_conditions)
+            size = FETCH_SIZE if remaining is None else min(FETCH_SIZE, remaining)
+            with self.connection() as connection:
+                rows = connection.execute(sql + " ORDER BY level, name, uid LIMIT ?", page_parameters + [size]).fetchall()
+            for row in rows:
+                yield from_dict(json.loads(row[3]))
+            if len(rows) < size:
+                return
+            last = rows[-1][:3]
+            if remaining is not None:
+                remaining -= len(rows)
+
+    def count(self, min_level: int = None) -> int:
+        """Returns the number of stored players, optionally only those of at least `min_level`."""
+        with self.connection() as connection:
+            if min_level is None:
+                return connection.execute("SELECT COUNT(*) FROM players").fetchone()[0]
+            return connection.execute("SELECT COUNT(*) FROM players WHERE level >= ?", (min_level,)).fetchone()[0]
+
+    def __len__(self):
+        return self.count()
+
+    def __contains__(self, uid):
+        with self.connection() as connection:
+            return connection.execute("SELECT 1 FROM players WHERE uid = ?", (str(uid),)).fetchone() is not None
+
+    def delete(self, uid) -> bool:
+        """
+        Removes the player with the given uid.
+
+        Returns:
+            bool: True if a player was removed.
+        """
+        with self.connection() as connection:
+            with connection:
+                return connection.execute("DELETE FROM players WHERE uid = ?", (str(uid),)).rowcount > 0
+
+    def close(self) -> None:
+        """Closes every pooled connection. The store cannot be used afterwards."""
+        self._closed = True
+        while True:
+            try:
+                self._pool.get_nowait().close()
+            except queue.Empty:
+                break
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
@@ -0,0 +1,342 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+PlayerTable Module stores whole rosters of characters column by column in NumPy arrays, for
+fast analytics over very large numbers of characters.
+"""
+
+# Built-in/Generic Imports
+from typing import Dict, Iterable, List
+import os
+from uuid import UUID
+
+# Import Player functionality
+from .Dice import RandomBackend, np, _require_numpy
+from .LevelingSystem import LevelingSystem, experience_for_level
+from .Player import Player, _INTEGER_FIELDS
+from .Roll import Roll
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+# Columns stored as integer codes into a table of the distinct strings
+STRING_COLUMNS = ("name", "age", "gender", "alignment", "description", "biography")
+
+# Columns stored as int64 arrays
+INTEGER_COLUMNS = ("level", "experience", "wealth", "strength", "dexterity", "constitution", "wisdom",
+                   "intelligence", "charisma", "hp", "mp", "skillpoints", "featpoints")
+
+ABILITY_COLUMNS = Player.ABILITIES
+
+# Names used in error messages, matching the Player setters
+_LABELS = {field: label for field, label, *_ in _INTEGER_FIELDS}
+
+# Values used by from_columns for integer columns that are not given
+_COLUMN_DEFAULTS = {"level": 1, "wealth": 0, "hp": 1, "mp": 0, "skillpoints": 0, "featpoints": 0}
+
+class PlayerTable(object):
+    """
+    A roster of characters stored as columns (struct of arrays) instead of Player objects.
+
+    Each integer field is one int64 NumPy array with a row per character, so statistics,
+    modifiers and filters run over the whole roster at once. String fields such as name and
+    alignment are interned: each distinct string is stored once and rows hold an integer
+    code, which keeps memory low and makes equality filters integer comparisons. Inventories
+    are not stored.
+
+    Requires NumPy.
+
+    Example:
+        table = PlayerTable.from_players(roster)
+        strong = table.filter(table["strength"] >= 16, alignment="CG")
+        print(len(strong), table.get_modifier("dexterity").mean())
+        heroes = strong.to_players()
+
+    Attributes:
+        uids (numpy.ndarray): The 16 byte uid of every row.
+    """
+
+    def __init__(self, uids, integers: Dict[str, object], codes: Dict[str, object], strings: Dict[str, List[str]]):
+        _require_numpy()
+        self.uids = uids
+        self._integers = integers
+        self._codes = codes
+        self._strings = strings
+
+    @classmethod
+    def from_players(cls, players: Iterable[Player]) -> 'PlayerTable':
+        """
+        Builds a table from Player (or CompactPlayer) objects.
+
+        Integer fields a Player holds as None, such as an unset level or wealth, are stored as
+        the default `from_columns` uses for that column (level 1, 0 for the rest).
+
+        Args:
+            players (Iterable[Player]): The characters to store.
+
+        Returns:
+            PlayerTable: The roster as columns.
+        """
+        _require_numpy()
+        players = list(players)
+        count = len(players)
+        uids = np.frombuffer(b"".join(player.uid.bytes for player in players), dtype="V16").copy() if count else np.empty(0, dtype="V16")
+        integers = {column: np.fromiter((_or_default(getattr(player, column), column) for player in players),
+                                        dtype=np.int64, count=count)
+                    for column in INTEGER_COLUMNS}
+        codes, strings = {}, {}
+        for column in STRING_COLUMNS:
+            codes[column], strings[column] = _intern(getattr(player, column) for player in players)
+        return cls(uids, integers, codes, strings)
+
+    @classmethod
+    def from_columns(cls, size: int, rng: RandomBackend = None, **columns) -> 'PlayerTable':
+        """
+        Builds a table of `size` characters from whole columns, validated the same way as Player.
+
+        String columns may be a single string for every row or a sequence of strings.
+        Integer columns may be a single value or an array. Missing ability scores are rolled
+        with 4d6 drop the lowest in one batch, missing experience is the threshold of each
+        row's level, and other missing columns take the Player defaults.
+
+        Args:
+            size (int): Number of characters.
+            rng (RandomBackend, optional): Random backend to roll ability scores with. Default is the module default backend.
+            **columns: Column values, by field name.
+
+        Returns:
+            PlayerTable: The new roster.
+
+        Raises:
+            ValueError: If a column is unknown, has the wrong length or holds values a Player would reject.
+        """
+        _require_numpy()
+        unknown = set(columns) - set(STRING_COLUMNS) - set(INTEGER_COLUMNS)
+        if unknown:
+            raise ValueError(f"Unknown columns: {', '.join(sorted(unknown))}")
+
+        integers = {}
+        missing = [column for column in ABILITY_COLUMNS if columns.get(column) is None]
+        if missing:
+            rolls = Roll.roll_batch(4, 6, n=size * len(missing), drop_lowest=1, rng=rng).reshape(len(missing), size)
+            integers.update(zip(missing, rolls))
+        for column in INTEGER_COLUMNS:
+            value = columns.get(column)
+            if value is None:
+                if column in integers:
+                    continue
+                value = _COLUMN_DEFAULTS.get(column, 0)
+            integers[column] = _column(value, size, column)
+        _validate(integers)
+        if columns.get("experience") is None:
+            # Same starting experience as the Player constructor: 0 at level 1, else the level's threshold
+            levels, inverse = np.unique(integers["level"], return_inverse=True)
+            thresholds = np.array([experience_for_level(int(level)) for level in levels], dtype=np.int64)
+            integers["experience"] = np.where(integers["level"] == 1, 0, thresholds[inverse.reshape(-1)])
+
+        codes, strings = {}, {}
+        for column in STRING_COLUMNS:
+            value = columns.get(column)
+            scalar = value is None or isinstance(value, str)
+            values = [value] if scalar else list(value)
+            if column == "alignment":
+                # Normalize the same way as the Player alignment setter
+                values = [alignment.upper() if isinstance(alignment, str) else alignment for alignment in values]
+            if scalar:
+                codes[column], strings[column] = np.zeros(size, dtype=np.int32), values
+            elif len(values) == size:
+                codes[column], strings[column] = _intern(values)
+            else:
+                raise ValueError(f"Column '{column}' has {len(values)} values, expected {size}")
+            _validate_strings(column, strings[column])
+        return cls(_random_uids(size), integers, codes, strings)
+
+    def __len__(self):
+        return len(self.uids)
+
+    def __getitem__(self, column: str):
+        """Returns a column as an array. String columns are decoded into an object array."""
+        if column in self._integers:
+            return self._integers[column]
+        if column in self._codes:
+            return np.array(self._strings[column], dtype=object)[self._codes[column]]
+        raise KeyError(column)
+
+    def codes(self, column: str):
+        """
+        Returns a string column as its interned codes and the strings they refer to.
+
+        Returns:
+            tuple: The int32 array of codes and the list of distinct strings, indexed by code.
+        """
+        return self._codes[column], self._strings[column]
+
+    def get_modifier(self, stat):
+        """
+        Returns the modifier for every value of an ability score column.
+
+        Args:
+            stat (str or numpy.ndarray): An integer column name, or an array of ability scores.
+
+        Returns:
+            numpy.ndarray: The modifiers, using the same formula as Player.get_modifier.
+        """
+        scores = self._integers[stat] if isinstance(stat, str) else np.asarray(stat)
+        return scores // 2 - 5
+
+    def award_experience(self, awards, rows=None):
+        """
+        Gives experience to every row, or the selected rows, updating the level and experience columns.
+
+        Uses `LevelingSystem.award_experience`, so each row ends up as `giveExp` would leave a Player.
+
+        Args:
+            awards (array_like or int): The experience to give each selected row, or one amount for all.
+            rows (numpy.ndarray, optional): Boolean mask or row indices to award. Default is every row.
+
+        Returns:
+            numpy.ndarray: The nextLvlExperience of each awarded row.
+        """
+        experience, levels = self._integers["experience"], self._integers["level"]
+        if rows is None:
+            rows = slice(None)
+        experience[rows], levels[rows], next_level = LevelingSystem.award_experience(experience[rows], levels[rows], awards)
+        return next_level
+
+    def mask(self, **equals):
+        """
+        Returns a boolean array of the rows where every given column equals the given value.
+
+        Example:
+            table.mask(alignment="LG", level=5)
+        """
+        selected = np.ones(len(self), dtype=bool)
+        for column, value in equals.items():
+            if column in self._codes:
+                strings = self._strings[column]
+                if column == "alignment" and value is not None:
+                    value = value.upper()
+                if value not in strings:
+                    return np.zeros(len(self), dtype=bool)
+                selected &= self._codes[column] == strings.index(value)
+            elif column in self._integers:
+                selected &= self._integers[column] == value
+            else:
+                raise KeyError(column)
+        return selected
+
+    def filter(self, mask=None, **equals) -> 'PlayerTable':
+        """
+        Returns a new table of the rows selected by a boolean mask and/or equal column values.
+
+        Args:
+            mask (numpy.ndarray, optional): Boolean array, e.g. `table["level"] >= 5`, or an array of row indices.
+                Indices select rows in the order given, unless `**equals` is also given, in which case
+                the rows keep the table order.
+            **equals: Columns that must equal the given values, as in `mask`.
+
+        Returns:
+            PlayerTable: The selected rows. The string tables are shared with this table.
+        """
+        selected = self.mask(**equals) if equals else None
+        if mask is not None:
+            mask = np.asarray(mask)
+            if selected is not None and mask.dtype != bool:
+                indices, mask = mask, np.zeros(len(self), dtype=bool)
+                mask[indices] = True
+            selected = mask if selected is None else selected & mask
+        if selected is None:
+            return self
+        return PlayerTable(self.uids[selected],
+                           {column: values[selected] for column, values in self._integers.items()},
+                           {column: codes[selected] for column, codes in self._codes.items()},
+                           self._strings)
+
+    def to_players(self, player_class=Player) -> List[Player]:
+        """
+        Converts every row into a Player (or CompactPlayer) with an empty inventory.
+
+        The experience needed for the next level is recalculated from each row's level and experience.
+
+        Args:
+            player_class (type, optional): The class to build. Default is Player.
+
+        Returns:
+            List[Player]: One player per row, with the stored uid and experience.
+        """
+        integers = {column: values.tolist() for column, values in self._integers.items()}
+        strings = {column: [self._strings[column][code] for code in codes.tolist()] for column, codes in self._codes.items()}
+        uids = self.uids.tolist()
+        players = []
+        for row in range(len(self)):
+            player = player_class(level=integers["level"][row],
+                                  **{column: strings[column][row] for column in STRING_COLUMNS},
+                                  **{column: integers[column][row] for column in ("wealth", "hp", "mp") + ABILITY_COLUMNS})
+            player.uid = UUID(bytes=uids[row])
+            player._experience = integers["experience"][row]
+            player.skillpoints = integers["skillpoints"][row]
+            player.featpoints = integers["featpoints"][row]
+            player.leveling_system.getExpForNextLevel()
+            players.append(player)
+        return players
+
+    def __repr__(self):
+        return f"<PlayerTable: {len(self)} players>"
+
+def _random_uids(count: int):
+    """
+    Generates `count` random (version 4) UUIDs as a V16 array from a single os.urandom call.
+
+    The bytes are the same as `uuid4().bytes`; only the version and variant bits are set.
+    """
+    uids = np.frombuffer(bytearray(os.urandom(16 * count)), dtype=np.uint8).reshape(count, 16)
+    uids[:, 6] = (uids[:, 6] & 0x0F) | 0x40
+    uids[:, 8] = (uids[:, 8] & 0x3F) | 0x80
+    return uids.reshape(-1).view("V16")
+
+def _intern(values):
+    """Interns an iterable of strings, returning (int32 codes, list of distinct strings)."""
+    lookup = {}
+    codes = np.fromiter((lookup.setdefault(value, len(lookup)) for value in values), dtype=np.int32)
+    return codes, list(lookup)
+
+def _or_default(value, column: str):
+    """Returns `value`, or the from_columns default for `column` when it is None."""
+    return _COLUMN_DEFAULTS.get(column, 0) if value is None else value
+
+def _column(value, size: int, name: str):
+    """Broadcasts a scalar or array to an int64 column of `size` rows."""
+    column = np.asarray(value)
+    if column.dtype.kind not in "iub":
+        raise ValueError(f"{_LABELS.get(name, name.capitalize())} must be an integer")
+    if column.ndim == 0:
+        return np.full(size, int(column), dtype=np.int64)
+    if column.shape != (size,):
+        raise ValueError(f"Column '{name}' has {len(column)} values, expected {size}")
+    return column.astype(np.int64)
+
+def _validate(integers: Dict[str, object]) -> None:
+    """Applies the Player lower bounds to whole integer columns."""
+    for column, _, minimum, message, _ in _INTEGER_FIELDS:
+        if len(integers[column]) and integers[column].min() < minimum:
+            raise ValueError(message)
+
+def _validate_strings(column: str, strings: List[str]) -> None:
+    """Applies the Player string rules to the distinct values of a string column."""
+    for value in strings:
+        if value is None:
+            continue
+        if not isinstance(value, str):
+            raise ValueError(f"{column.capitalize()} must be a string")
+        if column == "alignment" and value not in Player.VALID_ALIGNMENTS:
+            raise ValueError("Alignment must be a valid two-letter code(e.g., LE, NG, CG)")
@@ -9,6 +9,7 @@ Roll Module is responsible for Rolling stats, dice, and any randomness that the
 
 # Built-in/Generic Imports
 from random import SystemRandom
+from typing import List
 
 # META Data
 __author__ = 'CFDeadlines'
@@ -27,7 +28,9 @@ class DoNotRunDirectly(Exception):
     pass
 
 # Import Dice functionality
-from .Dice import Dice
+from .Dice import Dice, RandomBackend, EntropyPool, get_default_backend, np
+from .Distribution import Distribution
+from .DiceExpression import DiceExpression
 
 ############################
 #  Do not run if __main__  #
@@ -35,6 +38,9 @@ from .Dice import Dice
 if __name__ == "__main__":
     raise DoNotRunDirectly("This library is not meant to be called as __main__, import it instead.")
 
+# Shared secure, buffered source for Roll.stream
+_stream_pool = EntropyPool()
+
 class Roll(object):
     """
     Utility class for performing various types of dice rolls using the Dice object.
@@ -45,7 +51,9 @@ class Roll(object):
     """
     
     @staticmethod
-    def roll(num_dice: int = 1, sides: int = 6, modifier: int = 0, drop_lowest: int = 0, return_rolls: bool = False):
+    def roll(num_dice: int = 1, sides: int = 6, modifier: int = 0, drop_lowest: int = 0, return_rolls: bool = False, rng: RandomBackend = None,
+             drop_highest: int = 0, keep_highest: int = None, keep_lowest: int = None, recorder=None,
+             explode: bool = False, reroll_below: int = 0, minimum_face: int = 0):
         """
         Rolls a specified number of dice with a given number of sides, applying 
         any modifiers and optionally dropping the lowest rolls.
@@ -56,6 +64,14 @@ class Roll(object):
             modifier (int, optional): Modifier to add to the total roll. Default is 0.
             drop_lowest (int, optional): Number of lowest dice rolls to drop. Default is 0.
             return_rolls (bool, optional): Whether to return the list of individual rolls along with the total. Default is False.
+            rng (RandomBackend, optional): Random backend to roll with. Default is the module default backend.
+            drop_highest (int, optional): Number of highest dice rolls to drop. Default is 0.
+            keep_highest (int, optional): Number of highest dice rolls to keep, e.g. 1 to roll with advantage. Default is None (keep all).
+            keep_lowest (int, optional): Number of lowest dice rolls to keep, e.g. 1 to roll with disadvantage. Default is None (keep all).
+            recorder (RollRecorder, optional): Recorder to write the roll to. Default is the module default recorder.
+            explode (bool, optional): Whether dice showing their highest face are rolled again and added. Default is False.
+            reroll_below (int, optional): Dice showing this value or less are rerolled once, e.g. 1 to reroll ones. Default is 0.
+            minimum_face (int, optional): Dice showing less than this count as this value. Default is 0.
 
         Returns:
             int or tuple: The total result of the roll, including any modifiers. If `return_rolls` is True, returns a tuple of (total, list of rolls).
@@ -66,10 +82,175 @@ class Roll(object):
 
             total, rolls = Roll.roll(num_dice=4, sides=6, drop_lowest=1, return_rolls=True)
             print(total, rolls)  # The total and the list of individual rolls
+
+            advantage = Roll.roll(num_dice=2, sides=20, keep_highest=1)
+            exploding = Roll.roll(num_dice=3, sides=6, explode=True)
         """
-        dice = Dice(num_dice=num_dice, sides=sides, modifier=modifier, drop_lowest=drop_lowest)
+        dice = Dice(num_dice=num_dice, sides=sides, modifier=modifier, drop_lowest=drop_lowest, drop_highest=drop_highest,
+                    keep_highest=keep_highest, keep_lowest=keep_lowest, rng=rng, recorder=recorder,
+                    explode=explode, reroll_below=reroll_below, minimum_face=minimum_face)
         dice.roll()
         if return_rolls:
             return dice.value, dice.rolls
         else:
-            return dice.value
\ No newline at end of file
+            return dice.value
+
+    @staticmethod
+    def roll_batch(num_dice: int = 1, sides: int = 6, n: int = 1, modifier: int = 0, drop_lowest: int = 0, return_rolls: bool = False, rng: RandomBackend = None,
+                   drop_highest: int = 0, keep_highest: int = None, keep_lowest: int = None,
+                   explode: bool = False, reroll_below: int = 0, minimum_face: int = 0):
+        """
+        Rolls the same dice `n` times at once, returning NumPy arrays instead of single values.
+
+        Args:
+            num_dice (int): Number of dice to roll.
+            sides (int): Number of sides on each die.
+            n (int): Number of times to roll the dice.
+            modifier (int, optional): Modifier to add to each total. Default is 0.
+            drop_lowest (int, optional): Number of lowest dice rolls to drop from each total. Default is 0.
+            return_rolls (bool, optional): Whether to also return the (n, num_dice) matrix of individual rolls. Default is False.
+            rng (RandomBackend, optional): Random backend to roll with. Default is the module default backend.
+            drop_highest (int, optional): Number of highest dice rolls to drop. Default is 0.
+            keep_highest (int, optional): Number of highest dice rolls to keep, e.g. 1 to roll with advantage. Default is None (keep all).
+            keep_lowest (int, optional): Number of lowest dice rolls to keep, e.g. 1 to roll with disadvantage. Default is None (keep all).
+            explode (bool, optional): Whether dice showing their highest face are rolled again and added. Default is False.
+            reroll_below (int, optional): Dice showing this value or less are rerolled once, e.g. 1 to reroll ones. Default is 0.
+            minimum_face (int, optional): Dice showing less than this count as this value. Default is 0.
+
+        Returns:
+            numpy.ndarray or tuple: The array of `n` totals. If `return_rolls` is True, returns a tuple of (totals, matrix of rolls).
+
+        Example:
+            stats = Roll.roll_batch(num_dice=4, sides=6, n=6, drop_lowest=1)
+            print(stats)  # Six ability scores rolled with 4d6 drop lowest
+        """
+        dice = Dice(num_dice=num_dice, sides=sides, modifier=modifier, drop_lowest=drop_lowest, drop_highest=drop_highest,
+                    keep_highest=keep_highest, keep_lowest=keep_lowest, rng=rng,
+                    explode=explode, reroll_below=reroll_below, minimum_face=minimum_face)
+        return dice.roll_many(n, return_rolls=return_rolls)
+
+    @staticmethod
+    def roll_abilities(count: int, rng: RandomBackend = None) -> List[int]:
+        """
+        Rolls `count` ability scores with 4d6 drop the lowest in a single batched draw.
+
+        Uses `roll_batch` when NumPy is installed, and otherwise draws every die with one
+        `roll_faces` call.
+
+        Args:
+            count (int): Number of ability scores to roll.
+            rng (RandomBackend, optional): Random backend to roll with. Default is the module default backend.
+
+        Returns:
+            List[int]: The ability scores.
+
+        Example:
+            strength, dexterity, constitution, wisdom, intelligence, charisma = Roll.roll_abilities(6)
+        """
+        if rng is None:
+            rng = get_default_backend()
+        if np is not None:
+            return Roll.roll_batch(4, 6, n=count, drop_lowest=1, rng=rng).tolist()
+        faces = rng.roll_faces(6, 4 * count)
+        return [sum(group) - min(group) for group in zip(*[iter(faces)] * 4)]
+
+    @staticmethod
+    def stream(num_dice: int = 1, sides: int = 6, modifier: int = 0, drop_lowest: int = 0, count: int = None, return_rolls: bool = False,
+               rng: RandomBackend = None, drop_highest: int = 0, keep_highest: int = None, keep_lowest: int = None, recorder=None,
+               explode: bool = False, reroll_below: int = 0, minimum_face: int = 0):
+        """
+        Generates rolls of the same dice one after another.
+
+        The dice are built once and reused for every roll. Unless another backend is given,
+        rolls come from a shared `EntropyPool`, so they are cryptographically secure without
+        a system call per die.
+
+        Args:
+            num_dice (int): Number of dice to roll.
+            sides (int): Number of sides on each die.
+            modifier (int, optional): Modifier to add to each total. Default is 0.
+            drop_lowest (int, optional): Number of lowest dice rolls to drop. Default is 0.
+            count (int, optional): Number of rolls to generate. Default is None (generate forever).
+            return_rolls (bool, optional): Whether to yield the list of individual rolls along with each total. Default is False.
+            rng (RandomBackend, optional): Random backend to roll with. Default is the shared EntropyPool.
+            drop_highest (int, optional): Number of highest dice rolls to drop. Default is 0.
+            keep_highest (int, optional): Number of highest dice rolls to keep. Default is None (keep all).
+            keep_lowest (int, optional): Number of lowest dice rolls to keep. Default is None (keep all).
+            recorder (RollRecorder, optional): Recorder to write every roll to. Default is the module default recorder.
+            explode (bool, optional): Whether dice showing their highest face are rolled again and added. Default is False.
+            reroll_below (int, optional): Dice showing this value or less are rerolled once, e.g. 1 to reroll ones. Default is 0.
+            minimum_face (int, optional): Dice showing less than this count as this value. Default is 0.
+
+        Yields:
+            int or tuple: Each total. If `return_rolls` is True, yields tuples of (total, list of rolls).
+
+        Example:
+            for initiative in Roll.stream(num_dice=1, sides=20, modifier=2, count=5):
+                print(initiative)
+        """
+        dice = Dice(num_dice=num_dice, sides=sides, modifier=modifier, drop_lowest=drop_lowest, drop_highest=drop_highest,
+                    keep_highest=keep_highest, keep_lowest=keep_lowest, rng=rng if rng is not None else _stream_pool,
+                    recorder=recorder, explode=explode, reroll_below=reroll_below, minimum_face=minimum_face)
+        rolled = 0
+        while count is None or rolled < count:
+            dice.roll()
+            rolled += 1
+            if return_rolls:
+                yield dice.value, dice.rolls
+            else:
+                yield dice.value
+
+    @staticmethod
+    def distribution(num_dice: int = 1, sides: int = 6, modifier: int = 0, drop_lowest: int = 0,
+                     drop_highest: int = 0, keep_highest: int = None, keep_lowest: int = None,
+                     reroll_below: int = 0, minimum_face: int = 0) -> Distribution:
+        """
+        Returns the exact probability distribution of a roll instead of rolling it.
+
+        Args:
+            num_dice (int): Number of dice to roll.
+            sides (int): Number of sides on each die.
+            modifier (int, optional): Modifier to add to the total roll. Default is 0.
+            drop_lowest (int, optional): Number of lowest dice rolls to drop. Default is 0.
+            drop_highest (int, optional): Number of highest dice rolls to drop. Default is 0.
+            keep_highest (int, optional): Number of highest dice rolls to keep, e.g. 1 to roll with advantage. Default is None (keep all).
+            keep_lowest (int, optional): Number of lowest dice rolls to keep, e.g. 1 to roll with disadvantage. Default is None (keep all).
+            reroll_below (int, optional): Dice showing this value or less are rerolled once. Default is 0.
+            minimum_face (int, optional): Dice showing less than this count as this value. Default is 0.
+
+        Returns:
+            Distribution: The distribution of the total, including any modifiers.
+
+        Example:
+            stats = Roll.distribution(num_dice=4, sides=6, drop_lowest=1)
+            print(stats.at_least(15))  # Chance of rolling a 15 or better
+        """
+        return Distribution.for_dice(num_dice, sides, modifier=modifier, drop_lowest=drop_lowest, drop_highest=drop_highest,
+                                     keep_highest=keep_highest, keep_lowest=keep_lowest,
+                                     reroll_below=reroll_below, minimum_face=minimum_face)
+
+    @staticmethod
+    def roll_expression(expression: str, return_rolls: bool = False, rng: RandomBackend = None, recorder=None):
+        """
+        Rolls dice written in dice notation, such as "2d8+1d6+3" or "4d6kh3".
+
+        The expression is compiled once and cached, so rolling the same notation repeatedly
+        does not parse it again. See `DiceExpression` for the supported notation.
+
+        Args:
+            expression (str): Dice notation to roll.
+            return_rolls (bool, optional): Whether to return the rolls of each dice pool along with the total. Default is False.
+            rng (RandomBackend, optional): Random backend to roll with. Default is the module default backend.
+            recorder (RollRecorder, optional): Recorder to write each pool's roll to. Default is the module default recorder.
+
+        Returns:
+            int or tuple: The total. If `return_rolls` is True, returns a tuple of (total, list of roll lists, one per pool).
+
+        Raises:
+            InvalidDiceExpression: If the notation cannot be parsed.
+
+        Example:
+            damage = Roll.roll_expression("2d8+1d6+3")
+            stat, rolls = Roll.roll_expression("4d6kh3", return_rolls=True)
+        """
+        return DiceExpression.parse(expression).roll(rng=rng, return_rolls=return_rolls, recorder=recorder)
\ No newline at end of file
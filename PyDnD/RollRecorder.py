@@ -0,0 +1,334 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+RollRecorder Module keeps an audit trail of dice rolls in a fixed-size ring buffer that can be
+exported to disk and replayed.
+"""
+
+# Built-in Imports
+import json
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections import namedtuple
+from typing import Iterator, List, Sequence, Tuple
+
+# Import Dice functionality
+from .Dice import RandomBackend
+from .Roll import Roll
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+################
+#  Exceptions  #
+################
+class ReplayMismatch(Exception):
+    pass
+
+# A single recorded roll, as returned by RollRecorder.records()
+RollRecord = namedtuple("RollRecord", ["timestamp", "expression", "total", "faces", "truncated"])
+
+# The Dice settings that identify an expression, in the order stored in the expression table
+EXPRESSION_FIELDS = ("num_dice", "sides", "modifier", "drop_lowest", "drop_highest", "explode", "reroll_below", "minimum_face")
+
+# Smallest expression table size at which ids no longer used by any recorded roll are pruned
+EXPRESSION_TABLE_SIZE = 1024
+
+_FILE_MAGIC = b"PDRR"
+_FILE_VERSION = 2
+_FILE_HEADER = struct.Struct("<4sHIIQI")
+
+class RollRecorder(object):
+    """
+    Fixed-capacity ring buffer of dice rolls for auditing disputed results.
+
+    Rolls are stored column by column in preallocated `array` buffers (timestamp, expression
+    id, total and faces) rather than as Python objects, so recording costs a few array
+    writes. Once `capacity` rolls have been recorded, the oldest are overwritten. Dice
+    settings are interned into an expression table and referenced by id; settings that no
+    recorded roll uses any more are pruned once the table grows past `EXPRESSION_TABLE_SIZE`,
+    so its size stays bounded. The rare roll whose total or faces do not fit the arrays
+    (faces of 2**32 or more) is kept in a small side table instead.
+
+    Pass the recorder to `Dice`, `Roll.roll`, `Roll.roll_expression` or `DiceExpression.roll`,
+    or install it for every roll with `set_default_recorder`. Each dice pool of an expression
+    is recorded as its own roll, without the expression's modifiers or signs. Only single
+    rolls are recorded, not batch rolls.
+
+    Args:
+        capacity (int, optional): Number of rolls to keep. Default is 65,536.
+        max_faces (int, optional): Number of individual faces stored per roll. Rolls with more
+            dice keep their total but cannot be replayed. Default is 32.
+
+    Example:
+        recorder = RollRecorder()
+        Roll.roll(num_dice=1, sides=20, recorder=recorder)
+        recorder.export("session.rolls")
+
+        for record, total in RollRecorder.load("session.rolls").replay():
+            print(record.expression, total)
+    """
+
+    def __init__(self, capacity: int = 65536, max_faces: int = 32):
+        if capacity < 1:
+            raise ValueError("Capacity must be greater than 0.")
+        if not 1 <= max_faces <= 65535:
+            raise ValueError("Max faces must be between 1 and 65535.")
+        self.capacity = capacity
+        self.max_faces = max_faces
+        self._timestamps = array("d", [0.0]) * capacity
+        self._expression_ids = array("I", [0]) * capacity
+        self._totals = array("q", [0]) * capacity
+        self._face_counts = array("I", [0]) * capacity
+        self._faces = array("I", [0]) * (capacity * max_faces)
+        self._written = 0
+        self._lock = threading.Lock()
+        self._reset_tables()
+
+    def _reset_tables(self) -> None:
+        """Empties the expression table and the side table of values too large for the arrays."""
+        self._expressions = []
+        self._expression_lookup = {}
+        self._table_limit = EXPRESSION_TABLE_SIZE
+        # Total and stored faces of rolls that do not fit the arrays, by slot
+        self._large = {}
+
+    def record(self, dice) -> None:
+        """
+        Records the latest roll of a `Dice` object. Called by `Dice.roll`.
+
+        Args:
+            dice (Dice): The dice that were just rolled.
+        """
+        self._record((dice.num_dice, dice.sides, dice.modifier, dice.drop_lowest, dice.drop_highest,
+                      dice.explode, dice.reroll_below, dice.minimum_face), dice.value, dice._faces)
+
+    def record_pool(self, pool, total: int, faces: List[int]) -> None:
+        """
+        Records one roll of a dice pool of an expression. Called by `DiceExpression.roll`.
+
+        The pool is recorded as the equivalent `Dice`, so it replays through `Roll.roll`.
+
+        Args:
+            pool (DicePool): The pool that was rolled.
+            total (int): The total of its kept dice, before the pool's sign is applied.
+            faces (List[int]): The faces, in the order rolled.
+        """
+        self._record((pool.num_dice, pool.sides, 0, pool.drop_lowest, pool.drop_highest, False, 0, 0), total, faces)
+
+    def _record(self, key: tuple, total: int, faces: List[int]) -> None:
+        """Writes one roll of the dice described by `key` to the next slot."""
+        with self._lock:
+            expression_id = self._expression_lookup.get(key)
+            if expression_id is None:
+                if len(self._expressions) >= self._table_limit:
+                    self._prune_expressions()
+                expression_id = len(self._expressions)
+                self._expressions.append(key)
+                self._expression_lookup[key] = expression_id
+            slot = self._written % self.capacity
+            self._timestamps[slot] = time.time()
+            self._expression_ids[slot] = expression_id
+            self._face_counts[slot] = len(faces)
+            start = slot * self.max_faces
+            stored = min(len(faces), self.max_faces)
+            try:
+                self._totals[slot] = total
+                self._faces[start:start + stored] = array("I", faces[:stored])
+            except OverflowError:
+                self._large[slot] = (total, list(faces[:stored]))
+            else:
+                if self._large:
+                    self._large.pop(slot, None)
+            self._written += 1
+
+    def _prune_expressions(self) -> None:
+        """Drops the expressions no recorded roll refers to and renumbers the rest. Called with the lock held."""
+        expression_ids, old_expressions = self._expression_ids, self._expressions
+        renumbered = {}
+        self._expressions = []
+        for slot in self._slots():
+            expression_id = renumbered.get(expression_ids[slot])
+            if expression_id is None:
+                expression_id = renumbered[expression_ids[slot]] = len(self._expressions)
+                self._expressions.append(old_expressions[expression_ids[slot]])
+            expression_ids[slot] = expression_id
+        self._expression_lookup = {key: expression_id for expression_id, key in enumerate(self._expressions)}
+        self._table_limit = max(EXPRESSION_TABLE_SIZE, 2 * len(self._expressions))
+
+    def __len__(self):
+        return min(self._written, self.capacity)
+
+    def clear(self) -> None:
+        """Forgets every recorded roll and every recorded expression."""
+        with self._lock:
+            self._written = 0
+            self._reset_tables()
+
+    def records(self) -> Iterator[RollRecord]:
+        """
+        Yields the recorded rolls from oldest to newest.
+
+        Each record's `expression` is a dictionary of the Dice settings that were rolled, and
+        `truncated` is True when the roll had more dice than `max_faces`.
+        """
+        for slot in self._slots():
+            count = self._face_counts[slot]
+            if slot in self._large:
+                total, faces = self._large[slot]
+            else:
+                start = slot * self.max_faces
+                total, faces = self._totals[slot], self._faces[start:start + min(count, self.max_faces)].tolist()
+            yield RollRecord(
+                timestamp=self._timestamps[slot],
+                expression=dict(zip(EXPRESSION_FIELDS, self._expressions[self._expression_ids[slot]])),
+                total=total,
+                faces=faces,
+                truncated=count > self.max_faces,
+            )
+
+    def replay_backend(self) -> 'ReplayBackend':
+        """
+        Returns a backend that rolls the recorded faces, oldest first.
+
+        Passing it as `rng` to the same sequence of rolls that was recorded reproduces the
+        session exactly.
+        """
+        return ReplayBackend(record.faces if not record.truncated else None for record in self.records())
+
+    def replay(self) -> Iterator[Tuple[RollRecord, int]]:
+        """
+        Re-rolls every recorded roll through `Roll.roll` using the recorded faces.
+
+        Yields:
+            tuple: Each record and the total `Roll.roll` produced for it.
+
+        Raises:
+            ReplayMismatch: If a roll cannot be reproduced, e.g. because its faces were truncated,
+                it used exploding dice or rerolls, or the replayed total differs from the recorded one.
+        """
+        # Snapshot first, in case this recorder is also recording the replayed rolls
+        records = list(self.records())
+        backend = ReplayBackend(record.faces if not record.truncated else None for record in records)
+        for record in records:
+            # Only the final faces are stored, not the extra dice rolled for explosions and rerolls
+            if record.expression.get("explode") or record.expression.get("reroll_below"):
+                raise ReplayMismatch("Rolls with exploding dice or rerolls cannot be replayed.")
+            total = Roll.roll(rng=backend, **record.expression)
+            if total != record.total:
+                raise ReplayMismatch(f"Replayed total {total} does not match recorded total {record.total}.")
+            yield record, total
+
+    def export(self, filepath: str) -> None:
+        """
+        Writes the recorded rolls to a binary file, oldest first.
+
+        Args:
+            filepath (str): The file path where the rolls will be saved.
+        """
+        with self._lock:
+            slots = list(self._slots())
+            columns = [array(column.typecode, (column[slot] for slot in slots))
+                       for column in (self._timestamps, self._expression_ids, self._totals, self._face_counts)]
+            faces = array("I")
+            for slot in slots:
+                start = slot * self.max_faces
+                faces.extend(self._faces[start:start + self.max_faces])
+            large = [[position, *self._large[slot]] for position, slot in enumerate(slots) if slot in self._large]
+            table = json.dumps({"expressions": self._expressions, "large": large}).encode("utf-8")
+
+        if sys.byteorder != "little":
+            for column in columns + [faces]:
+                column.byteswap()
+        with open(filepath, "wb") as roll_file:
+            roll_file.write(_FILE_HEADER.pack(_FILE_MAGIC, _FILE_VERSION, self.capacity, self.max_faces, len(slots), len(table)))
+            roll_file.write(table)
+            for column in columns + [faces]:
+                column.tofile(roll_file)
+
+    @classmethod
+    def load(cls, filepath: str) -> 'RollRecorder':
+        """
+        Reads rolls written by `export` into a new recorder.
+
+        Args:
+            filepath (str): The file path where the rolls are stored.
+
+        Returns:
+            RollRecorder: A recorder holding the exported rolls.
+
+        Raises:
+            ValueError: If the file is not a roll export.
+        """
+        with open(filepath, "rb") as roll_file:
+            magic, version, capacity, max_faces, count, table_size = _FILE_HEADER.unpack(roll_file.read(_FILE_HEADER.size))
+            if magic != _FILE_MAGIC or version != _FILE_VERSION:
+                raise ValueError(f"{filepath} is not a supported roll recording.")
+            recorder = cls(capacity=capacity, max_faces=max_faces)
+            table = json.loads(roll_file.read(table_size).decode("utf-8"))
+            recorder._expressions = [tuple(key) for key in table["expressions"]]
+            recorder._expression_lookup = {key: index for index, key in enumerate(recorder._expressions)}
+            recorder._table_limit = max(EXPRESSION_TABLE_SIZE, 2 * len(recorder._expressions))
+            # Exported oldest first, so each roll goes back into the slot matching its position
+            recorder._large = {position: (total, faces) for position, total, faces in table["large"]}
+            columns = []
+            for typecode, size in (("d", count), ("I", count), ("q", count), ("I", count), ("I", count * max_faces)):
+                column = array(typecode)
+                column.fromfile(roll_file, size)
+                if sys.byteorder != "little":
+                    column.byteswap()
+                columns.append(column)
+
+        recorder._timestamps[:count] = columns[0]
+        recorder._expression_ids[:count] = columns[1]
+        recorder._totals[:count] = columns[2]
+        recorder._face_counts[:count] = columns[3]
+        recorder._faces[:count * max_faces] = columns[4]
+        recorder._written = count
+        return recorder
+
+    def _slots(self) -> Sequence[int]:
+        """Returns the buffer positions of the recorded rolls, oldest first."""
+        if self._written <= self.capacity:
+            return range(self._written)
+        start = self._written % self.capacity
+        return [*range(start, self.capacity), *range(start)]
+
+class ReplayBackend(RandomBackend):
+    """
+    Backend that returns previously recorded faces instead of random ones.
+
+    Args:
+        face_lists (Iterable[List[int]]): The faces of each roll, in the order they will be
+            replayed. None marks a roll whose faces were not recorded.
+    """
+
+    def __init__(self, face_lists):
+        self._face_lists = iter(face_lists)
+
+    def randint(self, low: int, high: int) -> int:
+        face = self.roll_faces(high - low + 1, 1)[0]
+        return low + face - 1
+
+    def roll_faces(self, sides: int, count: int) -> List[int]:
+        faces = next(self._face_lists, False)
+        if faces is False:
+            raise ReplayMismatch("No recorded rolls left to replay.")
+        if faces is None:
+            raise ReplayMismatch("The recorded roll had more dice than were stored and cannot be replayed.")
+        if len(faces) != count or any(face < 1 or face > sides for face in faces):
+            raise ReplayMismatch(f"Recorded faces {faces} do not match a roll of {count}d{sides}.")
+        return list(faces)
@@ -0,0 +1,137 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+Simulation Module runs Monte Carlo simulations of rolls across several processes and
+tallies the outcomes into a histogram.
+"""
+
+# Built-in Imports
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Dict, Tuple, Union
+
+# Import Dice functionality
+from .Dice import RandomBackend, SeededRandomBackend, NumpyBackend, np
+from .DiceExpression import DiceExpression
+from .Distribution import Distribution
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+# Largest number of rows rolled at once by a vectorized worker, to bound memory use
+BATCH_SIZE = 1_000_000
+
+class Simulation(object):
+    """
+    Runs a roll scenario many times and returns the histogram of its outcomes.
+
+    Trials are split into chunks of `chunk_size` that run on a `ProcessPoolExecutor`. Every
+    chunk gets its own seeded random stream derived from `seed`, so a simulation is
+    reproducible regardless of how many workers run it. Workers send back compact
+    histograms rather than raw results, which the runner merges.
+
+    A scenario is either dice notation (a string or `DiceExpression`) or a callable that
+    takes a `RandomBackend` and returns an integer outcome. Dice notation is rolled in
+    vectorized batches when NumPy is installed. Callables must be picklable, i.e. defined at
+    the top level of a module, to run in worker processes.
+
+    Args:
+        scenario (str, DiceExpression or callable): The roll to simulate.
+        trials (int): Total number of times to run the scenario.
+        workers (int, optional): Number of worker processes. Default is None (one per CPU).
+            Use 1 to run in the current process.
+        seed (int, optional): Seed for the whole simulation. Default is None (seeded from the OS).
+        chunk_size (int, optional): Number of trials per unit of work. Default is 100,000.
+
+    Example:
+        def sneak_attack(rng):
+            return Roll.roll(num_dice=1, sides=20, rng=rng) + Roll.roll(num_dice=3, sides=6, rng=rng)
+
+        outcomes = Simulation(sneak_attack, trials=10 ** 6, seed=1).run()
+        print(outcomes.mean, outcomes.at_least(25))
+    """
+
+    def __init__(self, scenario: Union[str, DiceExpression, Callable[[RandomBackend], int]], trials: int,
+                 workers: int = None, seed: int = None, chunk_size: int = 100_000):
+        if isinstance(scenario, str):
+            scenario = DiceExpression.parse(scenario)
+        if not isinstance(scenario, DiceExpression) and not callable(scenario):
+            raise TypeError("Scenario must be dice notation, a DiceExpression or a callable.")
+        if trials < 1:
+            raise ValueError("Number of trials must be greater than 0.")
+        if chunk_size < 1:
+            raise ValueError("Chunk size must be greater than 0.")
+        if workers is not None and workers < 1:
+            raise ValueError("Number of workers must be greater than 0.")
+
+        self.scenario = scenario
+        self.trials = trials
+        self.workers = workers
+        self.seed = seed
+        self.chunk_size = chunk_size
+
+    def run(self) -> Distribution:
+        """
+        Runs every trial and merges the worker histograms.
+
+        Returns:
+            Distribution: The observed outcomes, where `counts` are the number of trials that
+            produced each outcome and `total` equals `trials`.
+        """
+        seeder = random.Random(self.seed)
+        chunks = []
+        for start in range(0, self.trials, self.chunk_size):
+            chunks.append((self.scenario, min(self.chunk_size, self.trials - start), seeder.getrandbits(128)))
+
+        histogram = Counter()
+        if self.workers == 1 or len(chunks) == 1:
+            for chunk in chunks:
+                _merge(histogram, _run_chunk(*chunk))
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as executor:
+                for result in executor.map(_run_chunk, *zip(*chunks)):
+                    _merge(histogram, result)
+
+        offset, counts = _compact(histogram)
+        return Distribution(counts, offset)
+
+def _run_chunk(scenario, trials: int, seed: int) -> Tuple[int, Tuple[int, ...]]:
+    """Runs one chunk of trials in a worker and returns its histogram as (offset, counts)."""
+    outcomes = Counter()
+    if isinstance(scenario, DiceExpression) and np is not None:
+        rng = NumpyBackend(seed)
+        for start in range(0, trials, BATCH_SIZE):
+            totals = scenario.roll_many(min(BATCH_SIZE, trials - start), rng=rng)
+            offset = int(totals.min())
+            _merge(outcomes, (offset, np.bincount(totals - offset).tolist()))
+    else:
+        rng = SeededRandomBackend(seed)
+        roll = scenario.roll if isinstance(scenario, DiceExpression) else scenario
+        outcomes.update(roll(rng) for _ in range(trials))
+    return _compact(outcomes)
+
+def _compact(histogram: Dict[int, int]) -> Tuple[int, Tuple[int, ...]]:
+    """Converts a histogram into (smallest outcome, counts of every outcome from there up)."""
+    offset = min(histogram)
+    counts = [0] * (max(histogram) - offset + 1)
+    for outcome, count in histogram.items():
+        counts[outcome - offset] = count
+    return offset, tuple(counts)
+
+def _merge(histogram: Dict[int, int], result: Tuple[int, Tuple[int, ...]]) -> None:
+    """Adds a worker's (offset, counts) histogram into the running totals."""
+    offset, counts = result
+    for index, count in enumerate(counts):
+        if count:
+            histogram[offset + index] += count
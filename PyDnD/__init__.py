@@ -20,7 +20,21 @@ __status__ = 'Open'
 
 # Initialize PyDnD Modules
 from PyDnD.Player import *
+from PyDnD.DerivedStat import *
+from PyDnD.Events import *
+from PyDnD.CompactPlayer import *
+from PyDnD.PlayerTable import *
+from PyDnD.PlayerIO import *
+from PyDnD.PlayerBinary import *
+from PyDnD.PlayerArchive import *
+from PyDnD.PlayerStore import *
+from PyDnD.PlayerJournal import *
+from PyDnD.PlayerAsync import *
 from PyDnD.Roll import *
 from PyDnD.Dice import *
+from PyDnD.Distribution import *
+from PyDnD.DiceExpression import *
+from PyDnD.Simulation import *
+from PyDnD.RollRecorder import *
 from PyDnD.LevelingSystem import *
 from PyDnD.Inventory import *
\ No newline at end of file
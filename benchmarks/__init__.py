@@ -0,0 +1,15 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+Benchmark suite for PyDnD hot paths. Runs with only the standard library; cases that need
+optional dependencies such as NumPy are skipped when they are missing.
+
+Usage:
+    python -m benchmarks                               # Run everything and print a report
+    python -m benchmarks --filter roll --output out.json
+    python -m benchmarks --save-baseline               # Store results as the baseline
+    python -m benchmarks --threshold 0.15              # Fail if anything is 15% slower than the baseline
+"""
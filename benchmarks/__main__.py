@@ -0,0 +1,80 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+Command line entry point for the benchmark suite, run with `python -m benchmarks`.
+"""
+
+# Built-in Imports
+import argparse
+import os
+import sys
+
+from . import runner
+from . import bench_dice
+from . import bench_player
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+DEFAULT_BASELINE = os.path.join(os.path.dirname(__file__), "baseline.json")
+
+def parse_threshold(value):
+    """Parses a NAME=FRACTION per-benchmark threshold override."""
+    name, _, fraction = value.partition("=")
+    if not name or not fraction:
+        raise argparse.ArgumentTypeError("Expected NAME=FRACTION, e.g. 'dice.roll.*=0.25'")
+    return name, float(fraction)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m benchmarks", description="Benchmark PyDnD hot paths.")
+    parser.add_argument("-f", "--filter", action="append", dest="patterns", metavar="PATTERN",
+                        help="only run benchmarks matching this glob pattern (repeatable)")
+    parser.add_argument("-l", "--list", action="store_true", help="list the available benchmarks and exit")
+    parser.add_argument("-o", "--output", metavar="PATH", help="write machine-readable results to PATH")
+    parser.add_argument("-b", "--baseline", metavar="PATH", default=DEFAULT_BASELINE,
+                        help="baseline results to compare against (default: %(default)s)")
+    parser.add_argument("--save-baseline", action="store_true", help="store these results as the new baseline")
+    parser.add_argument("-t", "--threshold", type=float, default=0.10,
+                        help="allowed fractional drop in ops/sec before failing (default: %(default)s)")
+    parser.add_argument("--threshold-for", type=parse_threshold, action="append", default=[], metavar="NAME=FRACTION",
+                        help="override the threshold for benchmarks matching NAME (repeatable)")
+    parser.add_argument("--min-time", type=float, default=0.5, help="minimum seconds per benchmark (default: %(default)s)")
+    parser.add_argument("--samples", type=int, default=50, help="timed groups of calls per benchmark for ops/sec (default: %(default)s)")
+    args = parser.parse_args(argv)
+
+    if args.list:
+        for name in [*runner.BENCHMARKS, *runner.MEMORY_BENCHMARKS, *runner.SIZE_BENCHMARKS]:
+            print(name)
+        return 0
+
+    results = runner.run(args.patterns, min_time=args.min_time, samples=args.samples)
+    if args.output:
+        runner.save_results(results, args.output)
+    if args.save_baseline:
+        runner.save_results(results, args.baseline)
+        print(f"Baseline saved to {args.baseline}")
+        return 0
+    if not os.path.exists(args.baseline):
+        return 0
+
+    comparisons = runner.compare(results, runner.load_results(args.baseline), args.threshold, dict(args.threshold_for))
+    print(f"\nCompared with {args.baseline}:")
+    regressions = 0
+    for comparison in comparisons:
+        status = "REGRESSION" if comparison["regressed"] else "ok"
+        regressions += comparison["regressed"]
+        print(f"{comparison['name']:<40} {comparison['change']:>+8.1%}   (allowed -{comparison['threshold']:.0%})   {status}")
+    return 1 if regressions else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
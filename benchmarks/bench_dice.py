@@ -0,0 +1,104 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+Benchmarks for the Dice and Roll hot paths.
+"""
+
+# Import PyDnD functionality
+from PyDnD.Dice import Dice, SystemRandomBackend, SeededRandomBackend, NumpyBackend, EntropyPool, np
+from PyDnD.DiceExpression import DiceExpression
+from PyDnD.Distribution import Distribution
+from PyDnD.Roll import Roll
+
+from .runner import benchmark, SkipBenchmark
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+BACKENDS = {
+    "system": SystemRandomBackend,
+    "seeded": lambda: SeededRandomBackend(1),
+    "entropy": EntropyPool,
+    "numpy": lambda: NumpyBackend(1),
+}
+
+def _backend(name):
+    """Builds a backend, skipping the benchmark when its dependency is missing."""
+    if name == "numpy" and np is None:
+        raise SkipBenchmark("NumPy is not installed")
+    return BACKENDS[name]()
+
+def _require_numpy():
+    if np is None:
+        raise SkipBenchmark("NumPy is not installed")
+
+# Single rolls
+@benchmark("roll.d20")
+def roll_d20():
+    return lambda: Roll.roll(num_dice=1, sides=20)
+
+@benchmark("roll.stat_4d6_drop_1")
+def roll_stat():
+    return lambda: Roll.roll(num_dice=4, sides=6, drop_lowest=1)
+
+@benchmark("roll.stat_4d6_drop_1.return_rolls")
+def roll_stat_return_rolls():
+    return lambda: Roll.roll(num_dice=4, sides=6, drop_lowest=1, return_rolls=True)
+
+@benchmark("roll.expression.2d8+1d6+3")
+def roll_expression():
+    return lambda: Roll.roll_expression("2d8+1d6+3")
+
+@benchmark("roll.stream.d20")
+def roll_stream():
+    return Roll.stream(num_dice=1, sides=20).__next__
+
+# Reused Dice with each backend
+def _register_backend_benchmarks(name):
+    @benchmark(f"dice.roll.d20.{name}")
+    def dice_d20():
+        return Dice(num_dice=1, sides=20, rng=_backend(name)).roll
+
+    @benchmark(f"dice.roll.stat_4d6_drop_1.{name}")
+    def dice_stat():
+        return Dice(num_dice=4, sides=6, drop_lowest=1, rng=_backend(name)).roll
+
+    @benchmark(f"dice.roll.pool_1000d6_drop_100.{name}")
+    def dice_pool():
+        return Dice(num_dice=1000, sides=6, drop_lowest=100, rng=_backend(name)).roll
+
+for _name in BACKENDS:
+    _register_backend_benchmarks(_name)
+
+# Batch rolls
+@benchmark("batch.stat_4d6_drop_1.x10000.system")
+def batch_stat_system():
+    _require_numpy()
+    dice = Dice(num_dice=4, sides=6, drop_lowest=1)
+    return lambda: dice.roll_many(10000)
+
+@benchmark("batch.stat_4d6_drop_1.x10000.numpy")
+def batch_stat_numpy():
+    dice = Dice(num_dice=4, sides=6, drop_lowest=1, rng=_backend("numpy"))
+    return lambda: dice.roll_many(10000)
+
+@benchmark("batch.expression.4d6kh3.x10000.numpy")
+def batch_expression():
+    expression = DiceExpression.parse("4d6kh3")
+    rng = _backend("numpy")
+    return lambda: expression.roll_many(10000, rng=rng)
+
+# Exact probabilities
+@benchmark("distribution.stat_4d6_drop_1.at_least")
+def distribution_lookup():
+    return lambda: Distribution.for_dice(4, 6, drop_lowest=1).at_least(15)
@@ -0,0 +1,208 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+Benchmarks comparing the Player and CompactPlayer objects.
+"""
+
+# Built-in Imports
+import copy
+import json
+
+# Import PyDnD functionality
+from PyDnD.Player import Player
+from PyDnD.CompactPlayer import CompactPlayer
+from PyDnD.PlayerBinary import PlayerReader, encode_players, decode_players
+from PyDnD.PlayerArchive import PlayerProxy
+from PyDnD.PlayerTable import PlayerTable
+from PyDnD.LevelingSystem import LevelingSystem
+from PyDnD.Dice import np
+
+from .runner import benchmark, memory_benchmark, size_benchmark, SkipBenchmark
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+# Every ability score is given, so construction is not dominated by rolling dice
+ABILITIES = dict(strength=10, dexterity=12, constitution=14, wisdom=8, intelligence=13, charisma=15)
+
+PLAYER_CLASSES = {
+    "player": Player,
+    "compact_player": CompactPlayer,
+}
+
+def _register(prefix, cls):
+    """Registers the construction, attribute access and memory benchmarks for one class."""
+    @benchmark(f"{prefix}.init")
+    def init():
+        return lambda: cls(name="Bob", alignment="CG", level=3, **ABILITIES)
+
+    @benchmark(f"{prefix}.init.rolled_abilities")
+    def init_rolled():
+        return lambda: cls(name="Bob")
+
+    @benchmark(f"{prefix}.get_strength")
+    def get_strength():
+        player = cls(**ABILITIES)
+        return lambda: player.strength
+
+    @benchmark(f"{prefix}.set_strength")
+    def set_strength():
+        player = cls(**ABILITIES)
+        def setter():
+            player.strength = 14
+        return setter
+
+    @benchmark(f"{prefix}.get_modifier")
+    def get_modifier():
+        player = cls(**ABILITIES)
+        return lambda: player.get_modifier(player.dexterity)
+
+    @memory_benchmark(f"{prefix}.memory")
+    def memory():
+        return lambda: cls(name="Bob", alignment="CG", **ABILITIES)
+
+for _prefix, _cls in PLAYER_CLASSES.items():
+    _register(_prefix, _cls)
+
+# Branching a character, as AI planners do
+@benchmark("player.copy.deepcopy")
+def copy_deepcopy():
+    player = _roster(1)[0]
+    return lambda: copy.deepcopy(player)
+
+@benchmark("player.copy.fork")
+def copy_fork():
+    player = _roster(1)[0]
+    return player.fork
+
+@benchmark("player.copy.snapshot_rollback")
+def copy_snapshot_rollback():
+    player = _roster(1)[0]
+    snapshot = player.snapshot()
+    def branch():
+        player.hp = 7
+        player.rollback(snapshot)
+    return branch
+
+@benchmark("player.experience.grant_and_reset")
+def experience_grant_and_reset():
+    player = _roster(1)[0]
+    def grant():
+        player.giveExp(50000000)
+        player.removeExp(player.experience)
+    return grant
+
+# Awarding encounter experience to a roster
+@benchmark("player.award.x1000.giveExp")
+def award_give_exp():
+    roster = _roster()
+    def award():
+        for player in roster:
+            player.giveExp(750)
+    return award
+
+@benchmark("player.award.x1000.bulk")
+def award_bulk():
+    if np is None:
+        raise SkipBenchmark("NumPy is not installed")
+    roster = _roster()
+    return lambda: LevelingSystem.award_players(roster, 750)
+
+@benchmark("player.award.x1000.table")
+def award_table():
+    if np is None:
+        raise SkipBenchmark("NumPy is not installed")
+    table = PlayerTable.from_players(_roster())
+    return lambda: table.award_experience(750)
+
+@benchmark("player.derived.strength_modifier")
+def derived_strength_modifier():
+    player = Player(**ABILITIES)
+    return lambda: player.strength_modifier
+
+def _roster(count=1000):
+    """Builds a roster where some players carry a few common items."""
+    roster = [Player(name=f"Villager {index}", alignment="NG", level=index % 10 + 1, **ABILITIES) for index in range(count)]
+    for player in roster[::4]:
+        player.add_item_to_inventory("Potion of Healing", 2)
+        player.add_item_to_inventory("Torch")
+    return roster
+
+# Serialization, 1000 players per call
+@benchmark("player.serialize.json")
+def serialize_json():
+    roster = _roster()
+    return lambda: [json.dumps(player.to_dict(), indent=4) for player in roster]
+
+@benchmark("player.serialize.binary")
+def serialize_binary():
+    roster = _roster()
+    return lambda: encode_players(roster)
+
+@benchmark("player.deserialize.json")
+def deserialize_json():
+    encoded = [json.dumps(player.to_dict(), indent=4) for player in _roster()]
+    return lambda: [Player.from_dict(json.loads(player_json)) for player_json in encoded]
+
+@benchmark("player.deserialize.json.trusted")
+def deserialize_json_trusted():
+    encoded = [json.dumps(player.to_dict(), indent=4) for player in _roster()]
+    return lambda: [Player.from_dict(json.loads(player_json), trusted=True) for player_json in encoded]
+
+@benchmark("player.deserialize.binary")
+def deserialize_binary():
+    encoded = encode_players(_roster())
+    return lambda: decode_players(encoded)
+
+# Parsing only, without building Player objects
+@benchmark("player.parse.json")
+def parse_json():
+    encoded = [json.dumps(player.to_dict(), indent=4) for player in _roster()]
+    return lambda: [json.loads(player_json) for player_json in encoded]
+
+@benchmark("player.parse.binary")
+def parse_binary():
+    encoded = encode_players(_roster())
+    def parse():
+        reader = PlayerReader(encoded)
+        return [reader.read_dict(index) for index in range(len(reader))]
+    return parse
+
+# Reading two fields from every tenth player
+@benchmark("player.lookup.json")
+def lookup_json():
+    encoded = [json.dumps(player.to_dict(), indent=4) for player in _roster()][::10]
+    def lookup():
+        for player_json in encoded:
+            player = Player.from_dict(json.loads(player_json))
+            player.name, player.level
+    return lookup
+
+@benchmark("player.lookup.proxy")
+def lookup_proxy():
+    reader = PlayerReader(encode_players(_roster()))
+    def lookup():
+        for index in range(0, len(reader), 10):
+            player = PlayerProxy(reader, index)
+            player.name, player.level
+    return lookup
+
+@size_benchmark("player.size.json")
+def size_json():
+    roster = _roster()
+    return lambda: sum(len(json.dumps(player.to_dict(), indent=4).encode("utf-8")) for player in roster)
+
+@size_benchmark("player.size.binary")
+def size_binary():
+    roster = _roster()
+    return lambda: len(encode_players(roster))
@@ -0,0 +1,311 @@
+"""
+PyDnD is a python package for integrating DnD rulesets into external
+applications.
+
+{License_info}
+
+Runner Module times registered benchmarks, writes machine-readable results and compares them
+against a stored baseline.
+"""
+
+# Built-in Imports
+import fnmatch
+import json
+import platform
+import statistics
+import time
+import tracemalloc
+from typing import Callable, Dict, List
+
+# META Data
+__author__ = 'CFDeadlines'
+__copyright__ = 'Copyright 2024, CFDeadlines'
+__credits__ = ['CFDeadlines (Lead Programmer, Creator)']
+__license__ = '{license}'
+__version__ = '1.0.0'
+__maintainer__ = 'CFDeadlines'
+__email__ = 'cookm0803@gmail.com'
+__status__ = 'Open'
+
+################
+#  Exceptions  #
+################
+class SkipBenchmark(Exception):
+    pass
+
+# Registered benchmarks, by name, in registration order
+BENCHMARKS = {}
+
+# Registered memory benchmarks, by name, in registration order
+MEMORY_BENCHMARKS = {}
+
+# Registered size benchmarks, by name, in registration order
+SIZE_BENCHMARKS = {}
+
+def benchmark(name: str):
+    """
+    Registers a benchmark under `name`.
+
+    The decorated function does any setup and returns the zero-argument callable to time. It
+    may raise SkipBenchmark (or ImportError) when the benchmark cannot run here.
+
+    Example:
+        @benchmark("dice.roll.d20")
+        def single_d20():
+            return Dice(num_dice=1, sides=20).roll
+    """
+    def register(setup: Callable[[], Callable[[], object]]):
+        if name in BENCHMARKS:
+            raise ValueError(f"Benchmark '{name}' is already registered")
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+def memory_benchmark(name: str):
+    """
+    Registers a memory benchmark under `name`.
+
+    The decorated function does any setup and returns a zero-argument factory; the benchmark
+    reports how many bytes each object it creates keeps alive.
+
+    Example:
+        @memory_benchmark("dice.memory")
+        def dice_memory():
+            return lambda: Dice(num_dice=4, sides=6)
+    """
+    def register(setup: Callable[[], Callable[[], object]]):
+        if name in MEMORY_BENCHMARKS:
+            raise ValueError(f"Memory benchmark '{name}' is already registered")
+        MEMORY_BENCHMARKS[name] = setup
+        return setup
+    return register
+
+def size_benchmark(name: str):
+    """
+    Registers a size benchmark under `name`.
+
+    The decorated function does any setup and returns a zero-argument callable that returns
+    the size in bytes of some output, e.g. an encoded file.
+
+    Example:
+        @size_benchmark("player.size.json")
+        def json_size():
+            return lambda: len(json.dumps(roster))
+    """
+    def register(setup: Callable[[], Callable[[], int]]):
+        if name in SIZE_BENCHMARKS:
+            raise ValueError(f"Size benchmark '{name}' is already registered")
+        SIZE_BENCHMARKS[name] = setup
+        return setup
+    return register
+
+def measure_memory(factory: Callable[[], object], count: int = 10000) -> Dict[str, float]:
+    """
+    Measures the memory kept alive by objects from a factory, using tracemalloc.
+
+    Args:
+        factory (callable): The zero-argument callable that creates one object.
+        count (int, optional): Number of objects to create and keep. Default is 10,000.
+
+    Returns:
+        dict: bytes_per_instance and instances.
+    """
+    # Warm up caches so they are not counted against the first instances
+    factory()
+    instances = [None] * count
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        for index in range(count):
+            instances[index] = factory()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return {"bytes_per_instance": (after - before) / count, "instances": count}
+
+def measure(func: Callable[[], object], min_time: float = 0.5, samples: int = 50,
+            max_latency_calls: int = 100000) -> Dict[str, float]:
+    """
+    Times a callable and returns its throughput and per-call latency percentiles.
+
+    Throughput is timed over `samples` groups of calls large enough to dwarf timer overhead.
+    The percentiles come from timing calls one at a time, less the measured cost of reading
+    the timer, so a slow call is not averaged away by the rest of its group.
+
+    Args:
+        func (callable): The zero-argument callable to time.
+        min_time (float, optional): Minimum total seconds to spend on each phase. Default is 0.5.
+        samples (int, optional): Number of groups to time for throughput. Default is 50.
+        max_latency_calls (int, optional): Most calls to time one at a time. Default is 100,000.
+
+    Returns:
+        dict: ops_per_sec, mean_ns, p50_ns, p90_ns, p99_ns, samples, calls and latency_calls.
+    """
+    # Warm up and size the groups so every sample takes about min_time / samples
+    func()
+    group = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(group):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / samples or group >= 1 << 24:
+            break
+        group *= 2
+
+    total = 0
+    for _ in range(samples):
+        start = time.perf_counter_ns()
+        for _ in range(group):
+            func()
+        total += time.perf_counter_ns() - start
+    mean = total / (samples * group)
+
+    # Time single calls for about as long as the groups took, with enough calls for a p99
+    clock = time.perf_counter_ns
+    overhead = _timer_overhead_ns()
+    latencies = [0] * max(100, min(samples * group, max_latency_calls))
+    for index in range(len(latencies)):
+        start = clock()
+        func()
+        latencies[index] = clock() - start
+    cuts = statistics.quantiles([max(latency - overhead, 0) for latency in latencies], n=100, method="inclusive")
+    return {
+        "ops_per_sec": 1e9 / mean,
+        "mean_ns": mean,
+        "p50_ns": cuts[49],
+        "p90_ns": cuts[89],
+        "p99_ns": cuts[98],
+        "samples": samples,
+        "calls": samples * group,
+        "latency_calls": len(latencies),
+    }
+
+def run(patterns: List[str] = None, min_time: float = 0.5, samples: int = 50, report: Callable[[str], None] = print) -> Dict[str, object]:
+    """
+    Runs every registered benchmark whose name matches one of `patterns`.
+
+    Args:
+        patterns (List[str], optional): Glob patterns to select benchmarks. Default is None (all).
+        min_time (float, optional): Minimum seconds to spend on each benchmark. Default is 0.5.
+        samples (int, optional): Number of timed groups per benchmark for ops/sec. Default is 50.
+        report (callable, optional): Called with one line of text per benchmark. Default is print.
+
+    Returns:
+        dict: Machine-readable results, with environment details, a "results" mapping of
+        timings, a "memory" mapping of memory benchmarks and a "sizes" mapping of size benchmarks.
+    """
+    results = {}
+    skipped = {}
+    for name, setup in BENCHMARKS.items():
+        if patterns and not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+            continue
+        try:
+            func = setup()
+        except (SkipBenchmark, ImportError) as e:
+            skipped[name] = str(e)
+            report(f"{name:<40} skipped ({e})")
+            continue
+        results[name] = measure(func, min_time=min_time, samples=samples)
+        report(format_result(name, results[name]))
+
+    memory = {}
+    for name, setup in MEMORY_BENCHMARKS.items():
+        if patterns and not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+            continue
+        try:
+            factory = setup()
+        except (SkipBenchmark, ImportError) as e:
+            skipped[name] = str(e)
+            report(f"{name:<40} skipped ({e})")
+            continue
+        memory[name] = measure_memory(factory)
+        report(f"{name:<40} {memory[name]['bytes_per_instance']:>14,.0f} bytes/instance")
+
+    sizes = {}
+    for name, setup in SIZE_BENCHMARKS.items():
+        if patterns and not any(fnmatch.fnmatch(name, pattern) for pattern in patterns):
+            continue
+        try:
+            size = setup()
+        except (SkipBenchmark, ImportError) as e:
+            skipped[name] = str(e)
+            report(f"{name:<40} skipped ({e})")
+            continue
+        sizes[name] = {"bytes": size()}
+        report(f"{name:<40} {sizes[name]['bytes']:>14,} bytes")
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "timestamp": time.time(),
+        "results": results,
+        "memory": memory,
+        "sizes": sizes,
+        "skipped": skipped,
+    }
+
+def format_result(name: str, result: Dict[str, float]) -> str:
+    """Formats one benchmark result as a line of the text report."""
+    return (f"{name:<40} {result['ops_per_sec']:>14,.0f} ops/s"
+            f"   p50 {_format_ns(result['p50_ns'])}   p90 {_format_ns(result['p90_ns'])}   p99 {_format_ns(result['p99_ns'])}")
+
+def compare(current: Dict[str, object], baseline: Dict[str, object], threshold: float = 0.10,
+            thresholds: Dict[str, float] = None) -> List[Dict[str, object]]:
+    """
+    Compares results against a baseline.
+
+    Args:
+        current (dict): Results returned by `run`.
+        baseline (dict): Previously saved results.
+        threshold (float, optional): Allowed fractional drop in ops/sec before a benchmark
+            counts as a regression. Default is 0.10 (10%).
+        thresholds (dict, optional): Per-benchmark overrides of `threshold`, by name or glob pattern.
+
+    Returns:
+        List[dict]: One entry per benchmark present in both, with name, baseline and current
+        ops/sec, change (fractional) and regressed (bool).
+    """
+    thresholds = thresholds or {}
+    comparisons = []
+    for name, result in current["results"].items():
+        previous = baseline.get("results", {}).get(name)
+        if previous is None:
+            continue
+        allowed = next((value for pattern, value in thresholds.items() if fnmatch.fnmatch(name, pattern)), threshold)
+        change = result["ops_per_sec"] / previous["ops_per_sec"] - 1
+        comparisons.append({
+            "name": name,
+            "baseline_ops_per_sec": previous["ops_per_sec"],
+            "ops_per_sec": result["ops_per_sec"],
+            "change": change,
+            "threshold": allowed,
+            "regressed": change < -allowed,
+        })
+    return comparisons
+
+def load_results(filepath: str) -> Dict[str, object]:
+    """Reads results written by `save_results`."""
+    with open(filepath, "r") as results_file:
+        return json.load(results_file)
+
+def save_results(results: Dict[str, object], filepath: str) -> None:
+    """Writes results as JSON."""
+    with open(filepath, "w") as results_file:
+        json.dump(results, results_file, indent=4, sort_keys=True)
+
+def _timer_overhead_ns(reads: int = 1000) -> float:
+    """Returns the median time between two back-to-back timer reads, in nanoseconds."""
+    clock = time.perf_counter_ns
+    gaps = [0] * reads
+    for index in range(reads):
+        start = clock()
+        gaps[index] = clock() - start
+    return statistics.median(gaps)
+
+def _format_ns(nanoseconds: float) -> str:
+    """Formats a latency with a readable unit."""
+    for unit, scale in (("s", 1e9), ("ms", 1e6), ("us", 1e3)):
+        if nanoseconds >= scale:
+            return f"{nanoseconds / scale:>7.2f}{unit:<2}"
+    return f"{nanoseconds:>7.0f}ns"
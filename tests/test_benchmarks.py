@@ -0,0 +1,59 @@
+import time
+import unittest
+
+from benchmarks import runner
+
+class TestBenchmarkRunner(unittest.TestCase):
+
+    def test_measure(self):
+        """Test that measuring a callable reports throughput and ordered percentiles."""
+        result = runner.measure(lambda: sum(range(10)), min_time=0.01, samples=5)
+        self.assertGreater(result["ops_per_sec"], 0)
+        self.assertLessEqual(result["p50_ns"], result["p90_ns"])
+        self.assertLessEqual(result["p90_ns"], result["p99_ns"])
+        self.assertEqual(result["samples"], 5)
+
+    def test_measure_keeps_tail_latency(self):
+        """Test that one slow call in fifty shows up in p99 instead of being averaged away."""
+        calls = iter(range(10 ** 7))
+        slow = lambda: time.sleep(0.002) if next(calls) % 50 == 0 else None
+        result = runner.measure(slow, min_time=0.01, samples=2, max_latency_calls=300)
+        self.assertEqual(result["latency_calls"], max(100, min(result["calls"], 300)))
+        self.assertLess(result["p50_ns"], 1e6)
+        self.assertGreater(result["p99_ns"], 1e6)
+
+    def test_measure_memory(self):
+        """Test that memory benchmarks report the bytes kept alive per instance."""
+        result = runner.measure_memory(lambda: bytearray(1000), count=100)
+        self.assertEqual(result["instances"], 100)
+        self.assertGreaterEqual(result["bytes_per_instance"], 1000)
+        self.assertLess(result["bytes_per_instance"], 1200)
+
+    def test_run_skips_and_filters(self):
+        """Test that runs honour filters and report skipped benchmarks."""
+        def skipped():
+            raise runner.SkipBenchmark("not here")
+        runner.BENCHMARKS["test.skipped"] = skipped
+        runner.BENCHMARKS["test.noop"] = lambda: (lambda: None)
+        try:
+            results = runner.run(["test.*"], min_time=0.01, samples=3, report=lambda line: None)
+        finally:
+            del runner.BENCHMARKS["test.skipped"]
+            del runner.BENCHMARKS["test.noop"]
+        self.assertEqual(list(results["results"]), ["test.noop"])
+        self.assertEqual(results["skipped"], {"test.skipped": "not here"})
+
+    def test_compare(self):
+        """Test regression detection with default and per-benchmark thresholds."""
+        baseline = {"results": {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}, "c": {"ops_per_sec": 100.0}}}
+        current = {"results": {"a": {"ops_per_sec": 95.0}, "b": {"ops_per_sec": 80.0}, "c": {"ops_per_sec": 80.0},
+                               "new": {"ops_per_sec": 1.0}}}
+        comparisons = {entry["name"]: entry for entry in runner.compare(current, baseline, threshold=0.10, thresholds={"c": 0.25})}
+        self.assertEqual(set(comparisons), {"a", "b", "c"})
+        self.assertFalse(comparisons["a"]["regressed"])
+        self.assertTrue(comparisons["b"]["regressed"])
+        self.assertFalse(comparisons["c"]["regressed"])
+        self.assertAlmostEqual(comparisons["b"]["change"], -0.2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+import unittest
+from PyDnD.Player import Player
+from PyDnD.CompactPlayer import CompactPlayer
+from PyDnD.Inventory import InventoryIsFull
+
+PLAYER_ARGS = dict(name="Test Player", age="25", gender="Male", alignment="ng", description="A brave warrior",
+                   biography="Born to be a hero", level=3, wealth=100, strength=15, dexterity=12, constitution=14,
+                   wisdom=10, intelligence=13, charisma=8, hp=10, mp=5, inventory_size=2)
+
+FIELDS = ("name", "age", "gender", "alignment", "description", "biography", "level", "wealth", "strength",
+          "dexterity", "constitution", "wisdom", "intelligence", "charisma", "hp", "mp", "skillpoints",
+          "featpoints", "experience", "nextLvlExperience")
+
+class TestCompactPlayer(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a Player and a CompactPlayer with the same arguments."""
+        self.player = Player(**PLAYER_ARGS)
+        self.compact = CompactPlayer(**PLAYER_ARGS)
+
+    def assertSameFields(self, first, second):
+        for field in FIELDS:
+            self.assertEqual(getattr(first, field), getattr(second, field), field)
+
+    def test_initialization_matches_player(self):
+        """Test that a CompactPlayer is initialized exactly like a Player."""
+        self.assertSameFields(self.compact, self.player)
+        self.assertEqual(self.compact.get_inventory_max_size(), 2)
+
+    def test_no_instance_dict(self):
+        """Test that fields are stored in slots rather than an instance dictionary."""
+        self.assertFalse(hasattr(self.compact, "__dict__"))
+        with self.assertRaises(AttributeError):
+            self.compact.nickname = "Bob"
+
+    def test_rolled_abilities(self):
+        """Test that unspecified ability scores are rolled with 4d6 drop the lowest."""
+        compact = CompactPlayer()
+        for ability in ("strength", "dexterity", "constitution", "wisdom", "intelligence", "charisma"):
+            self.assertTrue(3 <= getattr(compact, ability) <= 18)
+        compact.strength = None
+        self.assertTrue(3 <= compact.strength <= 18)
+
+    def test_validation_matches_player(self):
+        """Test that every invalid value raises the same error as it does on Player."""
+        invalid = [("name", 5), ("biography", 1.5), ("alignment", "XX"), ("alignment", "LGE"), ("level", 0),
+                   ("level", "2"), ("wealth", -1), ("strength", -1), ("intelligence", -1), ("hp", 0),
+                   ("mp", -1), ("skillpoints", -1), ("featpoints", 2.0)]
+        for field, value in invalid:
+            with self.assertRaises(ValueError) as expected:
+                setattr(self.player, field, value)
+            with self.assertRaises(ValueError) as actual:
+                setattr(self.compact, field, value)
+            self.assertEqual(str(actual.exception), str(expected.exception))
+
+    def test_none_defaults_match_player(self):
+        """Test that None is handled the same way as on Player."""
+        for field in ("name", "alignment", "level", "wealth", "hp", "mp", "skillpoints", "featpoints"):
+            setattr(self.player, field, None)
+            setattr(self.compact, field, None)
+            self.assertEqual(getattr(self.compact, field), getattr(self.player, field), field)
+
+    def test_experience_and_leveling(self):
+        """Test that experience changes level the CompactPlayer the same way as a Player."""
+        for player in (self.player, self.compact):
+            player.giveExp(4000)
+            player.removeExp(2500)
+            player.experience = 12000
+        self.assertSameFields(self.compact, self.player)
+
+    def test_inventory(self):
+        """Test that the inventory is created on first use and respects its size."""
+        self.compact.add_item_to_inventory("Potion", 2)
+        self.assertEqual(self.compact.get_inventory(), ["Potion", "Potion"])
+        with self.assertRaises(InventoryIsFull):
+            self.compact.add_item_to_inventory("Sword")
+
+    def test_player_round_trip(self):
+        """Test converting a Player to a CompactPlayer and back keeps every field."""
+        self.player.giveExp(2500)
+        self.player.add_item_to_inventory("Sword")
+        compact = CompactPlayer.from_player(self.player)
+        restored = compact.to_player()
+        self.assertIsInstance(restored, Player)
+        self.assertEqual(compact.uid, self.player.uid)
+        self.assertEqual(restored.uid, self.player.uid)
+        self.assertSameFields(compact, self.player)
+        self.assertSameFields(restored, self.player)
+        self.assertEqual(restored.get_inventory(), ["Sword"])
+        self.assertEqual(restored.get_inventory_max_size(), 2)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+import unittest
+from PyDnD.Player import Player
+from PyDnD.DerivedStat import DerivedStat, derived_stat
+
+class Fighter(Player):
+    calculations = 0
+
+    @derived_stat("strength_modifier", "proficiency_bonus")
+    def attack_bonus(self):
+        Fighter.calculations += 1
+        return self.strength_modifier + self.proficiency_bonus
+
+class TestDerivedStat(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a player with known ability scores."""
+        self.player = Player(level=1, strength=14, dexterity=16, constitution=12, wisdom=10, intelligence=8, charisma=18)
+
+    def test_builtin_stats(self):
+        """Test the modifiers, proficiency bonus and dexterity based stats."""
+        self.assertEqual([self.player.strength_modifier, self.player.dexterity_modifier, self.player.constitution_modifier,
+                          self.player.wisdom_modifier, self.player.intelligence_modifier, self.player.charisma_modifier],
+                         [2, 3, 1, 0, -1, 4])
+        self.assertEqual((self.player.armor_class, self.player.initiative, self.player.proficiency_bonus), (13, 3, 2))
+
+    def test_values_are_cached(self):
+        """Test that a derived value is stored on the instance after the first read."""
+        self.assertNotIn("strength_modifier", self.player.__dict__)
+        self.assertEqual(self.player.strength_modifier, 2)
+        self.assertEqual(self.player.__dict__["strength_modifier"], 2)
+        self.assertIsInstance(Player.strength_modifier, DerivedStat)
+
+    def test_setter_invalidates_dependents_only(self):
+        """Test that setting an attribute clears the stats built on it, directly or indirectly, and nothing else."""
+        self.player.armor_class, self.player.strength_modifier
+        self.player.dexterity = 10
+        self.assertNotIn("armor_class", self.player.__dict__)
+        self.assertIn("strength_modifier", self.player.__dict__)
+        self.assertEqual((self.player.dexterity_modifier, self.player.armor_class, self.player.initiative), (0, 10, 0))
+
+    def test_leveling_invalidates_proficiency(self):
+        """Test that a level gained through experience updates the proficiency bonus."""
+        self.assertEqual(self.player.proficiency_bonus, 2)
+        self.player.giveExp(15000)
+        self.assertEqual(self.player.level, 6)
+        self.assertEqual(self.player.proficiency_bonus, 3)
+
+    def test_subclass_stats(self):
+        """Test that a subclass can add stats that depend on other derived stats, calculated only when needed."""
+        fighter = Fighter(level=5, strength=16)
+        Fighter.calculations = 0
+        self.assertEqual((fighter.attack_bonus, fighter.attack_bonus), (6, 6))
+        fighter.hp = 10
+        self.assertEqual(fighter.attack_bonus, 6)
+        self.assertEqual(Fighter.calculations, 1)
+        fighter.strength = 18
+        self.assertEqual(fighter.attack_bonus, 7)
+        self.assertEqual(Fighter.calculations, 2)
+        self.assertFalse(hasattr(Player, "attack_bonus"))
+
+    def test_invalid_dependencies(self):
+        """Test that unknown and circular dependencies are rejected when the class is created."""
+        with self.assertRaisesRegex(ValueError, "experience"):
+            class Broken(Player):
+                @derived_stat("experience")
+                def rank(self):
+                    return self.experience // 1000
+        with self.assertRaisesRegex(ValueError, "itself"):
+            class Circular(Player):
+                @derived_stat("second")
+                def first(self):
+                    return self.second
+
+                @derived_stat("first")
+                def second(self):
+                    return self.first
+        with self.assertRaises(ValueError):
+            derived_stat()
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,22 @@
 import unittest
-from PyDnD.Dice import Dice
+from PyDnD.Dice import (Dice, RandomBackend, SystemRandomBackend, SeededRandomBackend, NumpyBackend, EntropyPool,
+                        get_default_backend, set_default_backend)
+from PyDnD.Distribution import Distribution
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class ScriptedBackend(RandomBackend):
+    """Backend that returns a fixed sequence of faces, to check exactly which dice are rolled."""
+
+    def __init__(self, faces):
+        self.faces = list(faces)
+
+    def roll_faces(self, sides, count):
+        faces, self.faces = self.faces[:count], self.faces[count:]
+        return faces
 
 class TestDice(unittest.TestCase):
 
@@ -48,6 +65,251 @@ class TestDice(unittest.TestCase):
         """Test rolling with drop_lowest greater than num_dice."""
         with self.assertRaises(ValueError):
             Dice(num_dice=2, sides=6, drop_lowest=3)
+    def test_dice_with_keep_highest(self):
+        """Test rolling dice and keeping the highest rolls."""
+        dice = Dice(num_dice=4, sides=6, keep_highest=3, rng=SeededRandomBackend(1))
+        dice.roll()
+        self.assertEqual(dice.drop_lowest, 1)
+        self.assertEqual(dice.value, sum(dice.rolls[:3]))
+
+    def test_dice_with_keep_lowest(self):
+        """Test rolling dice and keeping the lowest roll."""
+        dice = Dice(num_dice=2, sides=20, keep_lowest=1, rng=SeededRandomBackend(2))
+        dice.roll()
+        self.assertEqual(dice.value, min(dice.rolls))
+
+    def test_dice_with_drop_highest_and_lowest(self):
+        """Test dropping both the highest and the lowest rolls."""
+        dice = Dice(num_dice=5, sides=6, drop_lowest=1, drop_highest=1, rng=SeededRandomBackend(3))
+        dice.roll()
+        self.assertEqual(dice.value, sum(dice.rolls[1:4]))
+
+    def test_large_pool_selection(self):
+        """Test that large pools counted by face match a full sort."""
+        dice = Dice(num_dice=500, sides=10, modifier=2, drop_lowest=37, drop_highest=41, rng=SeededRandomBackend(4))
+        dice.roll()
+        self.assertEqual(len(dice.rolls), 500)
+        self.assertEqual(dice.value, sum(dice.rolls[41:463]) + 2)
+        self.assertEqual(dice.rolls, sorted(dice.rolls, reverse=True))
+
+    def test_dice_with_invalid_keep(self):
+        """Test invalid combinations of keep and drop options."""
+        with self.assertRaises(ValueError):
+            Dice(num_dice=4, sides=6, keep_highest=5)
+        with self.assertRaises(ValueError):
+            Dice(num_dice=4, sides=6, keep_highest=0)
+        with self.assertRaises(ValueError):
+            Dice(num_dice=4, sides=6, keep_highest=2, drop_lowest=1)
+        with self.assertRaises(ValueError):
+            Dice(num_dice=4, sides=6, drop_lowest=2, drop_highest=2)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_many_keep_lowest(self):
+        """Test that batch rolls keep the lowest dice of each row."""
+        dice = Dice(num_dice=3, sides=20, keep_lowest=1, rng=NumpyBackend(5))
+        totals, rolls = dice.roll_many(300, return_rolls=True)
+        np.testing.assert_array_equal(totals, rolls.min(axis=1))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_many_totals(self):
+        """Test rolling a batch of dice returns one total per roll."""
+        dice = Dice(num_dice=3, sides=6, modifier=1)
+        totals = dice.roll_many(1000)
+        self.assertEqual(totals.shape, (1000,))
+        self.assertTrue(((totals >= 4) & (totals <= 19)).all(), "Totals should be between 4 and 19")
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_many_drop_lowest(self):
+        """Test that a batch roll drops the lowest die of each row."""
+        dice = Dice(num_dice=4, sides=6, drop_lowest=1)
+        totals, rolls = dice.roll_many(500, return_rolls=True)
+        self.assertEqual(rolls.shape, (500, 4))
+        self.assertTrue(((rolls >= 1) & (rolls <= 6)).all(), "Each roll should be between 1 and 6")
+        self.assertTrue((rolls[:, :-1] >= rolls[:, 1:]).all(), "Rows should be sorted highest first")
+        np.testing.assert_array_equal(totals, rolls[:, :3].sum(axis=1))
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_many_negative(self):
+        """Test that a negative batch size raises a ValueError."""
+        with self.assertRaises(ValueError):
+            Dice(num_dice=1, sides=6).roll_many(-1)
+    def test_exploding_dice(self):
+        """Test that dice showing their highest face roll again and add, for as long as they roll it."""
+        dice = Dice(num_dice=3, sides=6, explode=True, rng=ScriptedBackend([6, 2, 6, 6, 1, 3]))
+        dice.roll()
+        self.assertEqual(dice.rolls, [15, 7, 2])
+        self.assertEqual(dice.value, 24)
+
+    def test_exploding_totals(self):
+        """Test that an exploding die never totals a multiple of its sides."""
+        dice = Dice(num_dice=1, sides=4, explode=True, rng=SeededRandomBackend(8))
+        totals = set()
+        for _ in range(500):
+            dice.roll()
+            totals.add(dice.value)
+        self.assertTrue(max(totals) > 4, "Some rolls should explode")
+        self.assertFalse(any(total % 4 == 0 for total in totals))
+
+    def test_reroll_below(self):
+        """Test that low dice are rerolled once and the new face kept, even if it is low again."""
+        dice = Dice(num_dice=4, sides=6, reroll_below=2, rng=ScriptedBackend([1, 5, 2, 3, 1, 4]))
+        dice.roll()
+        self.assertEqual(dice.rolls, [5, 4, 3, 1])
+
+    def test_minimum_face(self):
+        """Test that dice below the minimum count as the minimum, and explode on their rolled face."""
+        dice = Dice(num_dice=3, sides=6, minimum_face=3, explode=True, rng=ScriptedBackend([1, 6, 4, 2]))
+        dice.roll()
+        self.assertEqual(dice.rolls, [8, 4, 3])
+
+    def test_invalid_face_rules(self):
+        """Test out of range reroll, minimum and explode rules."""
+        with self.assertRaises(ValueError):
+            Dice(num_dice=1, sides=1, explode=True)
+        with self.assertRaises(ValueError):
+            Dice(num_dice=1, sides=6, reroll_below=6)
+        with self.assertRaises(ValueError):
+            Dice(num_dice=1, sides=6, minimum_face=7)
+        with self.assertRaises(ValueError):
+            Dice(num_dice=1, sides=6, explode=True).distribution()
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_many_exploding(self):
+        """Test that batch explosions follow the expected mean of an exploding die."""
+        dice = Dice(num_dice=2, sides=6, explode=True, rng=NumpyBackend(6))
+        totals, rolls = dice.roll_many(100000, return_rolls=True)
+        self.assertFalse((rolls % 6 == 0).any(), "No chain should end on the highest face")
+        np.testing.assert_array_equal(totals, rolls.sum(axis=1))
+        self.assertAlmostEqual(totals.mean(), 2 * 4.2, delta=0.05)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_many_reroll_and_minimum(self):
+        """Test that batch rerolls and minimums match the exact distribution."""
+        dice = Dice(num_dice=1, sides=6, reroll_below=1, minimum_face=2, rng=NumpyBackend(7))
+        totals = dice.roll_many(200000)
+        expected = Distribution.for_dice(1, 6, reroll_below=1, minimum_face=2)
+        for value in range(1, 7):
+            self.assertAlmostEqual((totals == value).mean(), expected.probability(value), delta=0.005)
+
+class TestRandomBackends(unittest.TestCase):
+
+    def tearDown(self):
+        """Restore the default backend changed by a test."""
+        set_default_backend(SystemRandomBackend())
+
+    def test_default_backend(self):
+        """Test that Dice uses the module default backend when none is given."""
+        self.assertIsInstance(get_default_backend(), SystemRandomBackend)
+        self.assertIs(Dice().random_generator, get_default_backend())
+
+    def test_seeded_backend_is_reproducible(self):
+        """Test that two seeded backends with the same seed roll the same results."""
+        first = Dice(num_dice=10, sides=20, rng=SeededRandomBackend(42))
+        second = Dice(num_dice=10, sides=20, rng=SeededRandomBackend(42))
+        first.roll()
+        second.roll()
+        self.assertEqual(first.rolls, second.rolls)
+        for roll in first.rolls:
+            self.assertIn(roll, range(1, 21), "Each roll should be between 1 and 20")
+
+    def test_set_default_backend(self):
+        """Test that a shared seeded default backend makes rolls reproducible."""
+        set_default_backend(SeededRandomBackend(7))
+        dice = Dice(num_dice=4, sides=6)
+        dice.roll()
+        expected = dice.rolls
+        get_default_backend().seed(7)
+        dice.roll()
+        self.assertEqual(dice.rolls, expected)
+
+    def test_set_default_backend_invalid(self):
+        """Test that setting a non-backend as the default raises a TypeError."""
+        with self.assertRaises(TypeError):
+            set_default_backend(object())
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_backend_is_reproducible(self):
+        """Test that NumPy backends with the same seed roll the same batch."""
+        first = Dice(num_dice=4, sides=6, drop_lowest=1, rng=NumpyBackend(3)).roll_many(100)
+        second = Dice(num_dice=4, sides=6, drop_lowest=1, rng=NumpyBackend(3)).roll_many(100)
+        np.testing.assert_array_equal(first, second)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_numpy_backend_single_roll(self):
+        """Test rolling a single set of dice with the NumPy backend."""
+        dice = Dice(num_dice=3, sides=8, rng=NumpyBackend(1))
+        dice.roll()
+        self.assertEqual(len(dice.rolls), 3)
+        self.assertIsInstance(dice.value, int)
+        self.assertIn(dice.value, range(3, 25), "Roll value should be between 3 and 24")
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_seeded_backend_batch_is_reproducible(self):
+        """Test that batches drawn from a seeded backend are reproducible."""
+        first = SeededRandomBackend(5).roll_array(6, (10, 3))
+        second = SeededRandomBackend(5).roll_array(6, (10, 3))
+        np.testing.assert_array_equal(first, second)
+        self.assertTrue(((first >= 1) & (first <= 6)).all())
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_secure_batch_with_huge_dice(self):
+        """Test that OS-entropy batches handle dice with 2**32 sides or more, up to the int64 limit."""
+        for rng in (SystemRandomBackend(), EntropyPool()):
+            for sides in (2 ** 32, 2 ** 33 + 1, 2 ** 63 - 1):
+                faces = rng.roll_array(sides, (50, 2))
+                self.assertEqual(faces.shape, (50, 2))
+                self.assertTrue(((faces >= 1) & (faces <= sides)).all())
+            self.assertGreater(int(rng.roll_array(2 ** 40, (200,)).max()), 2 ** 32)
+            with self.assertRaises(ValueError):
+                rng.roll_array(2 ** 63, (2,))
+
+class TestEntropyPool(unittest.TestCase):
+
+    def test_faces_in_range(self):
+        """Test that faces are within range for small and large dice."""
+        pool = EntropyPool(block_size=64)
+        for sides in (1, 2, 6, 20, 256, 257, 1000, 70000):
+            for face in pool.roll_faces(sides, 200):
+                self.assertIn(face, range(1, sides + 1))
+
+    def test_randint(self):
+        """Test that randint covers the whole inclusive range."""
+        pool = EntropyPool()
+        values = {pool.randint(-1, 1) for _ in range(300)}
+        self.assertEqual(values, {-1, 0, 1})
+
+    def test_faces_are_unbiased(self):
+        """Test that every face of a d6 comes up roughly equally often."""
+        faces = EntropyPool().roll_faces(6, 60000)
+        for face in range(1, 7):
+            self.assertAlmostEqual(faces.count(face) / 60000, 1 / 6, delta=0.01)
+
+    def test_buffer_refills_lazily(self):
+        """Test that the pool reads from the OS in blocks and refills when empty."""
+        pool = EntropyPool(block_size=32)
+        pool.roll_faces(6, 4)
+        self.assertEqual(len(pool._buffer), 32)
+        pool.roll_faces(6, 100)
+        self.assertGreaterEqual(pool._position, 100)
+
+    def test_buffer_discarded_after_fork(self):
+        """Test that a buffer inherited from another process is not reused."""
+        pool = EntropyPool(block_size=64)
+        pool.roll_faces(6, 1)
+        inherited = pool._buffer
+        pool._pid = -1
+        pool.roll_faces(6, 1)
+        self.assertIsNot(pool._buffer, inherited)
+
+    def test_invalid_block_size(self):
+        """Test that a tiny block size raises a ValueError."""
+        with self.assertRaises(ValueError):
+            EntropyPool(block_size=4)
+
+    def test_dice_with_entropy_pool(self):
+        """Test rolling Dice with the entropy pool backend."""
+        dice = Dice(num_dice=4, sides=6, drop_lowest=1, rng=EntropyPool())
+        dice.roll()
+        self.assertTrue(3 <= dice.value <= 18)
 
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,117 @@
+import unittest
+from itertools import product
+
+from PyDnD.DiceExpression import DiceExpression, InvalidDiceExpression
+from PyDnD.Dice import SeededRandomBackend
+from PyDnD.Roll import Roll
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+class TestDiceExpression(unittest.TestCase):
+
+    def test_parse_sum_of_pools(self):
+        """Test parsing a sum of pools and a constant modifier."""
+        expression = DiceExpression.parse("2d8+1d6+3")
+        self.assertEqual([(pool.num_dice, pool.sides) for pool in expression.pools], [(2, 8), (1, 6)])
+        self.assertEqual(expression.modifier, 3)
+
+    def test_parse_selectors(self):
+        """Test that keep/drop selectors become dice to drop."""
+        cases = {
+            "4d6kh3": (1, 0),
+            "4d6k3": (1, 0),
+            "4d6kl1": (0, 3),
+            "4d6dl1": (1, 0),
+            "4d6d1": (1, 0),
+            "4d6dh2": (0, 2),
+        }
+        for notation, (drop_lowest, drop_highest) in cases.items():
+            pool = DiceExpression.parse(notation).pools[0]
+            self.assertEqual((pool.drop_lowest, pool.drop_highest), (drop_lowest, drop_highest), notation)
+
+    def test_parse_is_cached(self):
+        """Test that parsing the same notation twice returns the same compiled expression."""
+        self.assertIs(DiceExpression.parse("3d6+2"), DiceExpression.parse("3d6+2"))
+
+    def test_parse_whitespace_and_case(self):
+        """Test that whitespace and upper case are accepted."""
+        expression = DiceExpression.parse(" D20 - 1D4 + 2 ")
+        self.assertEqual(expression.pools[0].num_dice, 1)
+        self.assertEqual(expression.pools[1].sign, -1)
+        self.assertEqual(str(expression), "1d20-1d4+2")
+
+    def test_roll_range(self):
+        """Test that rolled totals fall within the expression's range."""
+        expression = DiceExpression.parse("2d8+1d6+3")
+        rng = SeededRandomBackend(1)
+        for _ in range(200):
+            self.assertIn(expression.roll(rng=rng), range(6, 26))
+
+    def test_roll_keep_highest(self):
+        """Test that keep highest sums the highest rolls."""
+        total, rolls = DiceExpression.parse("4d6kh3").roll(rng=SeededRandomBackend(2), return_rolls=True)
+        self.assertEqual(len(rolls[0]), 4)
+        self.assertEqual(total, sum(sorted(rolls[0], reverse=True)[:3]))
+
+    def test_roll_keep_lowest(self):
+        """Test that keep lowest sums the lowest rolls."""
+        total, rolls = DiceExpression.parse("2d20kl1").roll(rng=SeededRandomBackend(3), return_rolls=True)
+        self.assertEqual(total, min(rolls[0]))
+
+    def test_roll_constant(self):
+        """Test that an expression with no dice returns its constant."""
+        self.assertEqual(DiceExpression.parse("7").roll(), 7)
+
+    def test_distribution(self):
+        """Test the exact distribution against brute force enumeration."""
+        distribution = DiceExpression.parse("3d4dh1-1d4+1").distribution()
+        counts = {}
+        for a, b, c, d in product(range(1, 5), repeat=4):
+            total = sum(sorted((a, b, c))[:2]) - d + 1
+            counts[total] = counts.get(total, 0) + 1
+        for value, count in counts.items():
+            self.assertAlmostEqual(distribution.probability(value), count / 256)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_many(self):
+        """Test evaluating an expression many times at once."""
+        totals = DiceExpression.parse("4d6kh3+1d4-2").roll_many(500, rng=SeededRandomBackend(4))
+        self.assertEqual(totals.shape, (500,))
+        self.assertTrue(((totals >= 2) & (totals <= 20)).all())
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_many_drops_dice(self):
+        """Test that batches drop the same dice as sorting each row would."""
+        for pool in DiceExpression.parse("5d6kh3-4d8dh1+6d10kl2").pools:
+            totals = pool.roll_many(300, rng=SeededRandomBackend(8))
+            rolls = SeededRandomBackend(8).roll_array(pool.sides, (300, pool.num_dice))
+            kept = np.sort(rolls, axis=1)[:, pool.drop_lowest:pool.num_dice - pool.drop_highest]
+            np.testing.assert_array_equal(totals, pool.sign * kept.sum(axis=1))
+
+    def test_invalid_expression_position(self):
+        """Test that the reported position is a column of the expression as given."""
+        for notation, column in (("2d6 + 1x", 7), ("  2D6 +  d", 6), ("x", 0), ("1d6 +", 4)):
+            with self.assertRaisesRegex(InvalidDiceExpression, f"at position {column}$", msg=notation):
+                DiceExpression.parse(notation)
+
+    def test_invalid_expressions(self):
+        """Test that invalid notation raises InvalidDiceExpression."""
+        for notation in ("", "2d", "d0", "0d6", "2d6+", "4d6kh5", "4d6dl4", "4d6x", "abc"):
+            with self.assertRaises(InvalidDiceExpression, msg=notation):
+                DiceExpression.parse(notation)
+
+    def test_invalid_expression_is_value_error(self):
+        """Test that parse errors can be caught as ValueError like other dice errors."""
+        with self.assertRaises(ValueError):
+            Roll.roll_expression("1d")
+
+    def test_roll_expression(self):
+        """Test rolling notation through Roll."""
+        total, rolls = Roll.roll_expression("2d6+1", return_rolls=True, rng=SeededRandomBackend(5))
+        self.assertEqual(total, sum(rolls[0]) + 1)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import unittest
+from itertools import product
+
+from PyDnD.Distribution import Distribution
+from PyDnD.Dice import Dice
+from PyDnD.Roll import Roll
+
+def brute_force(num_dice, sides, drop_lowest=0, modifier=0, drop_highest=0, weights=None):
+    """Counts every possible roll to build the expected outcome counts, weighting each face by `weights`."""
+    counts = {}
+    for faces in product(range(1, sides + 1), repeat=num_dice):
+        total = sum(sorted(faces)[drop_lowest:num_dice - drop_highest]) + modifier
+        ways = 1
+        for face in faces:
+            ways *= weights[face] if weights else 1
+        if ways:
+            counts[total] = counts.get(total, 0) + ways
+    return counts
+
+class TestDistribution(unittest.TestCase):
+
+    def assertMatchesBruteForce(self, distribution, counts):
+        total = sum(counts.values())
+        self.assertEqual(distribution.total, total)
+        self.assertEqual(distribution.minimum, min(counts))
+        self.assertEqual(distribution.maximum, max(counts))
+        for value, count in counts.items():
+            self.assertAlmostEqual(distribution.probability(value), count / total)
+
+    def test_single_die(self):
+        """Test the distribution of a single die is uniform."""
+        d20 = Distribution.for_dice(1, 20)
+        self.assertEqual(d20.minimum, 1)
+        self.assertEqual(d20.maximum, 20)
+        self.assertAlmostEqual(d20.probability(7), 1 / 20)
+        self.assertAlmostEqual(d20.mean, 10.5)
+
+    def test_plain_sum(self):
+        """Test a plain sum of dice against brute force enumeration."""
+        self.assertMatchesBruteForce(Distribution.for_dice(3, 6), brute_force(3, 6))
+
+    def test_drop_lowest(self):
+        """Test 4d6 drop lowest against brute force enumeration."""
+        stats = Distribution.for_dice(4, 6, drop_lowest=1)
+        self.assertMatchesBruteForce(stats, brute_force(4, 6, drop_lowest=1))
+        self.assertAlmostEqual(stats.at_least(18), 21 / 1296)
+
+    def test_keep_highest(self):
+        """Test keep_highest matches the equivalent drop_lowest."""
+        self.assertEqual(Distribution.for_dice(5, 8, keep_highest=2), Distribution.for_dice(5, 8, drop_lowest=3))
+        self.assertMatchesBruteForce(Distribution.for_dice(5, 4, keep_highest=2), brute_force(5, 4, drop_lowest=3))
+
+    def test_keep_lowest_and_drop_highest(self):
+        """Test keeping the lowest dice and dropping the highest against brute force."""
+        self.assertMatchesBruteForce(Distribution.for_dice(3, 20, keep_lowest=1), brute_force(3, 20, drop_highest=2))
+        self.assertMatchesBruteForce(Distribution.for_dice(5, 4, drop_lowest=1, drop_highest=2),
+                                     brute_force(5, 4, drop_lowest=1, drop_highest=2))
+
+    def test_modifier(self):
+        """Test that a modifier shifts the distribution."""
+        self.assertMatchesBruteForce(Distribution.for_dice(2, 6, modifier=-2), brute_force(2, 6, modifier=-2))
+
+    def test_mean_and_variance(self):
+        """Test the mean and variance of 2d6."""
+        two_d6 = Distribution.for_dice(2, 6)
+        self.assertAlmostEqual(two_d6.mean, 7.0)
+        self.assertAlmostEqual(two_d6.variance, 35 / 6)
+        self.assertAlmostEqual(two_d6.stddev ** 2, 35 / 6)
+
+    def test_cdf(self):
+        """Test cumulative probabilities, including outside the possible range."""
+        two_d6 = Distribution.for_dice(2, 6)
+        self.assertEqual(two_d6.cdf(1), 0.0)
+        self.assertAlmostEqual(two_d6.cdf(7), 21 / 36)
+        self.assertEqual(two_d6.cdf(12), 1.0)
+        self.assertAlmostEqual(two_d6.at_least(8), 15 / 36)
+        self.assertEqual(two_d6.at_least(2), 1.0)
+        self.assertEqual(two_d6.at_least(13), 0.0)
+
+    def test_percentile(self):
+        """Test percentile lookups."""
+        two_d6 = Distribution.for_dice(2, 6)
+        self.assertEqual(two_d6.percentile(0), 2)
+        self.assertEqual(two_d6.percentile(50), 7)
+        self.assertEqual(two_d6.percentile(100), 12)
+        with self.assertRaises(ValueError):
+            two_d6.percentile(101)
+
+    def test_addition(self):
+        """Test adding distributions and integers."""
+        combined = Distribution.for_dice(1, 8) + Distribution.for_dice(1, 6) + 3
+        expected = {}
+        for a in range(1, 9):
+            for b in range(1, 7):
+                expected[a + b + 3] = expected.get(a + b + 3, 0) + 1
+        self.assertMatchesBruteForce(combined, expected)
+
+    def test_probabilities_sum_to_one(self):
+        """Test that the probabilities of a large pool sum to one."""
+        pool = Distribution.for_dice(40, 10, drop_lowest=5)
+        self.assertAlmostEqual(sum(probability for _, probability in pool.items()), 1.0)
+
+    def test_invalid_arguments(self):
+        """Test that invalid dice raise a ValueError."""
+        with self.assertRaises(ValueError):
+            Distribution.for_dice(0, 6)
+        with self.assertRaises(ValueError):
+            Distribution.for_dice(2, 6, drop_lowest=2)
+        with self.assertRaises(ValueError):
+            Distribution.for_dice(4, 6, drop_lowest=1, keep_highest=3)
+        with self.assertRaises(ValueError):
+            Distribution([0, 0])
+
+    def test_reroll_ones(self):
+        """Test that rerolling ones once makes a one 1/36 likely and other faces 7/36."""
+        d6 = Distribution.for_dice(1, 6, reroll_below=1)
+        self.assertAlmostEqual(d6.probability(1), 1 / 36)
+        self.assertAlmostEqual(d6.probability(4), 7 / 36)
+        weights = {1: 1, 2: 7, 3: 7, 4: 7, 5: 7, 6: 7}
+        self.assertMatchesBruteForce(Distribution.for_dice(4, 6, drop_lowest=1, reroll_below=1),
+                                     brute_force(4, 6, drop_lowest=1, weights=weights))
+
+    def test_minimum_face(self):
+        """Test that faces below the minimum count as the minimum."""
+        weights = {1: 0, 2: 0, 3: 3, 4: 1, 5: 1, 6: 1}
+        self.assertMatchesBruteForce(Distribution.for_dice(3, 6, minimum_face=3), brute_force(3, 6, weights=weights))
+        # Rerolls happen before the minimum is applied
+        weights = {1: 0, 2: 0, 3: 2 + 2 + 8, 4: 8, 5: 8, 6: 8}
+        self.assertMatchesBruteForce(Distribution.for_dice(3, 6, drop_highest=1, reroll_below=2, minimum_face=3),
+                                     brute_force(3, 6, drop_highest=1, weights=weights))
+
+    def test_invalid_face_rules(self):
+        """Test that exploding dice and out of range rules raise a ValueError."""
+        with self.assertRaises(ValueError):
+            Distribution.for_dice(1, 6, explode=True)
+        with self.assertRaises(ValueError):
+            Distribution.for_dice(1, 6, reroll_below=6)
+        with self.assertRaises(ValueError):
+            Distribution.for_dice(1, 6, minimum_face=7)
+
+    def test_dice_and_roll_distribution(self):
+        """Test that Dice and Roll expose the same distribution."""
+        dice = Dice(num_dice=4, sides=6, modifier=1, drop_lowest=1)
+        self.assertEqual(dice.distribution(), Roll.distribution(num_dice=4, sides=6, modifier=1, drop_lowest=1))
+
+if __name__ == '__main__':
+    unittest.main()
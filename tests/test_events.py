@@ -0,0 +1,89 @@
+import unittest
+from PyDnD.Player import Player
+from PyDnD.Inventory import Inventory
+from PyDnD.Events import ChangeEvent, batch
+
+class TestEvents(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a player and a list collecting the events it sends."""
+        self.player = Player(name="Observed", strength=10, dexterity=10, constitution=10, wisdom=10, intelligence=10, charisma=10)
+        self.events = []
+
+    def test_setter_events(self):
+        """Test that each change made outside a batch is delivered at once, and unchanged values are not."""
+        self.player.subscribe(self.events.append)
+        self.player.hp = 8
+        self.player.name = "Observed"
+        self.assertEqual(len(self.events), 1)
+        self.assertIsInstance(self.events[0], ChangeEvent)
+        self.assertIs(self.events[0].source, self.player)
+        self.assertEqual(self.events[0].changes, {'hp': (1, 8)})
+
+    def test_batch_merges_changes(self):
+        """Test that changes inside a batch are merged into one event per object."""
+        self.player.subscribe(self.events.append)
+        self.player.inventory.subscribe(self.events.append)
+        with batch():
+            self.player.hp = 5
+            self.player.hp = 9
+            self.player.mp = 3
+            self.player.mp = 0
+            with batch():
+                self.player.add_item_to_inventory("Arrow", 5)
+            self.player.add_item_to_inventory("Bow")
+            self.assertEqual(self.events, [])
+        self.assertEqual([event.changes for event in self.events],
+                         [{'hp': (1, 9)}, {'items': ((), ("Arrow",) * 5 + ("Bow",))}])
+
+    def test_experience_crossing_levels_is_one_event(self):
+        """Test that giveExp sends one event to the player and one to its leveling system."""
+        self.player.subscribe(self.events.append)
+        self.player.leveling_system.subscribe(self.events.append)
+        self.player.giveExp(21500)
+        self.assertEqual(len(self.events), 2)
+        self.assertEqual(self.events[0].changes, {'level': (1, 7), 'experience': (0, 21500)})
+        self.assertEqual(self.events[1].changes, {'experience': (0, 21500), 'level': (1, 7),
+                                                  'nextLvlExperience': (1000, 6500)})
+
+    def test_unsubscribe(self):
+        """Test that unsubscribed callbacks are no longer called."""
+        self.player.subscribe(self.events.append)
+        self.player.unsubscribe(self.events.append)
+        self.player.hp = 4
+        self.player.giveExp(100)
+        self.assertEqual(self.events, [])
+        self.assertIsNone(self.player._observers)
+        with self.assertRaises(ValueError):
+            self.player.unsubscribe(self.events.append)
+
+    def test_other_players_are_not_notified(self):
+        """Test that subscribing to one player neither notifies nor slows down other players or forks."""
+        other = Player(strength=10)
+        self.player.subscribe(self.events.append)
+        other.hp = 3
+        fork = self.player.fork()
+        fork.hp = 4
+        self.assertEqual(self.events, [])
+        self.assertIsNone(fork._observers)
+
+    def test_rollback_reports_restored_fields(self):
+        """Test that a rollback sends the fields it restored."""
+        snapshot = self.player.snapshot()
+        self.player.hp = 6
+        self.player.subscribe(self.events.append)
+        self.player.rollback(snapshot)
+        self.assertEqual([event.changes for event in self.events], [{'hp': (6, 1)}])
+        self.assertIsNotNone(self.player._observers)
+
+    def test_inventory_events(self):
+        """Test that a standalone inventory reports additions and removals."""
+        inventory = Inventory()
+        inventory.subscribe(self.events.append)
+        inventory.add_item("Rope")
+        inventory.remove_item("Rope")
+        self.assertEqual([event.changes for event in self.events],
+                         [{'items': ((), ("Rope",))}, {'items': (("Rope",), ())}])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -71,5 +71,29 @@ class TestInventory(unittest.TestCase):
         with self.assertRaises(ValueError):
             self.inventory.remove_item("Healing Potion", quantity=-1)
 
+    def test_dirty_flag(self):
+        """Test that adding or removing items marks the inventory dirty, and failed changes do not."""
+        self.assertFalse(self.inventory.dirty)
+        with self.assertRaises(ItemNotInInventory):
+            self.inventory.remove_item("Healing Potion")
+        self.assertFalse(self.inventory.dirty)
+        self.inventory.add_item("Healing Potion")
+        self.assertTrue(self.inventory.dirty)
+        self.inventory.dirty = False
+        self.inventory.remove_item("Healing Potion")
+        self.assertTrue(self.inventory.dirty)
+
+    def test_copy_on_write(self):
+        """Test that a copy shares the item list until either inventory changes."""
+        self.inventory.add_item("Rope", quantity=2)
+        clone = self.inventory.copy()
+        self.assertIs(clone.items, self.inventory.items)
+        clone.add_item("Torch")
+        self.assertEqual(self.inventory.items, ["Rope", "Rope"])
+        self.assertEqual(clone.items, ["Rope", "Rope", "Torch"])
+        self.inventory.remove_item("Rope")
+        self.assertEqual(self.inventory.items, ["Rope"])
+        self.assertEqual(clone.items, ["Rope", "Rope", "Torch"])
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
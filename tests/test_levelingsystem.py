@@ -1,8 +1,20 @@
+import importlib
+import sys
+import threading
 import unittest
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
-from PyDnD.LevelingSystem import LevelingSystem
+from PyDnD.LevelingSystem import LevelingSystem, experience_for_level, level_for_experience, _TABLE_LEVELS, _calculate_threshold
 from PyDnD.Player import Player
+from PyDnD.CompactPlayer import CompactPlayer
+
+# The module itself; the package exports the LevelingSystem class under the same name
+leveling_module = importlib.import_module("PyDnD.LevelingSystem")
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class TestLevelingSystem(unittest.TestCase):
 
@@ -57,5 +69,147 @@ class TestLevelingSystem(unittest.TestCase):
         self.assertEqual(LevelingSystem.nCr(5, 5), 1.0, "nCr with r=n should be 1.0")
         self.assertEqual(LevelingSystem.nCr(5, 3), 10.0, "nCr should correctly calculate the combinations")
 
+    def test_threshold_table_matches_formula(self):
+        """Test that the threshold table holds exactly the values of the original formula."""
+        for level in list(range(0, 500)) + [_TABLE_LEVELS - 1, _TABLE_LEVELS, _TABLE_LEVELS + 1, 10 ** 6]:
+            expected = int(1000 * (level + LevelingSystem.nCr(level, 2))) - (level * 1000)
+            self.assertEqual(experience_for_level(level), expected, f"Threshold of level {level}")
+
+    def test_level_for_experience(self):
+        """Test that the level for any experience total is the one reached by stepping through levels."""
+        for xp in [-5, 0, 999, 1000, 2999, 3000, 6000, 10 ** 6, 10 ** 9, 10 ** 12 + 7]:
+            level = 1
+            while xp >= experience_for_level(level + 1):
+                level += 1
+            self.assertEqual(level_for_experience(xp), level, f"Level for {xp} XP")
+        # Past the end of the table the formula is searched directly
+        beyond = _calculate_threshold(_TABLE_LEVELS + 500)
+        self.assertEqual(level_for_experience(beyond), _TABLE_LEVELS + 500)
+        self.assertEqual(level_for_experience(beyond - 1), _TABLE_LEVELS + 499)
+
+    def test_threshold_table_grows_safely_from_threads(self):
+        """Test that threads growing the threshold table together leave it correct."""
+        interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            for _ in range(20):
+                with patch.object(leveling_module, "_thresholds", []):
+                    barrier = threading.Barrier(8)
+                    levels = []
+                    def grow():
+                        barrier.wait()
+                        levels.append(level_for_experience(45000))
+                    threads = [threading.Thread(target=grow) for _ in range(8)]
+                    for thread in threads:
+                        thread.start()
+                    for thread in threads:
+                        thread.join()
+                    table = leveling_module._thresholds
+                    self.assertEqual(table, [_calculate_threshold(level) for level in range(len(table))])
+                    self.assertEqual(levels, [10] * 8)
+        finally:
+            sys.setswitchinterval(interval)
+
+    @staticmethod
+    def _step_give(leveling_system, xp):
+        """The original giveExp, one level per iteration."""
+        leveling_system.player._experience += xp
+        while leveling_system.LeveledUp():
+            leveling_system.levelUp()
+        else:
+            leveling_system.getExpForNextLevel()
+
+    @staticmethod
+    def _step_remove(leveling_system, xp):
+        """The original removeExp, one level per iteration."""
+        leveling_system.player._experience -= xp
+        while leveling_system.LeveledDown():
+            if leveling_system.player.level == 1:
+                if xp > leveling_system.player._experience:
+                    leveling_system.player._experience = 0
+                break
+            else:
+                leveling_system.levelDown()
+        else:
+            leveling_system.getExpForNextLevel()
+
+    def test_give_and_remove_match_stepping(self):
+        """Test that giveExp and removeExp give the same results as stepping one level at a time."""
+        amounts = [0, 1, 499, 1000, 2500, 3000, 45000, 250000, 5000000]
+        for start_level in (1, 2, 3, 7, 20):
+            for first in amounts:
+                for second in amounts:
+                    for method, step in (("giveExp", self._step_give), ("removeExp", self._step_remove)):
+                        fast, slow = Player(level=start_level), Player(level=start_level)
+                        fast.leveling_system.giveExp(first)
+                        self._step_give(slow.leveling_system, first)
+                        getattr(fast.leveling_system, method)(second)
+                        step(slow.leveling_system, second)
+                        self.assertEqual((fast.level, fast.experience, fast.nextLvlExperience),
+                                         (slow.level, slow.experience, slow.nextLvlExperience),
+                                         f"level {start_level}, giveExp({first}), {method}({second})")
+
+    def test_experience_setter_jumps_to_level(self):
+        """Test that setting experience moves straight to the matching level, up or down."""
+        player = Player(name="Test Player", level=1)
+        player.experience = 10 ** 9
+        self.assertEqual(player.level, level_for_experience(10 ** 9))
+        self.assertEqual(player.nextLvlExperience, experience_for_level(player.level + 1) - 10 ** 9)
+        player.experience = 3000
+        self.assertEqual((player.level, player.nextLvlExperience), (3, 3000))
+        # This used to loop forever, since level 1 also has a threshold of 1000
+        player.experience = 500
+        self.assertEqual((player.level, player.nextLvlExperience), (1, 500))
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestBulkExperience(unittest.TestCase):
+
+    AWARDS = [0, 1, 999, 1000, 2500, 45000, 5000000, -300, 3 * 10 ** 12]
+
+    def _roster(self, player_class=Player):
+        """One player per award, starting at a spread of levels."""
+        return [player_class(name=f"Hero {index}", level=index % 6 + 1) for index in range(len(self.AWARDS))]
+
+    def test_award_experience_matches_giveExp(self):
+        """Test that the bulk award gives the same experience, levels and nextLvlExperience as giveExp."""
+        players = self._roster()
+        experience, levels, next_level = LevelingSystem.award_experience(
+            [player.experience for player in players], [player.level for player in players], self.AWARDS)
+        for player, award in zip(players, self.AWARDS):
+            player.giveExp(award)
+        self.assertEqual(experience.tolist(), [player.experience for player in players])
+        self.assertEqual(levels.tolist(), [player.level for player in players])
+        self.assertEqual(next_level.tolist(), [player.nextLvlExperience for player in players])
+
+    def test_award_experience_broadcasts_one_amount(self):
+        """Test that a single award is given to everyone, and empty input gives empty arrays."""
+        experience, levels, next_level = LevelingSystem.award_experience([0, 1000, 3000], [1, 2, 3], 3000)
+        self.assertEqual(experience.tolist(), [3000, 4000, 6000])
+        self.assertEqual(levels.tolist(), [3, 3, 4])
+        self.assertEqual(next_level.tolist(), [3000, 2000, 4000])
+        experience, levels, next_level = LevelingSystem.award_experience([], [], 100)
+        self.assertEqual((experience.size, levels.size, next_level.size), (0, 0, 0))
+
+    def test_award_players(self):
+        """Test that awarding players writes back the same state giveExp would, for both player classes."""
+        for player_class in (Player, CompactPlayer):
+            players, expected = self._roster(player_class), self._roster(player_class)
+            LevelingSystem.award_players(players, self.AWARDS)
+            for player, award in zip(expected, self.AWARDS):
+                player.giveExp(award)
+            self.assertEqual([(player.level, player.experience, player.nextLvlExperience) for player in players],
+                             [(player.level, player.experience, player.nextLvlExperience) for player in expected])
+
+    def test_award_players_invalidates_and_notifies(self):
+        """Test that derived stats are recalculated and subscribers still get their events."""
+        quiet, watched = Player(name="Quiet", level=1), Player(name="Watched", level=1)
+        bonus = quiet.proficiency_bonus
+        events = []
+        watched.subscribe(events.append)
+        LevelingSystem.award_players([quiet, watched], 5000000)
+        self.assertGreater(quiet.proficiency_bonus, bonus)
+        self.assertEqual(len(events), 1)
+        self.assertEqual(events[0].changes["level"], (1, watched.level))
+
 if __name__ == '__main__':
     unittest.main()
@@ -1,6 +1,12 @@
+import contextlib
+import io
+import os
+import tempfile
 import unittest
+from uuid import uuid4
 from PyDnD.Player import Player
-from PyDnD.Inventory import ItemNotInInventory, InventoryIsFull
+from PyDnD.Dice import SeededRandomBackend
+from PyDnD.Inventory import Inventory, ItemNotInInventory, InventoryIsFull
 
 class TestPlayer(unittest.TestCase):
 
@@ -80,6 +86,141 @@ class TestPlayer(unittest.TestCase):
             self.player.remove_item_from_inventory("Potion", quantity=2)  # Only 1 potion left, removing 2 should raise error
 
 
+    def test_given_uid(self):
+        """Test that a given uid is kept instead of generating one."""
+        uid = uuid4()
+        self.assertEqual(Player(uid=uid).uid, uid)
+
+    def test_generate_many(self):
+        """Test generating many players with shared defaults and rolled abilities."""
+        players = Player.generate_many(200, rng=SeededRandomBackend(1), alignment="ne", level=3, strength=12)
+        self.assertEqual(len(players), 200)
+        self.assertEqual(len({player.uid for player in players}), 200)
+        self.assertTrue(all(player.uid.version == 4 for player in players))
+        for player in players:
+            self.assertEqual((player.alignment, player.level, player.experience, player.strength), ("NE", 3, 3000, 12))
+            self.assertTrue(3 <= player.charisma <= 18)
+        self.assertEqual(Player.generate_many(0), [])
+        with self.assertRaises(ValueError):
+            Player.generate_many(-1)
+
+    def test_generate_many_with_none_abilities_and_uid(self):
+        """Test that abilities given as None are rolled, and that a shared uid is rejected."""
+        players = Player.generate_many(3, rng=SeededRandomBackend(2), strength=None, dexterity=14)
+        self.assertTrue(all(3 <= player.strength <= 18 and player.dexterity == 14 for player in players))
+        with self.assertRaises(ValueError):
+            Player.generate_many(3, uid=self.player.uid)
+
+    def test_generate_many_is_reproducible(self):
+        """Test that seeded generation rolls the same abilities."""
+        first = Player.generate_many(20, rng=SeededRandomBackend(7))
+        second = Player.generate_many(20, rng=SeededRandomBackend(7))
+        self.assertEqual([player.wisdom for player in first], [player.wisdom for player in second])
+
+    def test_dict_round_trip(self):
+        """Test that from_dict restores everything to_dict returns, including the uid."""
+        self.player.giveExp(1500)
+        self.player.add_item_to_inventory("Rope", quantity=2)
+        restored = Player.from_dict(self.player.to_dict())
+        self.assertEqual(restored.uid, self.player.uid)
+        self.assertEqual(restored.to_dict(), self.player.to_dict())
+
+    def test_trusted_dict_round_trip(self):
+        """Test that the trusted load path restores the same player, uid and inventory as to_dict returns."""
+        self.player.giveExp(1500)
+        self.player.add_item_to_inventory("Rope", quantity=2)
+        restored = Player.from_dict(self.player.to_dict(), trusted=True)
+        self.assertEqual(restored.uid, self.player.uid)
+        self.assertEqual(restored.to_dict(), self.player.to_dict())
+        restored.giveExp(5000)
+        self.player.giveExp(5000)
+        self.assertEqual(restored.to_dict(), self.player.to_dict())
+
+    def test_trusted_load_defaults(self):
+        """Test that fields missing from a trusted record get the same defaults as the constructor."""
+        player = Player.from_dict({'name': "Sparse", 'level': 3, 'alignment': "ng"}, trusted=True)
+        self.assertEqual((player.alignment, player.hp, player.skillpoints, player.experience), ("NG", 1, 0, 3000))
+        self.assertTrue(3 <= player.strength <= 18)
+        self.assertEqual(player.nextLvlExperience, Player(level=3).leveling_system.getThresholdForNextLevel() - 3000)
+        self.assertEqual(player.get_inventory_max_size(), 10)
+
+    def test_trusted_load_validation(self):
+        """Test that the trusted load path rejects the same values as the setters."""
+        record = self.player.to_dict()
+        for field, value, message in (('strength', -1, "Strength can not be negative"),
+                                      ('hp', "many", "HP must be an integer"),
+                                      ('age', 30, "Age must be a string"),
+                                      ('alignment', "XX", "Alignment must be a valid two-letter code")):
+            with self.assertRaisesRegex(ValueError, message):
+                Player.from_dict(dict(record, **{field: value}), trusted=True)
+        with self.assertRaises(InventoryIsFull):
+            Player.from_dict(dict(record, inventory=["Rock"] * 11), trusted=True)
+
+    def test_trusted_deserialize_restores_uid(self):
+        """Test that deserialize_from_json in trusted mode keeps the saved uid."""
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "player.json")
+            with contextlib.redirect_stdout(io.StringIO()):
+                self.player.serialize_to_json(filepath)
+                restored = Player.deserialize_from_json(filepath, trusted=True)
+        self.assertEqual(restored.to_dict(), self.player.to_dict())
+
+    def test_fork(self):
+        """Test that a fork is independent of the original, including its inventory and leveling."""
+        self.player.add_item_to_inventory("Rope")
+        fork = self.player.fork()
+        self.assertEqual(fork.to_dict(), self.player.to_dict())
+        self.assertIs(fork.leveling_system.player, fork)
+        fork.add_item_to_inventory("Torch")
+        fork.giveExp(5000)
+        fork.strength = 3
+        self.assertEqual(self.player.get_inventory(), ["Rope"])
+        self.assertEqual(self.player.level, 1)
+        self.assertNotEqual(self.player.strength, 3)
+        self.assertEqual(fork.get_inventory(), ["Rope", "Torch"])
+
+    def test_snapshot_rollback(self):
+        """Test that rollback restores fields, experience, inventory and cached derived stats."""
+        self.player.add_item_to_inventory("Rope", quantity=2)
+        expected = self.player.to_dict()
+        strength_modifier = self.player.strength_modifier
+        snapshot = self.player.snapshot()
+        self.player.strength = self.player.strength + 4
+        self.player.giveExp(5000)
+        self.player.remove_item_from_inventory("Rope")
+        self.player.name = "Changed"
+        self.player.rollback(snapshot)
+        self.assertEqual(self.player.to_dict(), expected)
+        self.assertEqual(self.player.strength_modifier, strength_modifier)
+        self.player.rollback(snapshot)
+        self.assertEqual(self.player.to_dict(), expected)
+        with self.assertRaises(ValueError):
+            Player().rollback(snapshot)
+
+    def test_rollback_keeps_dirty_tracking(self):
+        """Test that changes undone by a rollback after a save are still reported as dirty."""
+        snapshot = self.player.snapshot()
+        self.player.hp = self.player.hp + 5
+        self.player.mark_clean()
+        self.player.rollback(snapshot)
+        self.assertEqual(self.player.get_dirty_fields(), {'hp'})
+
+    def test_dirty_fields(self):
+        """Test that fields changed after mark_clean are reported, including leveling and inventory changes."""
+        self.assertIn('hp', self.player.get_dirty_fields())
+        self.player.mark_clean()
+        self.assertEqual(self.player.get_dirty_fields(), set())
+        self.player.hp = self.player.hp + 3
+        self.player.name = self.player.name
+        self.assertEqual(self.player.get_dirty_fields(), {'hp'})
+        self.player.giveExp(5000)
+        self.player.add_item_to_inventory("Rope")
+        self.assertEqual(self.player.get_dirty_fields(),
+                         {'hp', 'level', 'experience', 'nextLvlExperience', 'inventory'})
+        self.player.mark_clean()
+        self.player.inventory = Inventory(max_size=20)
+        self.assertEqual(self.player.get_dirty_fields(), {'inventory', 'inventory_size'})
+
     def test_alignment_validation(self):
         """Test alignment validation."""
         with self.assertRaises(ValueError):
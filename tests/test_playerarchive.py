@@ -0,0 +1,78 @@
+import os
+import tempfile
+import unittest
+from PyDnD.Player import Player
+from PyDnD.CompactPlayer import CompactPlayer
+from PyDnD.PlayerBinary import InvalidPlayerData, save_players_binary
+from PyDnD.PlayerArchive import PlayerArchive, PlayerProxy
+
+class TestPlayerArchive(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an archive file holding a small roster."""
+        self.players = [Player(name=f"Player {index}", alignment="CN", level=index + 1, strength=10 + index,
+                               dexterity=12, constitution=12, wisdom=12, intelligence=12, charisma=12)
+                        for index in range(5)]
+        self.players[1].add_item_to_inventory("Lantern", 2)
+        self.players[2].age = None
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.directory.name, "roster.players")
+        save_players_binary(self.players, self.filepath)
+        self.archive = PlayerArchive(self.filepath)
+
+    def tearDown(self):
+        self.archive.close()
+        self.directory.cleanup()
+
+    def test_lookup_by_uid(self):
+        """Test that players are found by UUID or string uid and unknown uids are reported."""
+        proxy = self.archive[self.players[3].uid]
+        self.assertIsInstance(proxy, PlayerProxy)
+        self.assertEqual(proxy.name, "Player 3")
+        self.assertEqual(self.archive[str(self.players[3].uid)].level, 4)
+        self.assertIn(self.players[0].uid, self.archive)
+        with self.assertRaises(KeyError):
+            self.archive[Player().uid]
+        self.assertIsNone(self.archive.get("not a uid"))
+        self.assertEqual(len(self.archive), 5)
+
+    def test_fields_are_decoded_lazily(self):
+        """Test that only the fields that are read are decoded, and each only once."""
+        proxy = self.archive[self.players[1].uid]
+        self.assertEqual(proxy._fields, {})
+        # Opening the archive and looking up a uid decode no strings
+        self.assertEqual(dict(self.archive._reader._strings), {-1: None})
+        self.assertEqual(proxy.strength, 11)
+        self.assertEqual(proxy.strength, 11)
+        self.assertEqual(proxy._fields, {"strength": 11})
+        self.assertEqual(proxy.get_inventory(), ["Lantern", "Lantern"])
+        self.assertIsNone(self.archive[self.players[2].uid].age)
+        self.assertEqual(proxy.get_modifier(proxy.strength), 0)
+
+    def test_proxy_matches_player(self):
+        """Test that every field of a proxy, and its full Player, match the saved player."""
+        for player, proxy in zip(self.players, self.archive):
+            expected = dict(player.to_dict(), uid=player.uid)
+            self.assertEqual(proxy.to_dict(), expected)
+            for field, value in expected.items():
+                self.assertEqual(getattr(proxy, field), value)
+            self.assertEqual(proxy.to_player().to_dict(), player.to_dict())
+        self.assertIsInstance(self.archive[self.players[0].uid].to_player(CompactPlayer), CompactPlayer)
+
+    def test_proxy_is_read_only(self):
+        """Test that proxy fields cannot be changed."""
+        proxy = self.archive[self.players[0].uid]
+        with self.assertRaises(AttributeError):
+            proxy.name = "Changed"
+
+    def test_invalid_file(self):
+        """Test that empty and foreign files are rejected."""
+        for contents in (b"", b"not a player archive"):
+            filepath = os.path.join(self.directory.name, "invalid.players")
+            with open(filepath, "wb") as invalid_file:
+                invalid_file.write(contents)
+            with self.assertRaises(InvalidPlayerData):
+                PlayerArchive(filepath)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,147 @@
+import asyncio
+import os
+import tempfile
+import threading
+import time
+import unittest
+from unittest import mock
+from PyDnD.Player import Player
+from PyDnD import PlayerAsync
+from PyDnD.PlayerAsync import AsyncPlayerIO
+
+class TestAsyncPlayerIO(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Set up a player, a temporary directory and the async IO object."""
+        self.player = Player(name="Async", alignment="TN", level=2, strength=12, dexterity=12, constitution=12,
+                             wisdom=12, intelligence=12, charisma=12)
+        self.player.add_item_to_inventory("Map")
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.directory.name, "player.json")
+        self.player_io = AsyncPlayerIO(max_workers=2)
+
+    def tearDown(self):
+        self.player_io.close()
+        self.directory.cleanup()
+
+    async def test_save_and_load(self):
+        """Test that a saved player loads back with its uid and inventory, and that nothing is printed."""
+        with mock.patch("builtins.print") as printed:
+            await self.player_io.save(self.player, self.filepath)
+            loaded = await self.player_io.load(self.filepath)
+        printed.assert_not_called()
+        self.assertEqual(loaded.to_dict(), self.player.to_dict())
+        self.assertEqual(loaded.uid, self.player.uid)
+
+    async def test_saves_of_one_uid_are_coalesced(self):
+        """Test that concurrent saves of the same player result in a single write of its latest state."""
+        writes = []
+        write_json = PlayerAsync._write_json
+        def counting_write(player_data, filepath):
+            writes.append(player_data['hp'])
+            write_json(player_data, filepath)
+
+        async def save(hp):
+            self.player.hp = hp
+            await self.player_io.save(self.player, self.filepath)
+
+        with mock.patch("PyDnD.PlayerAsync._write_json", counting_write):
+            await asyncio.gather(*(save(hp) for hp in range(1, 11)))
+        self.assertEqual(writes, [10])
+        self.assertEqual((await self.player_io.load(self.filepath)).hp, 10)
+
+    async def test_saves_during_a_write_are_written_once_more(self):
+        """Test that saves made while a write is running are combined into one more write."""
+        writes = []
+        started = threading.Event()
+        write_json = PlayerAsync._write_json
+        def slow_write(player_data, filepath):
+            started.set()
+            time.sleep(0.05)
+            writes.append(player_data['hp'])
+            write_json(player_data, filepath)
+
+        with mock.patch("PyDnD.PlayerAsync._write_json", slow_write):
+            first = asyncio.ensure_future(self.player_io.save(self.player, self.filepath))
+            await asyncio.get_running_loop().run_in_executor(None, started.wait)
+            saves = []
+            for hp in (5, 6, 7):
+                self.player.hp = hp
+                saves.append(asyncio.ensure_future(self.player_io.save(self.player, self.filepath)))
+            await asyncio.gather(first, *saves)
+        self.assertEqual(writes, [1, 7])
+
+    async def test_saves_to_different_files_are_all_written(self):
+        """Test that concurrent saves of one player to different files write every file."""
+        filepaths = [os.path.join(self.directory.name, f"{name}.json") for name in ("a", "b", "c")]
+        await asyncio.gather(*(self.player_io.save(self.player, filepath) for filepath in filepaths))
+        for filepath in filepaths:
+            self.assertEqual((await self.player_io.load(filepath)).uid, self.player.uid)
+
+    async def test_concurrent_writes_to_one_file(self):
+        """Test that different players saved to the same file at once leave one complete file and no temporary files."""
+        players = [Player(name=f"Writer {index}") for index in range(8)]
+        await asyncio.gather(*(self.player_io.save(player, self.filepath) for player in players))
+        self.assertIn((await self.player_io.load(self.filepath)).uid, [player.uid for player in players])
+        self.assertEqual(os.listdir(self.directory.name), ["player.json"])
+
+    @unittest.skipIf(os.name == "nt", "File modes are POSIX only")
+    async def test_saved_file_mode(self):
+        """Test that new files get the same mode as open() gives, and replaced files keep theirs."""
+        reference = os.path.join(self.directory.name, "reference.json")
+        open(reference, "w").close()
+        await self.player_io.save(self.player, self.filepath)
+        self.assertEqual(os.stat(self.filepath).st_mode & 0o777, os.stat(reference).st_mode & 0o777)
+        os.chmod(self.filepath, 0o640)
+        await self.player_io.save(self.player, self.filepath)
+        self.assertEqual(os.stat(self.filepath).st_mode & 0o777, 0o640)
+
+    async def test_failed_open_closes_temporary_file(self):
+        """Test that the temporary file is closed and removed when it cannot be opened for writing."""
+        descriptors = []
+        mkstemp = tempfile.mkstemp
+        def recording_mkstemp(*args, **kwargs):
+            descriptor, path = mkstemp(*args, **kwargs)
+            descriptors.append(descriptor)
+            return descriptor, path
+        with mock.patch("tempfile.mkstemp", recording_mkstemp), \
+                mock.patch("os.fdopen", side_effect=OSError("cannot open")):
+            with self.assertRaises(OSError):
+                await self.player_io.save(self.player, self.filepath)
+        self.assertEqual(os.listdir(self.directory.name), [])
+        with self.assertRaises(OSError):
+            os.fstat(descriptors[0])
+
+    async def test_failed_save_raises(self):
+        """Test that an error while writing is raised from save."""
+        with self.assertRaises(OSError):
+            await self.player_io.save(self.player, os.path.join(self.directory.name, "missing", "player.json"))
+
+    async def test_load_many_respects_limit(self):
+        """Test that load_many keeps the order of the files and never exceeds the concurrency limit."""
+        players = [Player(name=f"Player {index}") for index in range(8)]
+        filepaths = [os.path.join(self.directory.name, f"{index}.json") for index in range(8)]
+        await asyncio.gather(*(self.player_io.save(player, filepath) for player, filepath in zip(players, filepaths)))
+
+        active, peak, lock = [0], [0], threading.Lock()
+        read_json = PlayerAsync._read_json
+        def tracked_read(*args):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.01)
+            try:
+                return read_json(*args)
+            finally:
+                with lock:
+                    active[0] -= 1
+
+        player_io = AsyncPlayerIO(max_workers=8)
+        with mock.patch("PyDnD.PlayerAsync._read_json", tracked_read):
+            loaded = await player_io.load_many(filepaths, limit=3, trusted=True)
+        player_io.close()
+        self.assertEqual([player.uid for player in loaded], [player.uid for player in players])
+        self.assertLessEqual(peak[0], 3)
+
+if __name__ == '__main__':
+    unittest.main()
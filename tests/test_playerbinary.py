@@ -0,0 +1,93 @@
+import os
+import tempfile
+import unittest
+from PyDnD.Player import Player
+from PyDnD.CompactPlayer import CompactPlayer
+from PyDnD.PlayerBinary import (PlayerReader, InvalidPlayerData, encode_players, decode_players,
+                                save_players_binary, load_players_binary)
+
+class TestPlayerBinary(unittest.TestCase):
+
+    def setUp(self):
+        """Set up players with repeated strings, items and missing values."""
+        self.players = [Player(name=f"Player {index}", alignment="CG", description="Wears a red hat", level=index + 1,
+                               strength=8 + index, dexterity=12, constitution=12, wisdom=12, intelligence=12, charisma=12)
+                        for index in range(4)]
+        self.players[0].giveExp(320)
+        self.players[1].add_item_to_inventory("Potion", 3)
+        self.players[1].add_item_to_inventory("Rope")
+        self.players[2].add_item_to_inventory("Potion")
+        self.players[3].name = "Zoë"
+        self.players[3].wealth = None
+        self.players[3].alignment = None
+
+    def test_round_trip(self):
+        """Test that decoding returns everything serialize_to_json writes."""
+        decoded = decode_players(encode_players(self.players))
+        self.assertEqual([player.to_dict() for player in decoded], [player.to_dict() for player in self.players])
+
+    def test_strings_are_stored_once(self):
+        """Test that repeated strings are written to the string table once."""
+        encoded = encode_players(self.players)
+        self.assertEqual(encoded.count(b"Wears a red hat"), 1)
+        self.assertEqual(encoded.count(b"Potion"), 1)
+
+    def test_random_access_from_memoryview(self):
+        """Test decoding single records straight from a memoryview."""
+        reader = PlayerReader(memoryview(bytearray(encode_players(self.players))))
+        self.assertEqual(len(reader), 4)
+        self.assertEqual(reader[-1].name, "Zoë")
+        self.assertEqual(reader.read_dict(1)["inventory"], ["Potion", "Potion", "Potion", "Rope"])
+        self.assertIsInstance(reader.read(2, player_class=CompactPlayer), CompactPlayer)
+        with self.assertRaises(IndexError):
+            reader[4]
+
+    def test_file_round_trip(self):
+        """Test saving and loading players through a file."""
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "roster.players")
+            save_players_binary(self.players, filepath)
+            loaded = load_players_binary(filepath)
+        self.assertEqual([player.uid for player in loaded], [player.uid for player in self.players])
+
+    def test_strings_are_decoded_on_first_use(self):
+        """Test that opening a reader decodes no strings, and reading a field decodes only its own."""
+        reader = PlayerReader(encode_players(self.players))
+        self.assertEqual(dict(reader._strings), {-1: None})
+        self.assertEqual(reader.read_field(3, "name"), "Zoë")
+        self.assertEqual(list(reader._strings.values()), [None, "Zoë"])
+        self.assertEqual(reader.read_dict(1)["inventory"], ["Potion", "Potion", "Potion", "Rope"])
+
+    def test_find_uid(self):
+        """Test finding players by uid, with the uid index and in buffers written without one."""
+        encoded = encode_players(self.players)
+        legacy = bytearray(encoded[:-20 * len(self.players)])
+        legacy[6:8] = b"\0\0"
+        for buffer in (encoded, legacy):
+            reader = PlayerReader(buffer)
+            self.assertEqual([reader.find_uid(player.uid.bytes) for player in self.players], [0, 1, 2, 3])
+            self.assertIsNone(reader.find_uid(Player().uid.bytes))
+            self.assertEqual([player.uid for player in decode_players(buffer)], [player.uid for player in self.players])
+        self.assertIsNone(PlayerReader(encode_players([])).find_uid(self.players[0].uid.bytes))
+
+    def test_invalid_data(self):
+        """Test that other data and unsupported items are rejected."""
+        with self.assertRaises(InvalidPlayerData):
+            PlayerReader(b"not player data at all")
+        with self.assertRaises(InvalidPlayerData):
+            PlayerReader(b"PD")
+        # A truncated file, and a record referring to a string that does not exist
+        encoded = encode_players(self.players)
+        with self.assertRaises(InvalidPlayerData):
+            PlayerReader(encoded[:40])
+        corrupted = bytearray(encoded)
+        position = PlayerReader(encoded)._position(0)
+        corrupted[position + 16:position + 20] = (999).to_bytes(4, "little")
+        with self.assertRaises(InvalidPlayerData):
+            PlayerReader(corrupted).read_field(0, "name")
+        self.players[0].add_item_to_inventory(42)
+        with self.assertRaises(InvalidPlayerData):
+            encode_players(self.players)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+from PyDnD.Player import Player
+from PyDnD.CompactPlayer import CompactPlayer
+from PyDnD.PlayerIO import dump_players, iter_players
+
+class TestPlayerIO(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a small roster with experience and inventories."""
+        self.players = [Player(name=f"Player {index}", alignment="LG", level=index + 1, strength=10 + index,
+                               dexterity=12, constitution=12, wisdom=12, intelligence=12, charisma=12, inventory_size=20)
+                        for index in range(5)]
+        self.players[2].giveExp(450)
+        self.players[3].add_item_to_inventory("Potion", 12)
+        self.players[4].add_item_to_inventory("Épée")
+
+    def test_round_trip(self):
+        """Test that every field, the uid and the inventory survive a dump and load."""
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "roster.jsonl")
+            self.assertEqual(dump_players(self.players, filepath), 5)
+            loaded = list(iter_players(filepath))
+        self.assertEqual([player.to_dict() for player in loaded], [player.to_dict() for player in self.players])
+
+    def test_one_player_per_line(self):
+        """Test that the file holds one compact JSON object per line."""
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "roster.jsonl")
+            dump_players(iter(self.players), filepath)
+            with open(filepath, encoding="utf-8") as players_file:
+                lines = players_file.read().splitlines()
+        self.assertEqual(len(lines), 5)
+        self.assertTrue(lines[0].startswith('{"uid":'))
+
+    def test_reader_is_lazy(self):
+        """Test that players are read one at a time and blank lines are skipped."""
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "roster.jsonl")
+            dump_players(self.players[:2], filepath)
+            with open(filepath, "a", encoding="utf-8") as players_file:
+                players_file.write("\n")
+            players = iter_players(filepath, player_class=CompactPlayer)
+            first = next(players)
+            self.assertIsInstance(first, CompactPlayer)
+            self.assertEqual(first.uid, self.players[0].uid)
+            self.assertEqual(len(list(players)), 1)
+
+    def test_invalid_line(self):
+        """Test that a corrupt line raises a ValueError naming the line."""
+        with tempfile.TemporaryDirectory() as directory:
+            filepath = os.path.join(directory, "roster.jsonl")
+            dump_players(self.players[:1], filepath)
+            with open(filepath, "a", encoding="utf-8") as players_file:
+                players_file.write("{not json\n")
+            with self.assertRaisesRegex(ValueError, "line 2"):
+                list(iter_players(filepath))
+
+if __name__ == '__main__':
+    unittest.main()
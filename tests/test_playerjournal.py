@@ -0,0 +1,110 @@
+import json
+import os
+import tempfile
+import unittest
+from PyDnD.Player import Player
+from PyDnD.CompactPlayer import CompactPlayer
+from PyDnD.PlayerJournal import PlayerJournal
+
+class TestPlayerJournal(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a party and a journal in a temporary directory."""
+        self.party = [Player(name=f"Hero {index}", alignment="LG", level=2, strength=12, dexterity=12,
+                             constitution=12, wisdom=12, intelligence=12, charisma=12, hp=20)
+                      for index in range(3)]
+        self.directory = tempfile.TemporaryDirectory()
+        self.filepath = os.path.join(self.directory.name, "party.log")
+        self.journal = PlayerJournal(self.filepath)
+
+    def tearDown(self):
+        self.journal.close()
+        self.directory.cleanup()
+
+    def read_records(self):
+        with open(self.filepath, encoding="utf-8") as log_file:
+            return [json.loads(line) for line in log_file]
+
+    def test_only_changes_are_appended(self):
+        """Test that a first save writes snapshots and later saves write only the changed fields."""
+        snapshot_bytes = self.journal.save_many(self.party)
+        self.party[1].hp -= 4
+        change_bytes = self.journal.save_many(self.party)
+        self.assertLess(change_bytes * 10, snapshot_bytes)
+        self.assertEqual(self.read_records()[-1], {"uid": str(self.party[1].uid), "changes": {"hp": 16}})
+        self.assertEqual(self.journal.save_many(self.party), 0)
+
+    def test_replay_restores_players(self):
+        """Test that loading the log applies every change to the snapshots."""
+        self.journal.save_many(self.party)
+        self.party[0].giveExp(3000)
+        self.party[2].add_item_to_inventory("Torch")
+        self.journal.save_many(self.party)
+        self.party[2].remove_item_from_inventory("Torch")
+        self.journal.save(self.party[2])
+        self.journal.close()
+
+        with PlayerJournal(self.filepath) as journal:
+            loaded = journal.load()
+            self.assertEqual([player.to_dict() for player in loaded], [player.to_dict() for player in self.party])
+            self.assertEqual(loaded[0].get_dirty_fields(), set())
+            self.assertEqual(journal.save_many(loaded), 0)
+
+    def test_replay_restores_next_level_and_inventory_size(self):
+        """Test that changes to nextLvlExperience and the inventory's max_size are journaled."""
+        self.journal.save_many(self.party)
+        hero = self.party[0]
+        snapshot = hero.snapshot()
+        hero.leveling_system.nextLvlExperience = 1
+        self.journal.save(hero)
+        hero.rollback(snapshot)
+        hero.inventory.max_size = 25
+        self.assertEqual(hero.get_dirty_fields(), {'nextLvlExperience', 'inventory_size'})
+        self.journal.save(hero)
+        self.journal.close()
+
+        with PlayerJournal(self.filepath) as journal:
+            loaded = journal.load()
+        self.assertEqual(loaded[0].to_dict(), hero.to_dict())
+
+    def test_compaction(self):
+        """Test that enough change records are compacted into one snapshot per player."""
+        self.journal.close()
+        self.journal = PlayerJournal(self.filepath, compact_every=3)
+        self.journal.save_many(self.party)
+        for hp in (19, 18):
+            self.party[0].hp = hp
+            self.journal.save(self.party[0])
+        self.assertEqual(len(self.read_records()), 5)
+        self.party[1].mp = 3
+        self.journal.save(self.party[1])
+        records = self.read_records()
+        self.assertEqual(len(records), 3)
+        self.assertTrue(all("changes" not in record for record in records))
+        self.assertEqual((records[0]["hp"], records[1]["mp"]), (18, 3))
+
+        self.party[0].hp = 17
+        self.journal.save(self.party[0])
+        self.assertEqual(self.journal.replay()[str(self.party[0].uid)]["hp"], 17)
+
+    def test_untracked_players_are_snapshots(self):
+        """Test that players without dirty tracking are always saved whole."""
+        compact = CompactPlayer(name="Goblin")
+        self.journal.save(compact)
+        compact.hp = 3
+        self.journal.save(compact)
+        records = self.read_records()
+        self.assertEqual(len(records), 2)
+        self.assertEqual(records[1]["hp"], 3)
+        self.assertEqual(self.journal.load(CompactPlayer)[0].hp, 3)
+
+    def test_invalid_log(self):
+        """Test that a change record without a snapshot is rejected."""
+        self.journal.close()
+        with open(self.filepath, "w", encoding="utf-8") as log_file:
+            log_file.write('{"uid": "abc", "changes": {"hp": 3}}\n')
+        with self.assertRaisesRegex(ValueError, "line 1"):
+            PlayerJournal(self.filepath)
+
+if __name__ == '__main__':
+    unittest.main()
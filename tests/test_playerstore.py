@@ -0,0 +1,115 @@
+import os
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+from PyDnD.Player import Player
+from PyDnD.CompactPlayer import CompactPlayer
+from PyDnD.PlayerStore import PlayerStore
+
+class TestPlayerStore(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an in-memory store and a small roster."""
+        self.store = PlayerStore()
+        self.players = [Player(name=f"Player {index}", alignment="NG", level=index % 5 + 1, strength=12,
+                               dexterity=12, constitution=12, wisdom=12, intelligence=12, charisma=12)
+                        for index in range(10)]
+        self.players[3].add_item_to_inventory("Rope")
+
+    def tearDown(self):
+        self.store.close()
+
+    def test_round_trip(self):
+        """Test that a saved player is loaded back with every field, its uid and its inventory."""
+        self.assertEqual(self.store.save_many(self.players), 10)
+        loaded = self.store.get(self.players[3].uid)
+        self.assertEqual(loaded.to_dict(), self.players[3].to_dict())
+        self.assertIsNone(self.store.get("missing"))
+
+    def test_upsert(self):
+        """Test that saving a player again updates its row instead of adding one."""
+        self.store.save_many(self.players)
+        self.players[0].name = "Renamed"
+        self.players[0].level = 7
+        self.store.save(self.players[0])
+        self.assertEqual(len(self.store), 10)
+        self.assertEqual(self.store.get(self.players[0].uid).name, "Renamed")
+        self.assertEqual(self.store.count(min_level=7), 1)
+
+    def test_query(self):
+        """Test filtering by level and name, ordering and limits."""
+        self.store.save_many(self.players)
+        levels = [player.level for player in self.store.query(min_level=3, max_level=4)]
+        self.assertEqual(levels, [3, 3, 4, 4])
+        self.assertEqual([player.uid for player in self.store.query(name="Player 7")], [self.players[7].uid])
+        self.assertEqual(len(list(self.store.query(limit=3))), 3)
+        self.assertIsInstance(next(self.store.query(player_class=CompactPlayer)), CompactPlayer)
+
+    def test_query_is_lazy(self):
+        """Test that query returns a generator that decodes players as it is consumed."""
+        self.store.save_many(self.players)
+        results = self.store.query()
+        self.assertFalse(isinstance(results, list))
+        self.assertEqual(next(results).level, 1)
+        results.close()
+        self.assertEqual(len(self.store), 10)
+
+    def test_query_pages(self):
+        """Test that paging returns every match once, in order, including players without a name."""
+        players = [Player(name=name, level=level) for level in (1, 2, 3) for name in (None, "Ann", "Ann", "Bo")]
+        self.store.save_many(players)
+        expected = sorted(players, key=lambda player: (player.level, player.name or "", str(player.uid)))
+        with patch("PyDnD.PlayerStore.FETCH_SIZE", 2):
+            self.assertEqual([player.uid for player in self.store.query()], [player.uid for player in expected])
+            self.assertEqual(len(list(self.store.query(min_level=2, limit=5))), 5)
+            self.assertEqual(len(list(self.store.query(name="Ann"))), 6)
+
+    def test_store_usable_while_querying(self):
+        """Test that get and save work while a query iterator is open on the single in-memory connection."""
+        self.store.save_many(self.players)
+        extra = Player(name="Late Arrival", level=9)
+        loaded = []
+        def iterate():
+            with patch("PyDnD.PlayerStore.FETCH_SIZE", 3):
+                for player in self.store.query():
+                    loaded.append(self.store.get(player.uid).uid)
+                    self.store.save(extra)
+        thread = threading.Thread(target=iterate, daemon=True)
+        thread.start()
+        thread.join(timeout=10)
+        self.assertFalse(thread.is_alive(), "query() held the only connection")
+        self.assertEqual(loaded[:10], [player.uid for player in sorted(self.players, key=lambda player: (player.level, player.name, str(player.uid)))])
+        self.assertIn(extra.uid, self.store)
+
+    def test_delete_and_contains(self):
+        """Test membership checks and deleting players."""
+        self.store.save_many(self.players)
+        self.assertIn(self.players[1].uid, self.store)
+        self.assertTrue(self.store.delete(self.players[1].uid))
+        self.assertFalse(self.store.delete(self.players[1].uid))
+        self.assertNotIn(self.players[1].uid, self.store)
+
+    def test_threaded_file_store(self):
+        """Test that threads sharing a file store through the pool save every player."""
+        with tempfile.TemporaryDirectory() as directory:
+            with PlayerStore(os.path.join(directory, "players.db"), pool_size=3) as store:
+                batches = [[Player(name=f"Thread {thread}") for _ in range(50)] for thread in range(6)]
+                threads = [threading.Thread(target=store.save_many, args=(batch,)) for batch in batches]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+                self.assertEqual(len(store), 300)
+                self.assertLessEqual(store._opened, 3)
+            with PlayerStore(os.path.join(directory, "players.db")) as store:
+                self.assertEqual(len(list(store.query(name="Thread 2"))), 50)
+
+    def test_closed_store(self):
+        """Test that a closed store cannot be used."""
+        self.store.close()
+        with self.assertRaises(ValueError):
+            len(self.store)
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,116 @@
+import unittest
+from PyDnD.Player import Player
+from PyDnD.CompactPlayer import CompactPlayer
+from PyDnD.PlayerTable import PlayerTable
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+@unittest.skipIf(np is None, "NumPy is not installed")
+class TestPlayerTable(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a small roster and its table."""
+        self.players = [
+            Player(name="Aria", alignment="CG", level=3, strength=16, dexterity=11, constitution=12, wisdom=9, intelligence=14, charisma=7),
+            Player(name="Bram", alignment="LE", level=1, strength=8, dexterity=17, constitution=10, wisdom=13, intelligence=10, charisma=12),
+            Player(name="Cole", alignment="CG", level=5, strength=18, dexterity=9, constitution=15, wisdom=10, intelligence=8, charisma=14),
+        ]
+        self.players[1].giveExp(250)
+        self.table = PlayerTable.from_players(self.players)
+
+    def test_columns(self):
+        """Test that integer and string columns hold one value per player."""
+        self.assertEqual(len(self.table), 3)
+        np.testing.assert_array_equal(self.table["strength"], [16, 8, 18])
+        np.testing.assert_array_equal(self.table["experience"], [3000, 250, 10000])
+        self.assertEqual(list(self.table["name"]), ["Aria", "Bram", "Cole"])
+
+    def test_strings_are_interned(self):
+        """Test that repeated strings are stored once."""
+        codes, strings = self.table.codes("alignment")
+        self.assertEqual(strings, ["CG", "LE"])
+        np.testing.assert_array_equal(codes, [0, 1, 0])
+
+    def test_get_modifier(self):
+        """Test that modifiers match Player.get_modifier for every row."""
+        expected = [player.get_modifier(player.dexterity) for player in self.players]
+        np.testing.assert_array_equal(self.table.get_modifier("dexterity"), expected)
+        np.testing.assert_array_equal(self.table.get_modifier(np.array([1, 10, 11])), [-5, 0, 0])
+
+    def test_filter(self):
+        """Test filtering rows by mask and by column values."""
+        strong = self.table.filter(self.table["strength"] >= 16)
+        self.assertEqual(list(strong["name"]), ["Aria", "Cole"])
+        self.assertEqual(list(self.table.filter(alignment="cg", level=5)["name"]), ["Cole"])
+        self.assertEqual(len(self.table.filter(alignment="NE")), 0)
+        self.assertEqual(len(self.table.filter(self.table["level"] > 1, alignment="LE")), 0)
+
+    def test_filter_by_indices_and_values(self):
+        """Test that row indices combined with column values select the rows both allow."""
+        self.assertEqual(list(self.table.filter(np.array([2, 1]), alignment="CG")["name"]), ["Cole"])
+        self.assertEqual(list(self.table.filter(np.array([2, 0]))["name"]), ["Cole", "Aria"])
+
+    def test_from_players_with_none_fields(self):
+        """Test that players whose level or wealth is None are stored with the column defaults."""
+        player = Player(name="Unset")
+        player.level = None
+        player.wealth = None
+        table = PlayerTable.from_players([player])
+        self.assertEqual((table["level"].tolist(), table["wealth"].tolist()), ([1], [0]))
+
+    def test_round_trip(self):
+        """Test converting players to a table and back keeps their fields and uids."""
+        for player_class in (Player, CompactPlayer):
+            restored = self.table.to_players(player_class)
+            for original, copy in zip(self.players, restored):
+                self.assertIsInstance(copy, player_class)
+                self.assertEqual(copy.uid, original.uid)
+                for field in ("name", "alignment", "level", "experience", "strength", "hp"):
+                    self.assertEqual(getattr(copy, field), getattr(original, field), field)
+            self.assertEqual([player.nextLvlExperience for player in restored], [3000, 750, 5000])
+
+    def test_from_columns(self):
+        """Test building a table from whole columns, rolling missing abilities."""
+        table = PlayerTable.from_columns(1000, alignment="ng", level=np.arange(1, 1001) % 20 + 1, strength=10)
+        self.assertEqual(len(table), 1000)
+        self.assertEqual(len(set(table.uids.tolist())), 1000)
+        self.assertTrue((table["strength"] == 10).all())
+        self.assertTrue(((table["dexterity"] >= 3) & (table["dexterity"] <= 18)).all())
+        self.assertEqual(table.codes("alignment")[1], ["NG"])
+        player = table.filter(np.array([5])).to_players()[0]
+        self.assertEqual(player.level, 7)
+        self.assertEqual(player.experience, Player(level=7).experience)
+        self.assertEqual(table["experience"].tolist(), [Player(level=level).experience for level in table["level"].tolist()])
+
+    def test_from_columns_validation(self):
+        """Test that columns a Player would reject raise the same errors."""
+        with self.assertRaisesRegex(ValueError, "HP can not be negative or 0"):
+            PlayerTable.from_columns(3, hp=[1, 0, 2])
+        with self.assertRaisesRegex(ValueError, "Alignment must be a valid"):
+            PlayerTable.from_columns(2, alignment=["LG", "XX"])
+        with self.assertRaisesRegex(ValueError, "Strength must be an integer"):
+            PlayerTable.from_columns(2, strength=1.5)
+        with self.assertRaises(ValueError):
+            PlayerTable.from_columns(2, name=["Only one"])
+        with self.assertRaises(ValueError):
+            PlayerTable.from_columns(2, speed=30)
+
+    def test_award_experience(self):
+        """Test that awarding experience updates the level and experience columns as giveExp would."""
+        next_level = self.table.award_experience([2000, 800, 50000])
+        for player, award in zip(self.players, [2000, 800, 50000]):
+            player.giveExp(award)
+        self.assertEqual(self.table["level"].tolist(), [player.level for player in self.players])
+        self.assertEqual(self.table["experience"].tolist(), [player.experience for player in self.players])
+        self.assertEqual(next_level.tolist(), [player.nextLvlExperience for player in self.players])
+
+        # Only the selected rows change
+        before = self.table["experience"].copy()
+        self.table.award_experience(100, self.table.mask(alignment="CG"))
+        self.assertEqual((self.table["experience"] - before).tolist(), [100, 0, 100])
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,5 +1,12 @@
 import unittest
+from unittest import mock
 from PyDnD.Roll import Roll
+from PyDnD.Dice import SeededRandomBackend
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
 
 class TestRoll(unittest.TestCase):
 
@@ -50,6 +57,82 @@ class TestRoll(unittest.TestCase):
         """Test that dropping more dice than rolled raises a ValueError."""
         with self.assertRaises(ValueError):
             Roll.roll(num_dice=2, sides=6, drop_lowest=3)
+    def test_roll_with_advantage(self):
+        """Test rolling with advantage keeps the highest die."""
+        total, rolls = Roll.roll(num_dice=2, sides=20, keep_highest=1, return_rolls=True)
+        self.assertEqual(total, max(rolls))
+
+    def test_roll_with_drop_highest(self):
+        """Test rolling dice and dropping the highest roll."""
+        total, rolls = Roll.roll(num_dice=3, sides=6, drop_highest=1, return_rolls=True)
+        self.assertEqual(total, sum(rolls[1:]))
+
+    def test_stream(self):
+        """Test streaming a fixed number of rolls."""
+        results = list(Roll.stream(num_dice=3, sides=6, modifier=1, count=50))
+        self.assertEqual(len(results), 50)
+        for result in results:
+            self.assertIn(result, range(4, 20))
+
+    def test_stream_with_return_rolls(self):
+        """Test streaming rolls along with the individual dice."""
+        for total, rolls in Roll.stream(num_dice=4, sides=6, drop_lowest=1, count=10, return_rolls=True):
+            self.assertEqual(len(rolls), 4)
+            self.assertEqual(total, sum(rolls[:3]))
+
+    def test_stream_is_endless_without_count(self):
+        """Test that a stream without a count keeps generating rolls."""
+        stream = Roll.stream(num_dice=1, sides=20)
+        self.assertEqual(len([next(stream) for _ in range(1000)]), 1000)
+
+    def test_stream_with_seeded_backend(self):
+        """Test that a stream can be made reproducible with a seeded backend."""
+        first = list(Roll.stream(num_dice=2, sides=8, count=20, rng=SeededRandomBackend(9)))
+        second = list(Roll.stream(num_dice=2, sides=8, count=20, rng=SeededRandomBackend(9)))
+        self.assertEqual(first, second)
+
+    def test_roll_with_seeded_backend(self):
+        """Test that rolls with identically seeded backends match."""
+        first = Roll.roll(num_dice=6, sides=6, return_rolls=True, rng=SeededRandomBackend(11))
+        second = Roll.roll(num_dice=6, sides=6, return_rolls=True, rng=SeededRandomBackend(11))
+        self.assertEqual(first, second)
+
+    def test_roll_with_face_rules(self):
+        """Test that Roll passes exploding, reroll and minimum rules to the dice."""
+        total, rolls = Roll.roll(num_dice=5, sides=6, minimum_face=2, reroll_below=1, explode=True, return_rolls=True)
+        self.assertEqual(total, sum(rolls))
+        self.assertTrue(all(roll >= 2 and roll % 6 != 0 for roll in rolls))
+
+    def test_roll_abilities(self):
+        """Test that ability scores are rolled with 4d6 drop the lowest, with and without NumPy."""
+        scores = Roll.roll_abilities(600, rng=SeededRandomBackend(3))
+        self.assertEqual(len(scores), 600)
+        self.assertTrue(all(3 <= score <= 18 for score in scores))
+        with mock.patch("PyDnD.Roll.np", None):
+            scores = Roll.roll_abilities(600, rng=SeededRandomBackend(3))
+        self.assertEqual(len(scores), 600)
+        self.assertTrue(all(3 <= score <= 18 for score in scores))
+        self.assertAlmostEqual(sum(scores) / len(scores), 12.24, delta=0.4)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_batch(self):
+        """Test rolling a batch of stats with drop_lowest."""
+        totals = Roll.roll_batch(num_dice=4, sides=6, n=200, drop_lowest=1)
+        self.assertEqual(len(totals), 200)
+        self.assertTrue(((totals >= 3) & (totals <= 18)).all(), "Totals should be between 3 and 18")
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_batch_with_return_rolls(self):
+        """Test rolling a batch and returning the matrix of individual rolls."""
+        totals, rolls = Roll.roll_batch(num_dice=2, sides=20, n=50, modifier=3, return_rolls=True)
+        self.assertEqual(rolls.shape, (50, 2))
+        np.testing.assert_array_equal(totals, rolls.sum(axis=1) + 3)
+
+    @unittest.skipIf(np is None, "NumPy is not installed")
+    def test_roll_batch_invalid_drop_lowest(self):
+        """Test that dropping more dice than rolled raises a ValueError in batch mode."""
+        with self.assertRaises(ValueError):
+            Roll.roll_batch(num_dice=2, sides=6, n=10, drop_lowest=2)
 
 if __name__ == '__main__':
     unittest.main()
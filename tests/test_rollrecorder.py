@@ -0,0 +1,141 @@
+import os
+import tempfile
+import unittest
+
+from PyDnD.RollRecorder import RollRecorder, ReplayBackend, ReplayMismatch, EXPRESSION_TABLE_SIZE
+from PyDnD.Dice import Dice, EntropyPool, SeededRandomBackend, set_default_recorder
+from PyDnD.Roll import Roll
+
+class TestRollRecorder(unittest.TestCase):
+
+    def setUp(self):
+        """Set up an empty recorder and a seeded backend for each test."""
+        self.recorder = RollRecorder(capacity=8, max_faces=4)
+        self.rng = SeededRandomBackend(1)
+
+    def test_record_roll(self):
+        """Test that a roll is recorded with its expression, total and faces."""
+        total, rolls = Roll.roll(num_dice=4, sides=6, drop_lowest=1, return_rolls=True, rng=self.rng, recorder=self.recorder)
+        record = next(self.recorder.records())
+        self.assertEqual(len(self.recorder), 1)
+        self.assertEqual(record.total, total)
+        self.assertEqual(sorted(record.faces, reverse=True), rolls)
+        self.assertEqual(record.expression, {"num_dice": 4, "sides": 6, "modifier": 0, "drop_lowest": 1, "drop_highest": 0,
+                                             "explode": False, "reroll_below": 0, "minimum_face": 0})
+        self.assertFalse(record.truncated)
+
+    def test_ring_buffer_overwrites_oldest(self):
+        """Test that the oldest rolls are overwritten once capacity is reached."""
+        dice = Dice(num_dice=1, sides=20, modifier=0, rng=self.rng, recorder=self.recorder)
+        totals = []
+        for _ in range(11):
+            dice.roll()
+            totals.append(dice.value)
+        self.assertEqual(len(self.recorder), 8)
+        self.assertEqual([record.total for record in self.recorder.records()], totals[3:])
+
+    def test_truncated_faces(self):
+        """Test that rolls with more dice than max_faces keep their total."""
+        Roll.roll(num_dice=6, sides=6, rng=self.rng, recorder=self.recorder)
+        record = next(self.recorder.records())
+        self.assertTrue(record.truncated)
+        self.assertEqual(len(record.faces), 4)
+        with self.assertRaises(ReplayMismatch):
+            list(self.recorder.replay())
+
+    def test_replay(self):
+        """Test that replaying reproduces every recorded total."""
+        expected = [Roll.roll(num_dice=2, sides=8, modifier=3, rng=self.rng, recorder=self.recorder),
+                    Roll.roll(num_dice=4, sides=6, keep_highest=3, rng=self.rng, recorder=self.recorder),
+                    Roll.roll(num_dice=2, sides=20, keep_lowest=1, rng=self.rng, recorder=self.recorder)]
+        self.assertEqual([total for _, total in self.recorder.replay()], expected)
+
+    def test_replay_backend(self):
+        """Test that the replay backend reproduces a session when passed as rng."""
+        session = lambda rng, recorder=None: [Roll.roll(num_dice=3, sides=6, rng=rng, recorder=recorder) for _ in range(5)]
+        expected = session(self.rng, self.recorder)
+        self.assertEqual(session(self.recorder.replay_backend()), expected)
+
+    def test_replay_backend_mismatch(self):
+        """Test that replaying a different roll than was recorded raises ReplayMismatch."""
+        backend = ReplayBackend([[3, 4]])
+        with self.assertRaises(ReplayMismatch):
+            Roll.roll(num_dice=3, sides=6, rng=backend)
+        with self.assertRaises(ReplayMismatch):
+            Roll.roll(num_dice=1, sides=6, rng=backend)
+
+    def test_export_and_load(self):
+        """Test that exported rolls load back identically."""
+        for _ in range(10):
+            Roll.roll(num_dice=3, sides=6, modifier=1, rng=self.rng, recorder=self.recorder)
+        Roll.roll(num_dice=1, sides=100, rng=self.rng, recorder=self.recorder)
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "session.rolls")
+            self.recorder.export(path)
+            loaded = RollRecorder.load(path)
+        self.assertEqual(list(loaded.records()), list(self.recorder.records()))
+        self.assertEqual(len(list(loaded.replay())), 8)
+
+    def test_expression_table_is_bounded(self):
+        """Test that expressions no longer held by the ring are pruned, and clear empties the table."""
+        for modifier in range(3 * EXPRESSION_TABLE_SIZE):
+            Roll.roll(num_dice=1, sides=6, modifier=modifier, rng=self.rng, recorder=self.recorder)
+        self.assertLessEqual(len(self.recorder._expressions), EXPRESSION_TABLE_SIZE)
+        modifiers = [record.expression["modifier"] for record in self.recorder.records()]
+        self.assertEqual(modifiers, list(range(3 * EXPRESSION_TABLE_SIZE - 8, 3 * EXPRESSION_TABLE_SIZE)))
+        self.assertEqual([total for _, total in self.recorder.replay()], [record.total for record in self.recorder.records()])
+        self.recorder.clear()
+        self.assertEqual((len(self.recorder), self.recorder._expressions), (0, []))
+
+    def test_huge_faces(self):
+        """Test that faces and totals too large for the arrays are still recorded, exported and replayed."""
+        total = Roll.roll(num_dice=2, sides=2 ** 70, rng=EntropyPool(), recorder=self.recorder)
+        Roll.roll(num_dice=1, sides=6, rng=self.rng, recorder=self.recorder)
+        record = next(self.recorder.records())
+        self.assertEqual((record.total, sum(record.faces)), (total, total))
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "session.rolls")
+            self.recorder.export(path)
+            loaded = RollRecorder.load(path)
+        self.assertEqual(list(loaded.records()), list(self.recorder.records()))
+        self.assertEqual([replayed for _, replayed in loaded.replay()][0], total)
+
+    def test_expression_rolls_are_recorded(self):
+        """Test that each pool of an expression roll is recorded and replays the session."""
+        session = lambda rng, recorder=None: [Roll.roll_expression("2d8+1d6kh1-1d4+3", rng=rng, recorder=recorder)
+                                              for _ in range(2)]
+        expected = session(self.rng, self.recorder)
+        self.assertEqual(len(self.recorder), 6)
+        first = next(self.recorder.records())
+        self.assertEqual((first.expression["num_dice"], first.expression["sides"]), (2, 8))
+        self.assertEqual(session(self.recorder.replay_backend()), expected)
+        self.assertEqual(len(list(self.recorder.replay())), 6)
+
+    def test_load_invalid_file(self):
+        """Test that loading a file that is not a recording raises a ValueError."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "bad.rolls")
+            with open(path, "wb") as bad_file:
+                bad_file.write(b"\0" * 64)
+            with self.assertRaises(ValueError):
+                RollRecorder.load(path)
+
+    def test_default_recorder(self):
+        """Test that the default recorder captures rolls made without one."""
+        set_default_recorder(self.recorder)
+        try:
+            Roll.roll(num_dice=1, sides=6)
+        finally:
+            set_default_recorder(None)
+        Roll.roll(num_dice=1, sides=6)
+        self.assertEqual(len(self.recorder), 1)
+
+    def test_invalid_arguments(self):
+        """Test that invalid recorder sizes raise a ValueError."""
+        with self.assertRaises(ValueError):
+            RollRecorder(capacity=0)
+        with self.assertRaises(ValueError):
+            RollRecorder(max_faces=0)
+
+if __name__ == '__main__':
+    unittest.main()
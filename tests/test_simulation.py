@@ -0,0 +1,53 @@
+import unittest
+
+from PyDnD.Simulation import Simulation
+from PyDnD.Roll import Roll
+
+def advantage(rng):
+    """Module level scenario so it can be sent to worker processes."""
+    return Roll.roll(num_dice=2, sides=20, keep_highest=1, rng=rng)
+
+class TestSimulation(unittest.TestCase):
+
+    def test_expression_scenario(self):
+        """Test simulating dice notation in the current process."""
+        outcomes = Simulation("2d6", trials=20000, workers=1, seed=1).run()
+        self.assertEqual(outcomes.total, 20000)
+        self.assertEqual(outcomes.minimum, 2)
+        self.assertEqual(outcomes.maximum, 12)
+        self.assertAlmostEqual(outcomes.mean, 7.0, delta=0.1)
+
+    def test_callable_scenario(self):
+        """Test simulating a callable scenario."""
+        outcomes = Simulation(advantage, trials=5000, workers=1, seed=2).run()
+        self.assertEqual(outcomes.total, 5000)
+        self.assertGreaterEqual(outcomes.minimum, 1)
+        self.assertLessEqual(outcomes.maximum, 20)
+        self.assertAlmostEqual(outcomes.mean, 13.825, delta=0.4)
+
+    def test_seed_is_reproducible(self):
+        """Test that the same seed gives the same histogram however many chunks there are."""
+        first = Simulation("4d6kh3", trials=3000, workers=1, seed=3, chunk_size=1000).run()
+        second = Simulation("4d6kh3", trials=3000, workers=1, seed=3, chunk_size=1000).run()
+        self.assertEqual(first.counts, second.counts)
+
+    def test_multiprocess(self):
+        """Test splitting trials across worker processes."""
+        single = Simulation(advantage, trials=4000, workers=1, seed=4, chunk_size=1000).run()
+        multi = Simulation(advantage, trials=4000, workers=2, seed=4, chunk_size=1000).run()
+        self.assertEqual(multi.total, 4000)
+        self.assertEqual(single.counts, multi.counts)
+
+    def test_invalid_arguments(self):
+        """Test that invalid simulations raise errors."""
+        with self.assertRaises(ValueError):
+            Simulation("1d6", trials=0)
+        with self.assertRaises(ValueError):
+            Simulation("1d6", trials=10, workers=0)
+        with self.assertRaises(ValueError):
+            Simulation("1d6", trials=10, chunk_size=0)
+        with self.assertRaises(TypeError):
+            Simulation(42, trials=10)
+
+if __name__ == '__main__':
+    unittest.main()